@@ -0,0 +1,80 @@
+"""Benchmark of `Query.all()` hydration on a 100k-row sqlite3 table.
+
+Measures `Query.all()` of the source tree given by `--tree`
+(the repository by default). To compare with an older revision,
+check it out and run the same benchmark on it:
+    git worktree add /tmp/before <revision>
+    python benchmarks/query_all.py --tree /tmp/before
+    python benchmarks/query_all.py
+
+Run from the root of the repository:
+    python benchmarks/query_all.py [--tree PATH] [rows]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _models(orm):
+    class Bench(orm.Model):
+        __tablename__ = 'bench'
+
+        id = orm.Column(name='id', type=orm.PrimaryKeyColumnType(
+            type=orm.IntegerColumnType(), autoincrement=True))
+        email = orm.Column(name='email', type=orm.StringColumnType(), nullable=False)
+        age = orm.Column(name='age', type=orm.IntegerColumnType())
+        is_admin = orm.Column(name='is_admin', type=orm.BooleanColumnType())
+        create_at = orm.Column(name='create_at', type=orm.DatetimeColumnType())
+
+    return Bench
+
+
+def _fill(session, rows: int):
+    now = str(datetime.now())
+    session._cursor.executemany(
+        'INSERT INTO bench(email, age, is_admin, create_at) VALUES (?, ?, ?, ?);',
+        ((f'user{i}@str.com', i % 90, i % 2, now) for i in range(rows)),
+    )
+    session.commit()
+
+
+def _measure(name: str, func, rows: int, repeat: int = 3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        assert len(result) == rows
+        best = elapsed if best is None else min(best, elapsed)
+    print(f'{name:<24}{best:>10.3f} s{rows / best:>14,.0f} rows/s')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('rows', nargs='?', type=int, default=100_000)
+    parser.add_argument('--tree', default=_ROOT,
+                        help='The root of the measured source tree.')
+    args = parser.parse_args()
+    tree = os.path.abspath(args.tree)
+    sys.path[:0] = [tree, os.path.join(tree, 'src')]
+    from src import orm
+
+    Bench = _models(orm)
+    with tempfile.TemporaryDirectory() as directory:
+        url = orm.DbUrl(driver='sqlite3',
+                        database=os.path.join(directory, 'bench.sqlite3'))
+        engine = orm.Engine(url, on_create=lambda create: create([Bench]))
+        with orm.create_session(engine) as session:
+            _fill(session, args.rows)
+            print(f'Query.all() on {args.rows:,} rows of {tree}')
+            _measure('Query.all()', lambda: session.query(Bench).all(), args.rows)
+        engine.disconnect()
+
+
+if __name__ == '__main__':
+    main()
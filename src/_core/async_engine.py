@@ -0,0 +1,109 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import FunctionType
+from weakref import WeakKeyDictionary
+
+from .async_session import AsyncSession
+from .drivers.async_session_factory import AsyncSessionFactory
+from .drivers.psycopg2.connection import ping_async, reset_async
+from .drivers.psycopg2.constants import DRIVER_NAME as PSYCOPG2_DRIVER_NAME
+from .db_url import DbUrl
+from .engine import Engine, _on_create, _on_update
+from .pool import ConnectionPool
+
+
+class AsyncEngine:
+    """The asyncio Engine of python_orm package. 
+    Creates `AsyncSession`s, check out `create_async_session`.
+    Tables creation and migrations are run by the sync `engine` 
+    once on construction.
+
+    psycopg2 sessions use connections in the psycopg2 asynchronous mode,
+    sqlite3 sessions run sqlite3 calls in the thread executor.
+
+    Args:
+        db_url: The object of database url.
+        max_in_flight: The maximum number of stmps executed at once
+         by all sessions of the engine. Others wait for their turn. 10 by default.
+        Others: Check out `Engine`.
+
+    Attributes:
+        engine: The sync engine. Runs migrations.
+        adapter: The SQL adapter.
+        statement_cache: The cache of SQL stmps shared by all engine sessions.
+        result_cache: The cache of query results shared with `engine`.
+        pool: The pool of connections of async sessions.
+    """
+
+    def __init__(self, db_url: DbUrl, version: int = 0, on_create: FunctionType = _on_create,
+                 on_update: FunctionType = _on_update, bind_params: bool = True,
+                 statement_cache_size: int = 256, max_in_flight: int = 10,
+                 pool_size: int = 5, pool_min_size: int = 1, pool_max_overflow: int = 10,
+                 pool_timeout: float = 30.0, pool_max_waiters: int | None = None,
+                 pool_recycle: float | None = None, pool_pre_ping: bool = False,
+                 result_cache_size: int = 1024):
+        if max_in_flight < 1:
+            raise ValueError('max_in_flight should be positive.')
+        pool_options = dict(
+            pool_size=pool_size,
+            pool_min_size=pool_min_size,
+            pool_max_overflow=pool_max_overflow,
+            pool_timeout=pool_timeout,
+            pool_max_waiters=pool_max_waiters,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+        )
+        self.engine = Engine(db_url, version, on_create, on_update, bind_params,
+                             statement_cache_size, **pool_options,
+                             result_cache_size=result_cache_size)
+        self.adapter = self.engine.adapter
+        self.statement_cache = self.engine.statement_cache
+        self.result_cache = self.engine.result_cache
+        self.max_in_flight = max_in_flight
+        self._in_flight: WeakKeyDictionary = WeakKeyDictionary()
+        self._executor = None
+
+        if self.driver == PSYCOPG2_DRIVER_NAME:
+            self.engine.disconnect()
+            connect = self.engine.connect
+            self.pool = ConnectionPool(
+                lambda: connect.connect_async(db_url),
+                ping=ping_async, reset=reset_async,
+                **self.engine._pool_options)
+        else:
+            self.pool = self.engine.pool
+            # Executing stmps are bounded by `max_in_flight`, commits
+            # and rollbacks are bounded by the number of connections.
+            self._executor = ThreadPoolExecutor(
+                max_in_flight + pool_size + pool_max_overflow,
+                thread_name_prefix='python_orm')
+
+    async def disconnect(self):
+        """Disconnected from the database. Closes idle connections of the pool
+        and resources of the connector."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.pool.dispose)
+        self.engine.connect.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def _create_session(self) -> AsyncSession:
+        """Creates the async session of the engine."""
+        return AsyncSessionFactory.create(
+            self.driver, self.adapter, self.pool, self.statement_cache,
+            self._in_flight_semaphore(), self._executor, self.result_cache)
+
+    def _in_flight_semaphore(self) -> asyncio.Semaphore:
+        """The semaphore of `max_in_flight` of the running event loop.
+        asyncio primitives are bound to one loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._in_flight.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._in_flight[loop] = semaphore
+        return semaphore
+
+    @property
+    def driver(self) -> str:
+        """The driver name property"""
+        return self.engine.driver
@@ -0,0 +1,409 @@
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from itertools import count
+from logging import getLogger
+from typing import Any, AsyncIterator, Dict, Iterable, List, Sequence, Tuple
+
+from .dml.async_stmps import (AsyncBulkUpdate, AsyncDelete, AsyncInsert,
+                              AsyncQuery, AsyncUpdate)
+from .drivers.sql_adapter import SqlAdapter
+from .identity_map import IdentityMap
+from .pool import ConnectionPool
+from .result_cache import ResultCache
+from .statement_cache import StatementCache
+
+logger = getLogger(__name__)
+
+
+class AsyncSession(ABC):
+    """Asyncio session of the database. 
+    The same stmps as `Session` has, terminal methods are awaitable:
+    `await session.query(User).all()`, `await session.insert_items(users).commit()`.
+    The connection is checked out from the pool by `connect`.
+    No more than `in_flight` stmps of the engine are executed at once.
+
+    Args:
+        adapter: The SQL adapter for queries.
+        pool: The pool of connections.
+        statement_cache: The cache of SQL stmps by their shape.
+        in_flight: Bounds the number of executing stmps. 
+         Shared by all sessions of the engine.
+        result_cache: The cache of query results. Used by `AsyncQuery`.cache.
+
+    Attributes:
+        identity_map: Loaded rows of the session by the Primary Key.
+    """
+
+    def __init__(self, adapter: SqlAdapter, pool: ConnectionPool,
+                 statement_cache: StatementCache, in_flight: asyncio.Semaphore,
+                 result_cache: ResultCache | None = None):
+        self.adapter = adapter
+        self.statement_cache = statement_cache
+        self.result_cache = result_cache
+        self._changed_tables = set()
+        self.identity_map = IdentityMap()
+        self._pool = pool
+        self._in_flight = in_flight
+        self._connection = None
+        self._broken = False
+        self._transaction_depth = 0
+        self._savepoint_ids = count()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.disconnect()
+
+    async def connect(self):
+        """Checks out the connection from the pool."""
+        logger.info('connect')
+        loop = asyncio.get_running_loop()
+        self._connection = await loop.run_in_executor(None, self._pool.checkout)
+
+    async def disconnect(self):
+        """Checks in the connection to the pool.
+        The broken connection (of the cancelled stmp) is discarded."""
+        logger.info('disconnect')
+        if self._connection is not None:
+            loop = asyncio.get_running_loop()
+            connection, self._connection = self._connection, None
+            release = self._pool.discard if self._broken else self._pool.checkin
+            self._broken = False
+            await loop.run_in_executor(None, release, connection)
+
+    async def execute(self, sql: str, params: Sequence[Any] | None = None) -> int:
+        """Excute sql.
+
+        Args:
+            sql: The SQL which will be execute.
+            params: The bound parameters of the SQL.
+
+        Returns:
+            int: The number of affected rows. -1 if unknown.
+        """
+        async with self._in_flight:
+            return await self._execute(sql, params)
+
+    async def fetch_one(self, sql: str,
+                        params: Sequence[Any] | None = None) -> Tuple[Any] | None:
+        """Fetch one result of sql.
+
+        Args:
+            sql: The SQL which will be execute.
+            params: The bound parameters of the SQL.
+
+        Returns:
+            Tuple[Any] | None: Result of executing. None if result is empty.
+        """
+        async with self._in_flight:
+            return await self._fetch_one(sql, params)
+
+    async def fetch_all(self, sql: str,
+                        params: Sequence[Any] | None = None) -> List[Tuple[Any]]:
+        """Fetch all results of sql.
+
+        Args:
+            sql: The SQL which will be execute.
+            params: The bound parameters of the SQL.
+
+        Returns:
+            List[Tuple[Any]]: Results of executing.
+        """
+        async with self._in_flight:
+            return await self._fetch_all(sql, params)
+
+    async def fetch_many(self, sql: str, batch_size: int,
+                         params: Sequence[Any] | None = None) -> AsyncIterator[Tuple[Any]]:
+        """Fetch results of sql by batches. 
+        Keeps in memory no more than `batch_size` rows at once.
+
+        Args:
+            sql: The SQL which will be execute.
+            batch_size: The number of rows fetched from the database at once.
+            params: The bound parameters of the SQL.
+
+        Returns:
+            AsyncIterator[Tuple[Any]]: Results of executing.
+        """
+        batches = self._fetch_batches(sql, batch_size, params)
+        try:
+            while True:
+                async with self._in_flight:
+                    rows = await batches.__anext__()
+                for row in rows:
+                    yield row
+        except StopAsyncIteration:
+            return
+        finally:
+            await batches.aclose()
+
+    async def read_one(self, sql: str,
+                       params: Sequence[Any] | None = None) -> Tuple[Any] | None:
+        """Fetch one result of the query. Check out `fetch_one`.
+        Async sessions read from the primary database."""
+        return await self.fetch_one(sql, params)
+
+    async def read_all(self, sql: str,
+                       params: Sequence[Any] | None = None) -> List[Tuple[Any]]:
+        """Fetch all results of the query. Check out `fetch_all`.
+        Async sessions read from the primary database."""
+        return await self.fetch_all(sql, params)
+
+    def read_many(self, sql: str, batch_size: int,
+                  params: Sequence[Any] | None = None) -> AsyncIterator[Tuple[Any]]:
+        """Fetch results of the query by batches. Check out `fetch_many`.
+        Async sessions read from the primary database."""
+        return self.fetch_many(sql, batch_size, params)
+
+    async def data_version(self) -> Any:
+        """The data version of the database. Check out `Session`.data_version.
+        Async sessions read from the primary database."""
+        sql = self.adapter.data_version
+        if sql is None:
+            return None
+        version = (await self.fetch_one(sql))[0]
+        if self.result_cache is not None:
+            self.result_cache.check_version(self._connection, version)
+        return version
+
+    async def commit(self):
+        """Commit any changes like insertion, deletion, updating.
+        Does nothing inside `transaction`.
+        Is not bounded by `in_flight`: the finishing transaction 
+        can release locks which executing stmps wait for."""
+        if self._transaction_depth:
+            return
+        await self._commit()
+
+    async def rollback(self):
+        """Rolls back the current database transaction.
+        Clears `identity_map`."""
+        self.identity_map.clear()
+        await self._rollback()
+
+    @property
+    def in_transaction(self) -> bool:
+        """True inside `transaction` or `savepoint` block."""
+        return self._transaction_depth > 0
+
+    @asynccontextmanager
+    async def transaction(self):
+        """Runs the block in one database transaction.
+        Check out `Session`.transaction.
+
+        Example:
+            async with session.transaction():
+                await session.insert_item(user).commit()
+        """
+        if self._transaction_depth:
+            self._transaction_depth += 1
+            try:
+                yield self
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        async with self._in_flight:
+            await self._begin()
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            self.identity_map.clear()
+            try:
+                await self._rollback()
+            finally:
+                self._transaction_finished()
+            raise
+        self._transaction_depth -= 1
+        try:
+            await self._commit()
+        finally:
+            self._transaction_finished()
+
+    @asynccontextmanager
+    async def savepoint(self):
+        """Runs the block in the savepoint of the transaction.
+        Check out `Session`.savepoint."""
+        if not self._transaction_depth:
+            async with self.transaction():
+                async with self.savepoint():
+                    yield self
+            return
+
+        name = f'orm_savepoint_{next(self._savepoint_ids)}'
+        await self.execute(self.adapter.savepoint(name))
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            await self.execute(self.adapter.rollback_to_savepoint(name))
+            await self.execute(self.adapter.release_savepoint(name))
+            raise
+        self._transaction_depth -= 1
+        await self.execute(self.adapter.release_savepoint(name))
+
+    @asynccontextmanager
+    async def atomic(self):
+        """Runs the block in `transaction` or in `savepoint` if called
+        inside of it. Check out `Session`.atomic."""
+        block = self.savepoint() if self._transaction_depth else self.transaction()
+        async with block:
+            yield self
+
+    def tables_changed(self, *tablenames: str):
+        """Invalidates cached results of changed tables.
+        Check out `Session`.tables_changed."""
+        if self.result_cache is None:
+            return
+        self.result_cache.invalidate(tablenames)
+        if self._transaction_depth:
+            self._changed_tables.update(tablenames)
+
+    def _transaction_finished(self):
+        """Invalidates cached results of tables changed by the transaction."""
+        if self._changed_tables:
+            self.result_cache.invalidate(self._changed_tables)
+            self._changed_tables.clear()
+
+    def query(self, model) -> AsyncQuery:
+        """Database query. Check out `Session`.query.
+
+        Args:
+            model(Model): Table model.
+
+        Returns:
+            AsyncQuery: The query object. 
+        """
+        return AsyncQuery(model, self.adapter, self)
+
+    async def get(self, model, key: Any):
+        """Finds the row by the Primary Key value. Check out `Session`.get.
+
+        Args:
+            model(Model): Table model.
+            key: The Primary Key value.
+
+        Returns:
+            Model | None: The row. None if not exist.
+        """
+        row = self.identity_map.get(model, key)
+        if row is not None:
+            return row
+        primary_key = model.__schema__.primary_key
+        if primary_key is None:
+            raise ValueError(f'{model.__name__} has no Primary Key.')
+        return await self.query(model).where(primary_key, key).first()
+
+    def insert_item(self, item) -> AsyncInsert:
+        """Adds item to Model Table. Check out `Session`.insert_item.
+
+        Args:
+            item(Model) : Adding item.
+
+        Returns:
+            AsyncInsert: Insert object for finish transaction by commit.
+        """
+        return AsyncInsert(self.adapter, self).add_item(item)
+
+    def insert_items(self, items: Iterable) -> AsyncInsert:
+        """Adds items to Model Table. Check out `Session`.insert_items.
+
+        Args:
+            items(Iterable[Model]) : Adding items.
+
+        Returns:
+            AsyncInsert: Insert object for finish transaction by commit.
+        """
+        return AsyncInsert(self.adapter, self).add_items(items)
+
+    async def bulk_insert(self, items: Iterable,
+                          chunk_size: int | None = None) -> List[int] | None:
+        """Inserts many items by chunks. Check out `Session`.bulk_insert.
+
+        Args:
+            items(Iterable[Model]): Adding items.
+            chunk_size: The maximum number of items in one stmp.
+
+        Returns:
+            List[int] | None: Ids of adding items. None if column_id is not exist.
+        """
+        return await AsyncInsert(self.adapter, self, chunk_size).\
+            add_items(items).commit()
+
+    def delete(self, model) -> AsyncDelete:
+        """Delete stmt. Check out `Session`.delete.
+
+        Args:
+            model(Model): Table model.
+
+        Returns:
+            AsyncDelete: The delete object. 
+        """
+        return AsyncDelete(model, self.adapter, self)
+
+    def update(self, model, name_value: Dict[str, Any]) -> AsyncUpdate:
+        """Update stmt. Check out `Session`.update.
+
+        Args:
+            model(Model): Table model.
+            name_value: Name value mapping for SET in UPDATE stmt
+
+        Returns:
+            AsyncUpdate: The update object. 
+        """
+        return AsyncUpdate(model, self.adapter, self, name_value)
+
+    async def bulk_update(self, model, items: Iterable, key=None,
+                          chunk_size: int | None = None) -> int:
+        """Updates many rows with different values. 
+        Check out `Session`.bulk_update.
+
+        Args:
+            model(Model): Table model.
+            items: Models or dicts of column name and value.
+            key(Column): The column which identifies rows.
+            chunk_size: The maximum number of rows in one stmp.
+
+        Returns:
+            int: The number of updated rows.
+        """
+        return await AsyncBulkUpdate(
+            model, self.adapter, self, key, chunk_size).commit(items)
+
+    @abstractmethod
+    async def _execute(self, sql: str, params: Sequence[Any] | None) -> int:
+        pass
+
+    @abstractmethod
+    async def _fetch_one(self, sql: str,
+                         params: Sequence[Any] | None) -> Tuple[Any] | None:
+        pass
+
+    @abstractmethod
+    async def _fetch_all(self, sql: str,
+                         params: Sequence[Any] | None) -> List[Tuple[Any]]:
+        pass
+
+    @abstractmethod
+    def _fetch_batches(self, sql: str, batch_size: int,
+                       params: Sequence[Any] | None) -> AsyncIterator[List[Tuple[Any]]]:
+        """Async generator of result batches."""
+        pass
+
+    @abstractmethod
+    async def _begin(self):
+        pass
+
+    @abstractmethod
+    async def _commit(self):
+        pass
+
+    @abstractmethod
+    async def _rollback(self):
+        pass
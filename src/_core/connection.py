@@ -20,5 +20,7 @@ class Connectin(ABC):
 
     @abstractmethod
     def close(self):
-        """Close database connection."""
+        """Close database connection. 
+        Pooled connections are closed by the pool, 
+        the connector closes resources shared by them."""
         pass
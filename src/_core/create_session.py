@@ -1,6 +1,7 @@
 from .session import Session
 from .engine import Engine
-from .drivers.session_factory import SessionFactory
+from .async_session import AsyncSession
+from .async_engine import AsyncEngine
 
 
 def create_session(engine: Engine) -> Session:
@@ -12,4 +13,16 @@ def create_session(engine: Engine) -> Session:
     Returns:
         Session: The database session.
     """
-    return SessionFactory.create(engine.driver, engine.connection, engine.adapter)
+    return engine._create_session()
+
+
+def create_async_session(engine: AsyncEngine) -> AsyncSession:
+    """Create async session. Should be called in the running event loop.
+
+    Args:
+        engine: The async engine of python_orm.
+
+    Returns:
+        AsyncSession: The async database session.
+    """
+    return engine._create_session()
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, List
 from .column_types.column_type import ColumnType
 from ..drivers.sql_adapter import SqlAdapter
 
@@ -47,3 +47,32 @@ class Column:
             ValueError: The value is invalid.
         """
         return self.type.insert_value(value, adapter)
+
+    def bind_value(self, value: Any, adapter: SqlAdapter, params: List[Any]) -> str:
+        """Adapt any value to SQL as the bound parameter.
+        Check out `SqlAdapter`.bind.
+
+        Args:
+            value: The adapting value.
+            adapter: The SQL adapter.
+            params: The parameters of the statement.
+
+        Returns:
+            str: The placeholder or SQL literal.
+
+        Raises:
+            ValueError: The value is invalid.
+        """
+        return self.type.bind_value(value, adapter, params)
+
+    def copy_value(self, value: Any) -> str:
+        """Encodes the value to the text format of PostgreSQL `COPY`.
+        Check out `ColumnType`.copy_value.
+
+        Args:
+            value: The encoding value.
+
+        Returns:
+            str: The text of the value.
+        """
+        return self.type.copy_value(value)
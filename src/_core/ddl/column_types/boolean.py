@@ -28,5 +28,11 @@ class BooleanColumnType(ColumnType):
         if isinstance(value, bool):
             return value
         elif isinstance(value, int):
-            return True if value == 1 else 0
-        return value
\ No newline at end of file
+            return value == 1
+        return value
+
+    def copy_value(self, value: Any) -> str:
+        """Overriding of `ColumnType`.copy_value."""
+        if value is None:
+            return '\\N'
+        return 't' if value else 'f'
@@ -1,10 +1,18 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
+from types import FunctionType
 from typing import Any, List
 from ..errors import ValueError
 
 from ...drivers.sql_adapter import SqlAdapter
 
+_copy_escapes = str.maketrans({
+    '\\': '\\\\',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+})
+
 
 class ColumnType(ABC):
     """The abstract of ColumnType.
@@ -59,12 +67,76 @@ class ColumnType(ABC):
         """
         pass
 
-    def insert_value(self, value: Any, adapter: SqlAdapter) -> str:
+    def check_value(self, value: Any):
+        """Checks the value. 
+        Functions (for example `datetime_now`) are SQL and are not checked.
+
+        Args:
+            value: The checking value.
+
+        Raises:
+            ValueError: The value is invalid.
+        """
+        if isinstance(value, FunctionType):
+            return
         if value is not None and not self.validate_value(value):
             raise ValueError(
                 f'Value {value}{type(value)} for column({self}) is not valid.')
+
+    def insert_value(self, value: Any, adapter: SqlAdapter) -> str:
+        self.check_value(value)
         return adapter.any_value(value)
 
+    def bind_value(self, value: Any, adapter: SqlAdapter, params: List[Any]) -> str:
+        """Adapts value to SQL as the bound parameter.
+        Check out `SqlAdapter`.bind.
+
+        Args:
+            value: The adapting value.
+            adapter: The SQL adapter.
+            params: The parameters of the statement.
+
+        Returns:
+            str: The placeholder or SQL literal.
+
+        Raises:
+            ValueError: The value is invalid.
+        """
+        self.check_value(value)
+        return adapter.bind(value, params)
+
+    def cast_sql(self, adapter: SqlAdapter) -> str:
+        """Creates SQL of the type for casts. For example VARCHAR.
+        Without defaults and constraints.
+
+        Args:
+            adapter: The SQL adapter.
+
+        Returns:
+            str: The SQL of the type.
+        """
+        return self._sql(adapter)
+
+    def copy_value(self, value: Any) -> str:
+        """Encodes the value to the text format of PostgreSQL `COPY`.
+        None is `\\N`. Backslash, tab and line breaks are escaped.
+
+        Args:
+            value: The encoding value.
+
+        Returns:
+            str: The text of the value.
+
+        Raises:
+            ValueError: The value is a function. Functions are SQL.
+        """
+        if value is None:
+            return '\\N'
+        if isinstance(value, FunctionType):
+            raise ValueError(
+                f'Function {value.__name__} for column({self}) can not be copied.')
+        return str(value).translate(_copy_escapes)
+
     def sql(self, adapter: SqlAdapter) -> str:
         """Creates SQL of column.
 
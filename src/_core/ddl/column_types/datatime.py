@@ -17,3 +17,10 @@ class DatetimeColumnType(ColumnType):
 
     def _sql(self, adapter: SqlAdapter) -> str:
         return adapter.timestamp_column
+
+    def copy_value(self, value: Any) -> str:
+        """Overriding of `ColumnType`.copy_value.
+        Functions (`datetime_now`) are copied as the `now` input."""
+        if isinstance(value, FunctionType):
+            return 'now'
+        return super().copy_value(value)
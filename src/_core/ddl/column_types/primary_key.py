@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, List
 from .column_type import ColumnType
 from .integer import IntegerColumnType
 from ..errors import AutoincrementTypeError
@@ -45,12 +45,31 @@ class PrimaryKeyColumnType(ColumnType):
         """Overriding of `ColumnType`.validate_value."""
         return self.type.validate_value(value)
 
+    def check_value(self, value: Any):
+        """Overriding of `ColumnType`.check_value. 
+        Primary Key values are not checked."""
+        pass
+
     def insert_value(self, value: Any, adapter: SqlAdapter) -> str:
         """Overriding of `ColumnType`.insert_value."""
         if value is None and self._is_autoincrement:
             return adapter.autoincrement_default
         return adapter.any_value(value)
 
+    def bind_value(self, value: Any, adapter: SqlAdapter, params: List[Any]) -> str:
+        """Overriding of `ColumnType`.bind_value."""
+        if value is None and self._is_autoincrement:
+            return adapter.autoincrement_default
+        return adapter.bind(value, params)
+
+    def cast_sql(self, adapter: SqlAdapter) -> str:
+        """Overriding of `ColumnType`.cast_sql."""
+        return self.type.cast_sql(adapter)
+
+    def copy_value(self, value: Any) -> str:
+        """Overriding of `ColumnType`.copy_value."""
+        return self.type.copy_value(value)
+
     @property
     def _is_autoincrement(self) -> bool:
         """Util property. Detect if value is auto-incremented.
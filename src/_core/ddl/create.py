@@ -1,7 +1,4 @@
-from typing import List
-from .column import Column
-from .column_types.primary_key import PrimaryKeyColumnType
-from .foreign_key import ForeignKey
+from .model_schema import ModelSchema
 from ..drivers.sql_adapter import SqlAdapter
 
 
@@ -18,28 +15,32 @@ class CreateTable:
         self._session = session
 
     def create(self, model):
-        """Creates table by a table tamplate. 
+        """Creates table by a table tamplate and its indexes. 
         No need `Session`.commit() after.
 
         Args:
             model (Model): The table tamplate.
         """
-        columns: List[Column] = model.c()
-        fkeys: List[ForeignKey] = model.fkeys()
-        column_sqls = [column.sql(self._adapter) for column in columns]
+        schema: ModelSchema = model.__schema__
+        column_sqls = [column.sql(self._adapter) for column in schema.columns]
 
         query = self._adapter.create_table(
-            model.tn(),
+            schema.tablename,
             column_sqls,
             True,
-            [fkey.sql(self._adapter) for fkey in fkeys],
+            [fkey.sql(self._adapter) for fkey in schema.foreign_keys],
         )
         self._session.execute(query)
         self._session.commit()
         if self._adapter.create_unique:
-            
-            unique_columns = [column for column in columns if column.unique and column.type is not PrimaryKeyColumnType]
-            for column in unique_columns:
-                sql = self._adapter.create_unique_index(f'{model.tn()}_{column.name}_idx', model.tn(), column.name)
+            for column in schema.unique_columns:
+                sql = self._adapter.create_unique_index(
+                    f'{schema.tablename}_{column.name}_idx', schema.tablename, column.name)
                 self._session.execute(sql)
             self._session.commit()
+        if schema.indexes:
+            for index in schema.indexes:
+                self._session.execute(
+                    index.sql(self._adapter, schema.tablename, if_not_exist=True))
+            self._session.commit()
+        self._session.schema_changed()
@@ -4,3 +4,27 @@ class ValueError(Exception):
 
 class AutoincrementTypeError(Exception):
     pass
+
+
+class RelationshipError(Exception):
+    """Raise the error if the relationship can not be found 
+    by Foreign Keys or can not be loaded by the query."""
+    pass
+
+
+class UnloadedRelationshipError(AttributeError):
+    """Raise the error if the related rows were not loaded.
+    Check out `Query`.load."""
+    pass
+
+
+class UnloadedColumnError(AttributeError):
+    """Raise the error if the column value was not loaded from the database.
+    Check out `Query`.only and `Query`.defer."""
+    pass
+
+
+class MigrationError(Exception):
+    """Raise the error if the migration can not be executed in the current state
+    of the session. For example `CREATE INDEX CONCURRENTLY` inside a transaction."""
+    pass
@@ -23,6 +23,26 @@ class ForeignKey:
         self._ondelete = ondelete
         self._onupdate = onupdate
 
+    @property
+    def name(self) -> str:
+        """The name of the Foreign Key."""
+        return self._name
+
+    @property
+    def key_column(self) -> str:
+        """The name of Foreign Key column."""
+        return self._key_column
+
+    @property
+    def parent_key_columns(self) -> str:
+        """The name of parent table column."""
+        return self._parent_key_columns
+
+    @property
+    def parent_tablename(self) -> str:
+        """The name of parent table without quotes."""
+        return self._parent_table.strip('"')
+
     def sql(self, adapter: SqlAdapter) -> str:
         """Creates SQL for the Foreign Key.
 
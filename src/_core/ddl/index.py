@@ -0,0 +1,73 @@
+from typing import Sequence
+
+from .column import Column
+from ..drivers.sql_adapter import SqlAdapter
+
+
+class Index:
+    """Realization of the index. Plain, composite (many columns),
+    partial (`where`) and covering (`include`) indexes are supported.
+
+    Args:
+        name: The name of the index.
+        columns: The column (or the columns) of the index.
+         Names or `Column`s of the template.
+        unique: Creates the unique index if True.
+        where: SQL condition of the partial index. For example 'is_admin = 1'.
+        include: The columns stored in the index, but not a part of the key.
+         Queries selecting only them do not read the table.
+         PostgreSQL uses INCLUDE, SQLite adds them to the key
+         of not unique indexes.
+    """
+
+    def __init__(self, name: str, columns: str | Column | Sequence[str | Column],
+                 unique: bool = False, where: str | None = None,
+                 include: str | Column | Sequence[str | Column] | None = None):
+        self._name = name
+        self._columns = _names(columns)
+        self._unique = unique
+        self._where = where
+        self._include = _names(include) if include is not None else []
+
+    @property
+    def name(self) -> str:
+        """The name of the index."""
+        return self._name
+
+    @property
+    def columns(self) -> Sequence[str]:
+        """The names of the index columns."""
+        return self._columns
+
+    def sql(self, adapter: SqlAdapter, tablename: str, if_not_exist: bool = False,
+            concurrently: bool = False) -> str:
+        """Creates SQL for the index.
+
+        Args:
+            adapter: The SQL adapter.
+            tablename: The name of the table.
+            if_not_exist: Does nothing if the index exists.
+            concurrently: Builds the index without locking writes to the table.
+             If the database supports it.
+
+        Returns:
+            str: SQL of the index.
+        """
+        return adapter.create_index(
+            name=self._name,
+            table=tablename,
+            columns=self._columns,
+            unique=self._unique,
+            where=self._where,
+            include=self._include,
+            if_not_exist=if_not_exist,
+            concurrently=concurrently,
+        )
+
+
+def _names(columns: str | Column | Sequence[str | Column]) -> Sequence[str]:
+    """The names of columns."""
+    if isinstance(columns, (str, Column)):
+        columns = [columns]
+    return [column.name if isinstance(column, Column) else column
+            for column in columns]
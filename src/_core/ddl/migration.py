@@ -1,5 +1,7 @@
 from typing import List
 from .column import Column
+from .errors import MigrationError
+from .index import Index
 from ..drivers.sql_adapter import SqlAdapter
 from .model import Model
 from ..ddl.create import CreateTable
@@ -37,6 +39,7 @@ class Migration:
         sql = self._adapter.rename_table(old_name, new_name)
         self._session.execute(sql)
         self._session.commit()
+        self._session.schema_changed()
 
     def add_column(self, tablename: str, column: Column):
         """Addes column to table.
@@ -48,6 +51,7 @@ class Migration:
         sql = self._adapter.add_column(tablename, column.sql(self._adapter))
         self._session.execute(sql)
         self._session.commit()
+        self._session.schema_changed()
 
     def delete_column(self, tablename: str, column_name: str):
         """Deletes column from the table.
@@ -59,6 +63,7 @@ class Migration:
         sql = self._adapter.drop_column(tablename, column_name)
         self._session.execute(sql)
         self._session.commit()
+        self._session.schema_changed()
 
     def create_table(self, table: Model):
         """Creates table.
@@ -78,3 +83,65 @@ class Migration:
         sql = self._adapter.drop_table(tablename)
         self._session.execute(sql)
         self._session.commit()
+        self._session.schema_changed()
+
+    def create_index(self, tablename: str, index: Index, concurrently: bool = True):
+        """Creates the index. PostgreSQL builds it by `CREATE INDEX CONCURRENTLY`,
+        so writes to the table are not locked while the index is built.
+        The stmp is executed in autocommit mode, it can not run in a transaction.
+
+        Args:
+            tablename: The table name which will be an index created.
+            index: The index which will be created.
+            concurrently: Builds the index without locking writes if True
+             and the database supports it. True by default.
+
+        Raises:
+            MigrationError: If the index is built concurrently inside `transaction`.
+        """
+        concurrently = concurrently and self._adapter.concurrent_index
+        sql = index.sql(self._adapter, tablename, concurrently=concurrently)
+        self._execute_ddl(sql, concurrently)
+
+    def drop_index(self, name: str, concurrently: bool = True):
+        """Deletes the index if exist. Check out `create_index`.
+
+        Args:
+            name: The name of the index.
+            concurrently: Drops the index without locking the table if True
+             and the database supports it. True by default.
+
+        Raises:
+            MigrationError: If the index is dropped concurrently inside `transaction`.
+        """
+        concurrently = concurrently and self._adapter.concurrent_index
+        sql = self._adapter.drop_index(name, concurrently=concurrently)
+        self._execute_ddl(sql, concurrently)
+
+    def _execute_ddl(self, sql: str, autocommit: bool):
+        """Executes the ddl stmp and commits it.
+
+        Args:
+            sql: The ddl stmp.
+            autocommit: Executes the stmp in autocommit mode if True.
+             The current transaction is commited before.
+
+        Raises:
+            MigrationError: If autocommit is True inside `transaction`.
+        """
+        session = self._session
+        if not autocommit:
+            session.execute(sql)
+            session.commit()
+        else:
+            if session.in_transaction:
+                raise MigrationError(
+                    'The concurrent index stmp can not be executed inside a transaction.')
+            session.commit()
+            mode = session.autocommit
+            session.autocommit = True
+            try:
+                session.execute(sql)
+            finally:
+                session.autocommit = mode
+        session.schema_changed()
@@ -1,113 +1,74 @@
 from abc import ABC
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Sequence, Set, Tuple
 from .column import Column
 from .foreign_key import ForeignKey
-from .column_types.primary_key import PrimaryKeyColumnType
-from ..drivers.sql_adapter import SqlAdapter
-from .errors import ValueError
+from .model_schema import ModelSchema
+from .errors import ValueError, UnloadedColumnError
 
 
-class ModelColumnValue:
-    """The utils class which unites field_name, column, and value data.
+class _Unloaded:
+    """The marker of the column value that was not loaded from the database."""
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return '<unloaded>'
+
+
+UNLOADED = _Unloaded()
+
+
+class ColumnDescriptor:
+    """Class-level accessor of the model column.
+    Generated for every column of the `Model` child.
+    Returns the `Column` when accessed on the class (`User.email`)
+    and the row value when accessed on the instance (`user.email`).
+    The value lives in the `_values` slot of the instance by `index`.
 
     Args:
         field_name: The name of field.
         column: The column of field.
+        index: The position of the value in `Model._values`.
     """
+    __slots__ = ('field_name', 'column', 'index')
 
-    def __init__(self, field_name: str, column: Column):
+    def __init__(self, field_name: str, column: Column, index: int):
         self.field_name = field_name
         self.column = column
-        self._value: Any = None
-
-    def set_value(self, value: Any):
+        self.index = index
+
+    def __get__(self, instance, owner=None) -> Any:
+        if instance is None:
+            return self.column
+        value = instance._values[self.index]
+        if value is UNLOADED:
+            raise UnloadedColumnError(
+                f'Column {self.field_name} of {type(instance).__name__} is not loaded.')
+        return value
+
+    def __set__(self, instance, value: Any):
         """Validate value and set up.
 
         Args:
+            instance (Model): The row of the table.
             value: Settuping value.
 
         Raises:
             ValueError: If column is not nullable but value is None.
             If value is not valid. Check out `ColumnType`.validate_value.
         """
-
-        if not self.column.nullable and value is None:
+        column = self.column
+        if not column.nullable and value is None:
             raise ValueError('Value shuold be not None')
 
-        if value is not None and not self.column.type.validate_value(value):
+        if value is not None and not column.type.validate_value(value):
             raise ValueError(
-                f'Value {value}{type(value)} for column({self.column}) is not valid.')
-        self._value = self.column.type.fix_value(value)
-
-    @property
-    def value(self) -> Any:
-        return self._value
-
-    def insert_value(self, adapter: SqlAdapter) -> str:
-        """SQL adapted value.
-
-        Args:
-            adapter: SQL adapter.
-
-        Return:
-            str: SQL adapted value.
-        """
-        return self.column.insert_value(self.value, adapter)
-
-    @property
-    def column_name(self) -> str:
-        return self.column.name
-
-
-class ModelColumnValues:
-    """The utils class which unites ModelColumnValue's. 
-    And methods that work with the data(columns and their values).
-
-    Args:
-        columns: The ModelColumnValue's.
-    """
-
-    def __init__(self):
-        self.columns: List[ModelColumnValue] = []
-
-    def init(self, atrs: List[Tuple[str, Any]]):
-        """Init columns.
-
-        Args:
-            atrs (List[Tuple[str, Any]]): _description_
-        """
-        for atr in atrs:
-            if isinstance(atr[1], Column):
-                self.columns.append(ModelColumnValue(atr[0], atr[1]))
-
-    def contains_by_field_name(self, field_name: str):
-        return [v.field_name for v in self.columns].__contains__(field_name)
-
-    def set_values(self, kwargs: Dict[str, Any]):
-        for name, value in kwargs.items():
-            self.set_value_by_field_name(name, value)
-
-    def set_value_by_field_name(self, field_name: str, value: Any):
-        column = self.find_column_by_field_name(field_name)
-        column.set_value(value)
-
-    def get_column_by_field_name(self, field_name: str) -> ModelColumnValue:
-        column = self.find_column_by_field_name(field_name)
-        return column
-
-    def find_column_by_field_name(self, field_name: str) -> ModelColumnValue | None:
-        index = [v.field_name for v in self.columns].index(field_name)
-        if index == -1:
-            return None
-        return self.columns[index]
-
-    @property
-    def dict(self) -> Dict[str, Any]:
-        dict: Dict[str, Any] = {}
-        for column in self.columns:
-            dict[column.field_name] = column.value
-
-        return dict
+                f'Value {value}{type(value)} for column({column}) is not valid.')
+        instance._values[self.index] = column.type.fix_value(value)
+        dirty = instance._dirty
+        if dirty is None:
+            instance._dirty = {self.index}
+        else:
+            dirty.add(self.index)
 
 
 class Model(ABC):
@@ -118,52 +79,129 @@ class Model(ABC):
         If you need to set up a Foreign Key should add `__foreignkey__` to your template.
         Or any other attribute with a `ForeignKey` type. 
         `__foreignkey__` is the recommended name of atribute.
+    Indexes:
+        Add any attribute with an `Index` type (or a list of them) to your template.
+        `__indexes__` is the recommended name of atribute.
+
+    The template is inspected once per class: `__schema__` describes
+    the table and every `Column` is replaced by a `ColumnDescriptor`,
+    so creating rows, reading and writing of the row values
+    does not depend on the number of class attributes.
+
+    Related rows of `Relationship`s loaded by `Query`.load are kept in `_related`.
+
+    Every assignment is recorded in `_dirty` (the positions of changed values).
+    `_persistent` is True if the row exists in the database:
+    the row was loaded, inserted or flushed. Check out `Session`.flush.
 
     Args:
 
         kwargs: The values of row.
-        column_values: Info about columns and values.
     """
+    __slots__ = ('_values', '_dirty', '_persistent', '_related', '__weakref__')
+
+    __schema__: ModelSchema = ModelSchema.build(None, {}, [])
+    _descriptors: Tuple[ColumnDescriptor, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Builds `__schema__` and generates `ColumnDescriptor`s
+        for the columns of the template."""
+        super().__init_subclass__(**kwargs)
+        columns: Dict[str, Column] = {}
+        members: Dict[str, Any] = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in klass.__dict__.items():
+                if isinstance(value, ColumnDescriptor):
+                    columns[name] = value.column
+                elif isinstance(value, Column):
+                    columns[name] = value
+                else:
+                    members[name] = value
+
+        cls.__schema__ = ModelSchema.build(
+            getattr(cls, '__tablename__', None),
+            columns,
+            list(members.items()),
+        )
+        descriptors = []
+        for index, (name, column) in enumerate(columns.items()):
+            descriptor = ColumnDescriptor(name, column, index)
+            setattr(cls, name, descriptor)
+            descriptors.append(descriptor)
+        cls._descriptors = tuple(descriptors)
 
     def __init__(self, **kwargs):
-        self.column_values = ModelColumnValues()
-        self._id: Column | None = None
-        self._set_up_column_values(kwargs)
-        self._find_id()
-
-    def __getattribute__(self, __name: str) -> Any:
-        """Overrides method for getting control of attributes.
-        For row of the table implementation purposes only.
-        If the attribute contains in the `column_values` 
-        then the method returns the value from `column_values`.
-        For other attributes default behavior.
-        """
-        if (__name != 'column_values'
-                and self.column_values.contains_by_field_name(__name)):
-            return self.column_values.get_column_by_field_name(__name).value
-
-        return super().__getattribute__(__name)
-
-    def __setattr__(self, __name: str, __value: Any):
-        """Overrides method for set controll atrribute.
-        For row of the table implementation purposes only.
-        If the attribute contains in the `column_values` 
-        then the method set the value to `column_values`.
-        For other attributes default behavior.
-        """
-        if (__name != 'column_values'
-                and self.column_values.contains_by_field_name(__name)):
-            return self.column_values.set_value_by_field_name(__name, __value)
+        descriptors = self._descriptors
+        field_index = self.__schema__.field_index
+        self._values: List[Any] = [None] * len(descriptors)
+        self._dirty: Set[int] | None = None
+        self._persistent = False
+        self._related: Dict[str, Any] | None = None
+        for name, value in kwargs.items():
+            index = field_index.get(name)
+            if index is None:
+                raise TypeError(
+                    f'{type(self).__name__} has no column {name}')
+            descriptors[index].__set__(self, value)
+
+    @classmethod
+    def _from_row(cls, row: Sequence[Any],
+                  positions: Sequence[int] | None = None):
+        """Creates the row of the table from the database response.
+        Trusted path: values are not validated, only decoded
+        by `__schema__.decoders`. For example int to bool for sqlite3.
 
-        return super().__setattr__(__name, __value)
+        Args:
+            row: The values in the order of `__schema__.columns`.
+            positions: The column positions of `row` values. 
+             For partially loaded rows. Not loaded columns are `UNLOADED`.
+
+        Returns:
+            Model: The row of the table.
+        """
+        model = cls.__new__(cls)
+        if positions is None:
+            values = list(row)
+        else:
+            values = [UNLOADED] * len(cls.__schema__.columns)
+            for index, value in zip(positions, row):
+                values[index] = value
+        for index, decode in cls.__schema__.decoders:
+            value = values[index]
+            if value is not None and value is not UNLOADED:
+                values[index] = decode(value)
+        model._values = values
+        model._dirty = None
+        model._persistent = True
+        model._related = None
+        return model
 
     @property
     def dict(self) -> Dict[str, Any]:
-        return self.column_values.dict
+        return {name: value for name, value
+                in zip(self.__schema__.field_names, self._values)
+                if value is not UNLOADED}
+
+    def _changes(self) -> Dict[str, Any]:
+        """The changed values since the row was loaded or flushed.
+
+        Returns:
+            Dict[str, Any]: Column name to value mapping.
+        """
+        if not self._dirty:
+            return {}
+        columns = self.__schema__.columns
+        return {columns[index].name: self._values[index]
+                for index in sorted(self._dirty)}
+
+    def _flushed(self):
+        """Marks the row as saved in the database."""
+        self._dirty = None
+        self._persistent = True
 
     @property
     def table_id(self) -> Column | None:
-        return self._id
+        return self.__schema__.primary_key
 
     @classmethod
     def c(cls) -> List[Column]:
@@ -172,27 +210,17 @@ class Model(ABC):
         Returns:
             List[Column]: Columns of the table.
         """
-        members = cls.__dict__
-        return [value for _, value in members.items() if isinstance(value, Column)]
+        return list(cls.__schema__.columns)
 
     @classmethod
     def fkeys(cls) -> List[ForeignKey]:
         """Finds the Foreign Key of the table.
 
         Returns:
-            ForeignKey | None: The Foreign Key of the tabel.
-             None if Foreign Key does not exist in the template of the table.
+            List[ForeignKey]: The Foreign Keys of the tabel.
+             Empty if Foreign Key does not exist in the template of the table.
         """
-        members = cls.__dict__
-        f_keys = []
-        for _, value in members.items():
-            if isinstance(value, ForeignKey):
-                f_keys.append(value)
-            elif isinstance(value, List):
-                for item in value:
-                    if isinstance(item, ForeignKey):
-                        f_keys.append(value)
-        return f_keys
+        return list(cls.__schema__.foreign_keys)
 
     @classmethod
     def tn(cls) -> str:
@@ -201,25 +229,4 @@ class Model(ABC):
         Returns:
             str: The table name.
         """
-        members = cls.__dict__
-        for name, value in members.items():
-            if name == '__tablename__':
-                return value
-        return None
-
-    def _set_up_column_values(self, kwargs: Dict[str, Any]):
-        """Sets up the `column_values.`
-
-        Args:
-            kwargs: The arguments of the table row.
-        """
-        atrs = [(atr, getattr(self, atr)) for atr in self.__dir__()]
-        self.column_values.init(atrs)
-        self.column_values.set_values(kwargs)
-
-    def _find_id(self):
-        """Find the id through columns."""
-        for c in self.column_values.columns:
-            if isinstance(c.column.type, PrimaryKeyColumnType):
-                self._id = c.column
-                return
+        return cls.__schema__.tablename
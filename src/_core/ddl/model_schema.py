@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+from .column import Column
+from .foreign_key import ForeignKey
+from .index import Index
+from .column_types.column_type import ColumnType
+from .column_types.primary_key import PrimaryKeyColumnType
+
+
+@dataclass(frozen=True)
+class ModelSchema:
+    """Immutable description of the table template.
+    Computed once per `Model` child. Check out `Model.__schema__`.
+
+    Args:
+        tablename: The name of the table.
+        columns: The columns of the table in declaration order.
+        field_names: The names of the model fields in declaration order.
+        field_index: The field name to column position mapping.
+        column_index: The column name to column position mapping.
+        primary_key: The Primary Key column. None if not exist.
+        primary_key_index: The position of the Primary Key column.
+        foreign_keys: The Foreign Keys of the table.
+        indexes: The indexes of the table.
+        unique_columns: The unique columns of the table.
+        decoders: The column position and `ColumnType`.fix_value pairs
+         for columns which values need decoding after fetching.
+    """
+    tablename: str | None
+    columns: Tuple[Column, ...]
+    field_names: Tuple[str, ...]
+    field_index: Mapping[str, int]
+    column_index: Mapping[str, int]
+    primary_key: Column | None
+    primary_key_index: int | None
+    foreign_keys: Tuple[ForeignKey, ...]
+    indexes: Tuple[Index, ...]
+    unique_columns: Tuple[Column, ...]
+    decoders: Tuple[Tuple[int, Callable[[Any], Any]], ...]
+
+    @classmethod
+    def build(cls, tablename: str | None, columns: Dict[str, Column],
+              members: List[Tuple[str, Any]]) -> 'ModelSchema':
+        """Builds the schema.
+
+        Args:
+            tablename: The name of the table.
+            columns: The field name to column mapping in declaration order.
+            members: The other attributes of the template.
+             Foreign Keys and indexes are searched among them.
+
+        Returns:
+            ModelSchema: The schema of the table.
+        """
+        primary_key_index = None
+        for index, column in enumerate(columns.values()):
+            if isinstance(column.type, PrimaryKeyColumnType):
+                primary_key_index = index
+                break
+
+        foreign_keys = []
+        indexes = []
+        for _, value in members:
+            if isinstance(value, ForeignKey):
+                foreign_keys.append(value)
+            elif isinstance(value, Index):
+                indexes.append(value)
+            elif isinstance(value, List):
+                foreign_keys.extend(
+                    [item for item in value if isinstance(item, ForeignKey)])
+                indexes.extend([item for item in value if isinstance(item, Index)])
+
+        column_list = tuple(columns.values())
+        return cls(
+            tablename=tablename,
+            columns=column_list,
+            field_names=tuple(columns.keys()),
+            field_index=MappingProxyType(
+                {name: index for index, name in enumerate(columns.keys())}),
+            column_index=MappingProxyType(
+                {column.name: index for index, column in enumerate(column_list)}),
+            primary_key=(column_list[primary_key_index]
+                         if primary_key_index is not None else None),
+            primary_key_index=primary_key_index,
+            foreign_keys=tuple(foreign_keys),
+            indexes=tuple(indexes),
+            unique_columns=tuple(c for c in column_list if c.unique),
+            decoders=tuple(
+                (index, column.type.fix_value)
+                for index, column in enumerate(column_list)
+                if type(column.type).fix_value is not ColumnType.fix_value),
+        )
@@ -0,0 +1,159 @@
+from typing import Any, Tuple
+
+from .column import Column
+from .foreign_key import ForeignKey
+from .errors import RelationshipError, UnloadedRelationshipError
+
+
+class Relationship:
+    """The relationship of the model with other model over `ForeignKey`.
+    The related rows are loaded by `Query`.load and kept by the row:
+    `project.user` is the `User` row (or None), 
+    `user.projects` is the list of `Project` rows.
+
+    If the Foreign Key is on the model, the relationship is many-to-one:
+    `key_column` of the model refers to `parent_key_columns` of the related model.
+    If the Foreign Key is on the related model, the relationship is one-to-many.
+
+    Example:
+        class Project(Model):
+            __foreignkey__ = ForeignKey(name='fk_user', key_column='user_id',
+                                        parent_table='"user"', parent_key_columns='id')
+            user = Relationship(lambda: User)
+
+    Args:
+        model: The related model or the function returning it
+         for models declared later.
+        foreign_key: The Foreign Key of the relationship.
+         Found by table names if None.
+        many: True if the row has many related rows. 
+         True for one-to-many relationships by default.
+    """
+
+    def __init__(self, model: Any, foreign_key: ForeignKey | None = None,
+                 many: bool | None = None):
+        self._model = model
+        self._foreign_key = foreign_key
+        self._many = many
+        self._join: Tuple[Column, Column, bool] | None = None
+        self.owner = None
+        self.name = ''
+
+    def __set_name__(self, owner, name: str):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance, owner=None) -> Any:
+        if instance is None:
+            return self
+        related = instance._related
+        if related is None or self.name not in related:
+            raise UnloadedRelationshipError(
+                f'Relationship {self.name} of {type(instance).__name__} is not loaded.')
+        return related[self.name]
+
+    def __set__(self, instance, value: Any):
+        """Sets the related rows. The database is not changed."""
+        if instance._related is None:
+            instance._related = {}
+        instance._related[self.name] = value
+
+    @property
+    def model(self):
+        """The related model."""
+        model = self._model
+        if not isinstance(model, type):
+            model = self._model = model()
+        return model
+
+    @property
+    def local(self) -> Column:
+        """The column of the model."""
+        return self._resolve()[0]
+
+    @property
+    def remote(self) -> Column:
+        """The column of the related model."""
+        return self._resolve()[1]
+
+    @property
+    def many(self) -> bool:
+        """True if the row has many related rows."""
+        return self._resolve()[2]
+
+    def _resolve(self) -> Tuple[Column, Column, bool]:
+        """Finds the columns of the relationship by the Foreign Key.
+
+        Returns:
+            Tuple[Column, Column, bool]: The column of the model,
+             the column of the related model and True if one-to-many.
+
+        Raises:
+            RelationshipError: The Foreign Key is not found.
+        """
+        if self._join is not None:
+            return self._join
+        schema = self.owner.__schema__
+        related = self.model.__schema__
+        foreign_key = self._find(schema.foreign_keys, related.tablename)
+        if foreign_key is not None:
+            local_name = foreign_key.key_column
+            remote_name = foreign_key.parent_key_columns
+            many = False
+        else:
+            foreign_key = self._find(related.foreign_keys, schema.tablename)
+            if foreign_key is None:
+                raise RelationshipError(
+                    f'No Foreign Key between {schema.tablename} and {related.tablename}.')
+            local_name = foreign_key.parent_key_columns
+            remote_name = foreign_key.key_column
+            many = True
+        if self._many is not None:
+            many = self._many
+        self._join = (self._column(schema, local_name),
+                      self._column(related, remote_name), many)
+        return self._join
+
+    def _find(self, foreign_keys: Tuple[ForeignKey, ...],
+              parent_tablename: str) -> ForeignKey | None:
+        """Finds the Foreign Key to the parent table among `foreign_keys`."""
+        for foreign_key in foreign_keys:
+            if self._foreign_key is not None:
+                if foreign_key is self._foreign_key:
+                    return foreign_key
+            elif foreign_key.parent_tablename == parent_tablename:
+                return foreign_key
+        return None
+
+    @staticmethod
+    def _column(schema, name: str) -> Column:
+        """Finds the column of the relationship.
+
+        Raises:
+            RelationshipError: The column is not found or composite.
+        """
+        index = schema.column_index.get(name.strip().strip('"'))
+        if index is None:
+            raise RelationshipError(
+                f'Column {name} of the relationship is not a column of {schema.tablename}.')
+        return schema.columns[index]
+
+
+def relationship_of(model, relationship: Relationship) -> Relationship:
+    """Checks the relationship belongs to the model.
+
+    Args:
+        model(Model): The model.
+        relationship: The relationship.
+
+    Returns:
+        Relationship: The relationship.
+
+    Raises:
+        RelationshipError: The relationship is not a relationship of the model.
+    """
+    if not isinstance(relationship, Relationship) or \
+            relationship.owner is None or not issubclass(model, relationship.owner):
+        raise RelationshipError(
+            f'{relationship} is not a relationship of {model.__name__}.')
+    return relationship
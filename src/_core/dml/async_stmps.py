@@ -0,0 +1,131 @@
+from typing import (Any, AsyncIterator, Dict, Iterable, List, NamedTuple, Sequence,
+                    Tuple, TypeVar)
+
+from .bulk_update import BulkUpdate
+from .compiled_query import CompiledQuery
+from .delete import Delete
+from .insert import Insert
+from .query import Query
+from .steps import run_async
+from .update import Update
+from ..ddl.column import Column
+from ..schemas import Page
+
+_T = TypeVar('_T')
+
+
+class AsyncCompiledQuery(CompiledQuery[_T]):
+    """`CompiledQuery` of `AsyncSession`. Terminal methods are awaitable."""
+
+    async def first(self, *values: Any) -> _T | None:
+        return await run_async(self._first_steps(*values), self._session)
+
+    async def all(self, *values: Any) -> List[_T]:
+        return await run_async(self._all_steps(*values), self._session)
+
+    async def iter(self, *values: Any, batch_size: int = 1000) -> AsyncIterator[_T]:
+        from_row = self._model_class._from_row
+        add = self._session.identity_map.add
+        positions = self._positions
+        rows = self._session.read_many(
+            self.sql, batch_size, self.params(*values))
+        async for one in rows:
+            yield add(from_row(one, positions))
+
+
+class AsyncQuery(Query[_T]):
+    """`Query` of `AsyncSession`. Terminal methods are awaitable, 
+    `iter` is the async iterator: `async for user in query:`.
+    """
+    _compiled_class = AsyncCompiledQuery
+
+    async def first(self) -> _T | None:
+        return await run_async(self._first_steps(), self._session)
+
+    async def all(self) -> List[_T]:
+        return await run_async(self._all_steps(), self._session)
+
+    async def tuples(self) -> List[Tuple[Any, ...]]:
+        return await run_async(self._tuples_steps(), self._session)
+
+    async def dicts(self) -> List[Dict[str, Any]]:
+        return await run_async(self._dicts_steps(), self._session)
+
+    async def named(self) -> List[NamedTuple]:
+        return await run_async(self._named_steps(), self._session)
+
+    async def scalars(self, column: Column) -> List[Any]:
+        return await run_async(self._scalars_steps(column), self._session)
+
+    async def paginate(self, after: Any = None, page_size: int = 100) -> Page[_T]:
+        return await run_async(self._paginate_steps(after, page_size), self._session)
+
+    async def count(self) -> int:
+        return await run_async(self._count_steps(), self._session)
+
+    async def exists(self) -> bool:
+        return await run_async(self._exists_steps(), self._session)
+
+    async def aggregate(self, count: bool = False,
+                        sum: Column | Sequence[Column] | None = None,
+                        min: Column | Sequence[Column] | None = None,
+                        max: Column | Sequence[Column] | None = None,
+                        avg: Column | Sequence[Column] | None = None) -> Any:
+        return await run_async(self._aggregate_steps(
+            self._aggregates(count, sum=sum, min=min, max=max, avg=avg)),
+            self._session)
+
+    async def iter(self, batch_size: int = 1000) -> AsyncIterator[_T]:
+        make = self._row_factory()
+        query, params = self._sql()
+        rows = self._session.read_many(query, batch_size, params)
+        if not self._loads:
+            async for one in rows:
+                yield make(one)
+            return
+        batch = []
+        async for one in rows:
+            batch.append(make(one))
+            if len(batch) >= batch_size:
+                for model in await run_async(self._load_steps(batch), self._session):
+                    yield model
+                batch = []
+        if batch:
+            for model in await run_async(self._load_steps(batch), self._session):
+                yield model
+
+    def __aiter__(self) -> AsyncIterator[_T]:
+        return self.iter()
+
+    def __iter__(self):
+        raise TypeError('Use `async for` with AsyncQuery.')
+
+
+class AsyncInsert(Insert):
+    """`Insert` of `AsyncSession`. `commit` is awaitable."""
+
+    async def commit(self) -> List[int] | None:
+        async with self._session.atomic():
+            return await run_async(self._commit_steps(), self._session)
+
+
+class AsyncUpdate(Update):
+    """`Update` of `AsyncSession`. `commit` is awaitable."""
+
+    async def commit(self) -> int:
+        return await run_async(self._commit_steps(), self._session)
+
+
+class AsyncDelete(Delete):
+    """`Delete` of `AsyncSession`. `commit` is awaitable."""
+
+    async def commit(self) -> int:
+        return await run_async(self._commit_steps(), self._session)
+
+
+class AsyncBulkUpdate(BulkUpdate):
+    """`BulkUpdate` of `AsyncSession`. `commit` is awaitable."""
+
+    async def commit(self, items: Iterable[Any]) -> int:
+        async with self._session.atomic():
+            return await run_async(self._commit_steps(items), self._session)
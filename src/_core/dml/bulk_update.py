@@ -0,0 +1,193 @@
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Tuple
+from .errors import ColumnNotFoundError, DifferentModelsTypeError
+from .steps import Steps, run
+from ..ddl.column import Column
+from ..ddl.errors import ValueError as ColumnValueError
+from ..ddl.model import UNLOADED
+from ..drivers.sql_adapter import SqlAdapter
+
+_DEFAULT_CHUNK_SIZE = 1000
+
+
+class BulkUpdate:
+    """Object which respond for updating many rows with different values.
+    Rows are updated by chunks. One UPDATE stmp per chunk 
+    and the shape (the set of updating columns) of rows.
+
+    Args:
+        model_class(Model): The model for stmp.
+        adapter: The SQL adapter for different drivers.
+        session(Session): The session for executing stmp.
+        key: The column which identifies rows. The Primary Key by default.
+        chunk_size: The maximum number of rows in one stmp.
+         1000 or less if the driver parameter limit is reached by default.
+
+    Raises:
+        ValueError: The key is not set and the model has no Primary Key.
+        ColumnNotFoundError: If the key is not a column of the model.
+    """
+
+    def __init__(self, model_class, adapter: SqlAdapter, session,
+                 key: Column | None = None, chunk_size: int | None = None):
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError('chunk_size should be positive.')
+        schema = model_class.__schema__
+        key = key if key is not None else schema.primary_key
+        if key is None:
+            raise ValueError(
+                f'{model_class.__name__} has no Primary Key. Set the key column.')
+        if key.name not in schema.column_index:
+            raise ColumnNotFoundError(
+                f'Column {key.name} is not a column of {schema.tablename}.')
+        self._model = model_class
+        self._adapter = adapter
+        self._session = session
+        self._key = key
+        self._chunk_size = chunk_size
+
+    def commit(self, items: Iterable[Any]) -> int:
+        """Updates rows and commits.
+        Items are consumed lazily, so generators are never fully materialized.
+        All chunks are updated in one transaction (`Session`.atomic),
+        so if a chunk fails, no row is updated.
+
+        Args:
+            items: Models or dicts of column name and value.
+             Every item should have the key value. 
+             Models update all loaded columns.
+
+        Returns:
+            int: The number of updated rows.
+
+        Raises:
+            DifferentModelsTypeError: The item is other model.
+            ColumnNotFoundError: The name is not a column of the model.
+            ValueError: The key value is None or the value is invalid
+             (None of the not nullable column).
+        """
+        with self._session.atomic():
+            return run(self._commit_steps(items), self._session)
+
+    def _commit_steps(self, items: Iterable[Any], expire: bool = True) -> Steps[int]:
+        """The steps of `commit`. Check out `Steps`.
+
+        Args:
+            items: Models or dicts of column name and value.
+            expire: Removes rows updated by dicts from the identity map if True.
+             The unit of work updates its rows itself.
+        """
+        items = iter(items)
+        expired: List[Any] = []
+        schema = self._model.__schema__
+        chunk_size = self._chunk_len(len(schema.columns))
+        rowcount = 0
+        while True:
+            chunk = list(islice(items, chunk_size))
+            if not chunk:
+                break
+            shapes: Dict[Tuple[str, ...], Tuple[Tuple[Column, ...], List[List[Any]]]] = {}
+            for item in chunk:
+                columns, row = self._row(item)
+                if expire and isinstance(item, dict) and columns:
+                    expired.append(row[0])
+                shape = tuple(column.name for column in columns)
+                shapes.setdefault(shape, (columns, []))[1].append(row)
+            for columns, rows in shapes.values():
+                if columns:
+                    rowcount += yield 'execute', self._update_stmp(columns, rows)
+        if expired and self._key is schema.primary_key:
+            # Rows of the session are not updated by dicts.
+            self._session.identity_map.expire(self._model, expired)
+        elif expired:
+            self._session.identity_map.expire(self._model)
+        yield 'commit', ()
+        self._session.tables_changed(schema.tablename)
+        return rowcount
+
+    def _row(self, item: Any) -> Tuple[Tuple[Column, ...], List[Any]]:
+        """Splits the item to updating columns and the row of values.
+
+        Args:
+            item: The model or dict of column name and value.
+
+        Returns:
+            Tuple[Tuple[Column, ...], List[Any]]: Updating columns 
+             and the key value with updating values.
+        """
+        schema = self._model.__schema__
+        key = self._key
+        if isinstance(item, dict):
+            pairs = []
+            for name, value in item.items():
+                index = schema.column_index.get(name)
+                if index is None:
+                    raise ColumnNotFoundError(
+                        f'Column {name} is not a column of {schema.tablename}.')
+                column = schema.columns[index]
+                if value is None and not column.nullable:
+                    # The same check as assigning to the model.
+                    raise ColumnValueError(f'Value of {name} should be not None.')
+                column.type.check_value(value)
+                pairs.append((column, value))
+        elif isinstance(item, self._model):
+            pairs = [(column, value)
+                     for column, value in zip(schema.columns, item._values)
+                     if value is not UNLOADED]
+        else:
+            raise DifferentModelsTypeError(
+                f'All models should be {self._model} type.')
+
+        key_value = None
+        columns = []
+        row = [None]
+        for column, value in pairs:
+            if column.name == key.name:
+                key_value = value
+            else:
+                columns.append(column)
+                row.append(value)
+        if key_value is None:
+            raise ValueError(f'The key {key.name} value should be not None.')
+        row[0] = key_value
+        return tuple(columns), row
+
+    def _chunk_len(self, columns_count: int) -> int:
+        """Calculates the number of rows in one stmp.
+        The row takes up to two parameters per column (`CASE` on SQLite).
+
+        Args:
+            columns_count: The number of columns of the model.
+
+        Returns:
+            int: The number of rows in one stmp.
+        """
+        chunk_size = self._chunk_size or _DEFAULT_CHUNK_SIZE
+        if self._adapter.bind_params:
+            limit = max(self._adapter.max_params // (2 * columns_count + 1), 1)
+            chunk_size = min(chunk_size, limit)
+        return chunk_size
+
+    def _update_stmp(self, columns: Tuple[Column, ...],
+                     rows: List[List[Any]]) -> Tuple[str, List[Any]]:
+        """Creates the UPDATE stmp of rows with the same shape.
+
+        Args:
+            columns: The updating columns.
+            rows: The key value and updating values of every row.
+
+        Returns:
+            Tuple[str, List[Any]]: SQL and its parameters.
+        """
+        adapter = self._adapter
+        params: List[Any] = []
+        sql = adapter.bulk_update(
+            table=self._model.__schema__.tablename,
+            key_column=self._key.name,
+            columns=[column.name for column in columns],
+            types=[column.type.cast_sql(adapter)
+                   for column in (self._key, *columns)],
+            rows=rows,
+            params=params,
+        )
+        return sql, params
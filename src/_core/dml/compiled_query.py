@@ -0,0 +1,117 @@
+from typing import Any, Generic, Iterator, List, Sequence, Tuple, TypeVar
+from ..ddl.column import Column
+from ..drivers.sql_adapter import SqlAdapter
+from .steps import Steps, run
+
+_T = TypeVar('_T')
+
+
+class CompiledQuery(Generic[_T]):
+    """The compiled query. Created by `Query`.compile.
+    SQL is created once, the query can be executed many times
+    with new values of conditions.
+
+    Args:
+        model_class(Model): The model for query.
+        adapter: The SQL adapter for different drivers.
+        session(Session): The session for executing query.
+        sql: SQL of the query.
+        params: The parameters of the query.
+        columns: The condition columns of the parameters.
+         For checking of new values.
+        positions: The column positions of the selected columns in the model.
+         None if all columns are selected.
+    """
+
+    def __init__(self, model_class, adapter: SqlAdapter, session, sql: str,
+                 params: List[Any], columns: Sequence[Column],
+                 positions: Tuple[int, ...] | None):
+        self._model_class = model_class
+        self._adapter = adapter
+        self._session = session
+        self.sql = sql
+        self._params = params
+        self._columns = tuple(columns)
+        self._positions = positions
+
+    def params(self, *values: Any) -> List[Any]:
+        """Creates parameters of the query.
+
+        Args:
+            values: New values of conditions in the order of
+             `where`, `and_`, `or_` calls. The compiled values if empty.
+
+        Returns:
+            List[Any]: The parameters of the query.
+
+        Raises:
+            TypeError: If the number of values is wrong.
+            ValueError: The value is invalid.
+        """
+        if not values:
+            return self._params
+        if len(values) != len(self._columns):
+            raise TypeError(
+                f'The query takes {len(self._columns)} values but {len(values)} were given.')
+        param_value = self._adapter.param_value
+        params = []
+        for column, value in zip(self._columns, values):
+            column.type.check_value(value)
+            params.append(param_value(value))
+        return params
+
+    def first(self, *values: Any) -> _T | None:
+        """Fetch the first row by query. None if not exist.
+
+        Args:
+            values: New values of conditions. Check out `params`.
+
+        Returns:
+            _T | None: The first row by query. None if not exist.
+        """
+        return run(self._first_steps(*values), self._session)
+
+    def _first_steps(self, *values: Any) -> Steps[_T | None]:
+        """The steps of `first`. Check out `Steps`."""
+        one = yield 'read_one', (self.sql, self.params(*values))
+        if one is None:
+            return None
+        return self._session.identity_map.add(
+            self._model_class._from_row(one, self._positions))
+
+    def all(self, *values: Any) -> List[_T]:
+        """Fetch all table rows by query.
+
+        Args:
+            values: New values of conditions. Check out `params`.
+
+        Returns:
+            List[_T]: All table rows by query.
+        """
+        return run(self._all_steps(*values), self._session)
+
+    def _all_steps(self, *values: Any) -> Steps[List[_T]]:
+        """The steps of `all`. Check out `Steps`."""
+        all = yield 'read_all', (self.sql, self.params(*values))
+        from_row = self._model_class._from_row
+        add = self._session.identity_map.add
+        positions = self._positions
+        return [add(from_row(one, positions)) for one in all]
+
+    def iter(self, *values: Any, batch_size: int = 1000) -> Iterator[_T]:
+        """Iterate over table rows by query. Check out `Query`.iter.
+
+        Args:
+            values: New values of conditions. Check out `params`.
+            batch_size: The number of rows fetched at once. 1000 by default.
+
+        Returns:
+            Iterator[_T]: Table rows by query.
+        """
+        from_row = self._model_class._from_row
+        add = self._session.identity_map.add
+        positions = self._positions
+        rows = self._session.read_many(
+            self.sql, batch_size, self.params(*values))
+        for one in rows:
+            yield add(from_row(one, positions))
@@ -0,0 +1,173 @@
+from types import FunctionType
+from typing import Any, Callable, Hashable, List, Tuple
+from ..drivers.sql_adapter import SqlAdapter
+from ..ddl.column import Column
+
+
+class ConditionalStmt:
+    """The base of stmps with WHERE conditions.
+    Conditions keep values, values are adapted to SQL
+    (bound parameters or literals) when the stmp is rendered.
+    SQL of bound-parameter stmps is cached by the stmp shape
+    in the `statement_cache` of the session.
+
+    Args:
+        adapter: The SQL adapter for different drivers.
+        session(Session): The session for executing stmp.
+    """
+
+    def __init__(self, adapter: SqlAdapter, session):
+        self._adapter = adapter
+        self._session = session
+        self._conditions: List[Tuple[str, Column, str, Any]] = []
+
+    def where(self, column: Column, value: Any, condition: str = '='):
+        """Adds WHERE condition to stmp.
+
+        Args:
+            column: Condition column.
+            value: Condition value.
+            condition: Condition. For example: `=`, `LIKE`, `IN`.
+            `=` by default.
+
+        Returns:
+            self: The stmp object.
+
+        Raises:
+            ValueError: The value is invalid.
+        """
+        return self._add_condition('', column, value, condition)
+
+    def and_(self, column: Column, value: Any, condition: str = '='):
+        """Adds AND condition to stmp.
+        Use `where` first!
+
+        Args:
+            column: Condition column.
+            value: Condition value.
+            condition: Condition. For example: `=`, `LIKE`, `IN`.
+            `=` by default.
+
+        Returns:
+            self: The stmp object.
+
+        Raises:
+            ValueError: The value is invalid.
+        """
+        return self._add_condition('AND ', column, value, condition)
+
+    def or_(self, column: Column, value: Any, condition: str = '='):
+        """Adds OR condition to stmp.
+        Use `where` first!
+
+        Args:
+            column: Condition column.
+            value: Condition value.
+            condition: Condition. For example: `=`, `LIKE`, `IN`.
+            `=` by default.
+
+        Returns:
+            self: The stmp object.
+
+        Raises:
+            ValueError: The value is invalid.
+        """
+        return self._add_condition('OR ', column, value, condition)
+
+    def _add_condition(self, operator: str, column: Column, value: Any,
+                       condition: str):
+        """Checks the value and adds the condition.
+
+        Args:
+            operator: The logical operator with trailing space.
+             Empty for WHERE.
+            column: Condition column.
+            value: Condition value.
+            condition: Condition.
+
+        Returns:
+            self: The stmp object.
+        """
+        column.type.check_value(value)
+        self._conditions.append((operator, column, condition, value))
+        return self
+
+    def _conditions_sql(self, params: List[Any],
+                        qualify: Callable[[Column], str] | None = None) -> List[str]:
+        """Creates SQL of conditions.
+
+        Args:
+            params: The parameters of the stmp.
+             Values of conditions are added to them.
+            qualify: Creates the qualified name of the column. 
+             For stmps of many tables. The column name if None.
+
+        Returns:
+            List[str]: SQL of conditions.
+        """
+        bind = self._adapter.bind
+        if qualify is None:
+            return [f'{operator}{column.name} {condition} {bind(value, params)}'
+                    for operator, column, condition, value in self._conditions]
+        return [f'{operator}{qualify(column)} {condition} {bind(value, params)}'
+                for operator, column, condition, value in self._conditions]
+
+    def _conditions_key(self, qualify: Callable[[Column], str] | None = None
+                        ) -> Tuple[Hashable, ...]:
+        """The shape of conditions. Values are not a part of the shape.
+
+        Args:
+            qualify: Creates the qualified name of the column.
+             For stmps of many tables. The column name if None.
+
+        Returns:
+            Tuple[Hashable, ...]: The shape of conditions.
+        """
+        adapter = self._adapter
+        return tuple(
+            (operator, qualify(column) if qualify is not None else column.name,
+             condition,
+             value(adapter) if isinstance(value, FunctionType) else None)
+            for operator, column, condition, value in self._conditions)
+
+    def _conditions_params(self, params: List[Any]) -> List[Any]:
+        """Adds values of conditions to `params`.
+        The same parameters as `_conditions_sql` adds.
+
+        Args:
+            params: The parameters of the stmp.
+
+        Returns:
+            List[Any]: `params`.
+        """
+        param_value = self._adapter.param_value
+        params.extend(param_value(value)
+                      for _, _, _, value in self._conditions
+                      if not isinstance(value, FunctionType))
+        return params
+
+    def _cached_sql(self, key: Hashable, render: Callable[[List[Any]], str],
+                    params: Callable[[], List[Any]]) -> Tuple[str, List[Any]]:
+        """Finds SQL of the stmp shape in the statement cache or renders it.
+        SQL with literals is not cached.
+
+        Args:
+            key: The shape of the stmp.
+            render: Renders SQL and adds parameters to the list.
+            params: Creates parameters of the stmp without rendering.
+
+        Returns:
+            Tuple[str, List[Any]]: SQL and its parameters.
+        """
+        cache = self._session.statement_cache
+        if not self._adapter.bind_params or cache is None:
+            values: List[Any] = []
+            return render(values), values
+
+        sql = cache.get(key)
+        if sql is None:
+            values = []
+            sql = render(values)
+            cache.put(key, sql)
+            return sql, values
+        return sql, params()
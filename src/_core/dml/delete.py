@@ -1,10 +1,12 @@
-from typing import Any
+from typing import Any, List, Tuple
+from .conditional import ConditionalStmt
+from .steps import Steps, run
 from ..drivers.sql_adapter import SqlAdapter
-from ..ddl.column import Column
 
 
-class Delete:
+class Delete(ConditionalStmt):
     """Delete object for creating and executing deleting stmps.
+    Use `where`, `and_`, `or_` for specifying deleting rows.
 
     Args:
         model_class(Model): The model for stmp. 
@@ -14,67 +16,36 @@ class Delete:
     """
 
     def __init__(self, model, adapter: SqlAdapter, session):
-        self._adapter = adapter
-        self._session = session
+        super().__init__(adapter, session)
         self._model = model
-        self._conditions = []
 
-    def where(self, column: Column, value: Any, condition: str = '='):
-        """Adds WHERE condition to stmp.
-        For getting row(s) use `first` or `all` method.
-
-        Args:
-            column: Condition column.
-            value: Condition value.
-            condition: Condition. For example: `=`, `LIKE`, `IN`.
-            `=` by default.
-
-        Returns:
-            self: Query object for rows fetching.
-        """
-        value = column.type.insert_value(value, self._adapter)
-        self._conditions.append(f'{column.name} {condition} {value}')
-        return self
-
-    def and_(self, column: Column, value: Any, condition: str = '='):
-        """Adds AND condition to stmp.
-        Use `where` first!
-        For getting row(s) use `first` or `all` method.
-
-        Args:
-            column: Condition column.
-            value: Condition value.
-            condition: Condition. For example: `=`, `LIKE`, `IN`.
-            `=` by default.
+    def _sql(self) -> Tuple[str, List[Any]]:
+        """Creates SQL of the stmp.
 
         Returns:
-            self: Query object for rows fetching.
+            Tuple[str, List[Any]]: SQL and its parameters.
         """
-        value = column.type.insert_value(value, self._adapter)
-        self._conditions.append(f'AND {column.name} {condition} {value}')
-        return self
+        tablename = self._model.__schema__.tablename
+        return self._cached_sql(
+            ('delete', tablename, self._conditions_key()),
+            lambda params: self._adapter.delete(
+                tablename, self._conditions_sql(params)),
+            lambda: self._conditions_params([]),
+        )
 
-    def or_(self, column: Column, value: Any, condition: str = '='):
-        """Adds OR condition to stmp.
-        Use `where` first!
-        For getting row(s) use `first` or `all` method.
-
-        Args:
-            column: Condition column.
-            value: Condition value.
-            condition: Condition. For example: `=`, `LIKE`, `IN`.
-            `=` by default.
+    def commit(self) -> int:
+        """Executes DELETE stmp
 
         Returns:
-            self: Query object for rows fetching.
+            int: The number of deleted rows.
         """
-        value = column.type.insert_value(value, self._adapter)
-        self._conditions.append(f'OR {column.name} {condition} {value}')
-        return self
-
-    def commit(self):
-        """Executes DELETE stmp"""
-        model = self._model()
-        stmp = self._adapter.delete(model.__tablename__, self._conditions)
-        self._session.execute(stmp)
-        self._session.commit()
+        return run(self._commit_steps(), self._session)
+
+    def _commit_steps(self) -> Steps[int]:
+        """The steps of `commit`. Check out `Steps`."""
+        stmp, params = self._sql()
+        rowcount = yield 'execute', (stmp, params)
+        self._session.identity_map.expire(self._model)
+        yield 'commit', ()
+        self._session.tables_changed(self._model.__schema__.tablename)
+        return rowcount
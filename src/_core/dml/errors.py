@@ -1,2 +1,19 @@
 class DifferentModelsTypeError(Exception):
     pass
+
+
+class ColumnNotFoundError(Exception):
+    """Raise the error if the column is not a column of the model."""
+    pass
+
+
+class JoinError(Exception):
+    """Raise the error if the table can not be joined to the query."""
+    pass
+
+
+class CompileError(JoinError):
+    """Raise the error if the query can not be compiled:
+    it has `join`, `load` or `cache`. Subclass of `JoinError`, 
+    which was raised for joins."""
+    pass
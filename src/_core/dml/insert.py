@@ -1,60 +1,128 @@
-from typing import List
-from .errors import DifferentModelsTypeError
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator, List, Sequence, Tuple
+from weakref import ReferenceType, ref
+from .errors import ColumnNotFoundError, DifferentModelsTypeError
+from .steps import Steps, run
+from ..ddl.column import Column
 from ..ddl.model import Model
 from ..drivers.sql_adapter import SqlAdapter
 
+_DEFAULT_CHUNK_SIZE = 1000
+
 
 class Insert:
     """Object which respond for inserting models.
+    Items are inserted by chunks. One multi-row INSERT stmp per chunk.
+    The chunk is limited by the number of bound parameters of the driver.
 
     Args:
         adapter: The Sql adapter.
         session: The session for running stmps.
+        chunk_size: The maximum number of items in one stmp.
+         1000 or less if the driver parameter limit is reached by default.
     """
 
-    def __init__(self, adapter: SqlAdapter, session):
+    def __init__(self, adapter: SqlAdapter, session, chunk_size: int | None = None):
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError('chunk_size should be positive.')
         self._adpter = adapter
         self._session = session
-        self._items: List[Model] = []
+        self._chunk_size = chunk_size
+        self._items: List[Iterable[Model]] = []
+        self._conflict: Tuple[Sequence[Column], Sequence[Column] | None, bool] | None = None
 
     def commit(self) -> List[int] | None:
         """Commit Model(s) adding.
-
-        Args:
-            item: Adding item.
+        Items are consumed lazily, so generators are never fully materialized.
+        All chunks are inserted in one transaction (`Session`.atomic), 
+        so if a chunk fails, no item is inserted.
 
         Returns:
-           List [int] | None: Id of adding item. None if column_id is not exist.
+           List [int] | None: Ids of adding items. None if column_id is not exist.
 
         Raises:
             DifferentModelsTypeError: if items are different models.
+            ColumnNotFoundError: If the `on_conflict` column
+             is not a column of the model.
         """
-        if not self._items:
-            return
+        with self._session.atomic():
+            return run(self._commit_steps(), self._session)
 
-        etalon = self._items[0]
+    def _commit_steps(self) -> Steps[List[int] | None]:
+        """The steps of `commit`. Check out `Steps`.
+        If a stmp fails, inserted items are restored as new.
+        The caller rolls back the transaction."""
+        items = iter(chain.from_iterable(self._items))
+        etalon = next(items, None)
+        if etalon is None:
+            return
         etalon_type = type(etalon)
-        for model in self._items:
-            if not isinstance(model, etalon_type):
+        schema = etalon.__schema__
+        chunk_size = self._chunk_len(len(schema.columns))
+        conflict = self._conflict_names(schema)
 
-                raise DifferentModelsTypeError(
-                    f'All models should be {etalon_type} type.')
+        ids: List[int] | None = [] if schema.primary_key is not None else None
+        # Weak references, so inserted items are not kept in memory.
+        inserted: List[Tuple[ReferenceType, Any, bool, Any, bool]] = []
+        index = schema.primary_key_index
+        try:
+            for chunk in self._chunks(chain((etalon,), items), chunk_size):
+                for model in chunk:
+                    if not isinstance(model, etalon_type):
+                        raise DifferentModelsTypeError(
+                            f'All models should be {etalon_type} type.')
+                inserted.extend(self._state(model, index) for model in chunk)
+                chunk_ids = yield from self._insert_chunk(schema, chunk, *conflict)
+                if ids is not None:
+                    ids.extend(id[0] for id in chunk_ids)
+            yield 'commit', ()
+        except BaseException:
+            self._restore(inserted, index)
+            raise
+        self._session.tables_changed(schema.tablename)
 
-        sql = self._adpter.insert_items(
-            table=etalon.__tablename__,
-            columns=[c.column_name for c in etalon.column_values.columns],
-            id_column=etalon.table_id.name if etalon.table_id is not None else None,
-            list_values=[[c.insert_value(self._adpter) for c in item.column_values.columns]
-                         for item in self._items],
-        )
-        ids = None
-        if etalon.table_id is not None:
-            ids = self._session.fetch_all(sql)
-        else:
-            self._session.execute(sql)
-        self._session.commit()
+        return ids if ids else None
+
+    def _state(self, item: Model,
+               index: int | None) -> Tuple[ReferenceType, Any, bool, Any, bool]:
+        """Keeps the state of the inserting item. Check out `_restore`.
+
+        Args:
+            item: The item.
+            index: The position of the Primary Key.
 
-        return [id[0] for id in ids] if ids else None
+        Returns:
+            Tuple[ReferenceType, Any, bool, Any, bool]: The weak reference 
+             to the item, the Primary Key value, `_persistent`, `_dirty`
+             and True if the item is in the identity map.
+        """
+        key = item._values[index] if index is not None else None
+        dirty = set(item._dirty) if item._dirty is not None else None
+        mapped = key is not None and \
+            self._session.identity_map.get(type(item), key) is item
+        return ref(item), key, item._persistent, dirty, mapped
+
+    def _restore(self, inserted: List[Tuple[ReferenceType, Any, bool, Any, bool]],
+                 index: int | None):
+        """Restores items of rolled back chunks: removes them 
+        from the identity map, resets generated ids, 
+        `_persistent` and `_dirty`.
+
+        Args:
+            inserted: The state of inserted items. Check out `_state`.
+            index: The position of the Primary Key.
+        """
+        identity_map = self._session.identity_map
+        for item_ref, key, persistent, dirty, mapped in inserted:
+            item = item_ref()
+            if item is None:
+                continue
+            if not mapped:
+                identity_map.discard(item)
+            if index is not None:
+                item._values[index] = key
+            item._persistent = persistent
+            item._dirty = dirty
 
     def add_item(self, item: Model):
         """Add Item to Model Table.
@@ -65,18 +133,166 @@ class Insert:
         Returns:
             self: current Insert object.
         """
-        self._items.append(item)
+        self._items.append((item,))
         return self
 
-    def add_items(self, items: List[Model]):
+    def add_items(self, items: Iterable[Model]):
         """Add Items to Model Table.
 
         Args:
-            items: Adding items.
+            items: Adding items. Can be a generator,
+             it is consumed by `commit`.
 
         Returns:
             self: current Insert object.
 
         """
-        self._items.extend(items)
+        self._items.append(items)
         return self
+
+    def on_conflict(self, columns: Sequence[Column],
+                    update: Sequence[Column] | None = None,
+                    do_nothing: bool = False):
+        """Upserts items by `INSERT ... ON CONFLICT`.
+        If the row with the same values of `columns` exists,
+        it is updated by values of adding item or the item is skipped.
+        The item can not conflict with other item of the same chunk.
+        Ids are returned only for inserted or updated rows.
+
+        Args:
+            columns: The columns of unique constraint. For example `[User.email]`.
+            update: The updating columns. All columns except `columns`
+             and the Primary Key by default.
+            do_nothing: Skips conflicting items. False by default.
+
+        Returns:
+            self: current Insert object.
+
+        Raises:
+            ValueError: `columns` is empty or `update` is set with `do_nothing`.
+        """
+        if not columns:
+            raise ValueError('Conflict columns should be not empty.')
+        if do_nothing and update:
+            raise ValueError('update can not be used with do_nothing.')
+        self._conflict = (columns, update, do_nothing)
+        return self
+
+    def _conflict_names(self, schema) -> Tuple[List[str] | None, List[str] | None]:
+        """The names of conflict and updating columns.
+
+        Args:
+            schema(ModelSchema): The schema of the model.
+
+        Returns:
+            Tuple[List[str] | None, List[str] | None]: The names of 
+             conflict and updating columns. (None, None) if not upsert.
+
+        Raises:
+            ColumnNotFoundError: If the column is not a column of the model.
+        """
+        if self._conflict is None:
+            return None, None
+        columns, update, do_nothing = self._conflict
+        conflict_names = [c.name for c in columns]
+        if do_nothing:
+            update_names = []
+        elif update is None:
+            update_names = [c.name for c in schema.columns
+                            if c.name not in conflict_names
+                            and c is not schema.primary_key]
+        else:
+            update_names = [c.name for c in update]
+        for name in conflict_names + update_names:
+            if name not in schema.column_index:
+                raise ColumnNotFoundError(
+                    f'Column {name} is not a column of {schema.tablename}.')
+        return conflict_names, update_names
+
+    def _chunk_len(self, columns_count: int) -> int:
+        """Calculates the number of items in one stmp.
+
+        Args:
+            columns_count: The number of columns of the model.
+
+        Returns:
+            int: The number of items in one stmp.
+        """
+        chunk_size = self._chunk_size or _DEFAULT_CHUNK_SIZE
+        if self._adpter.bind_params:
+            limit = max(self._adpter.max_params // max(columns_count, 1), 1)
+            chunk_size = min(chunk_size, limit)
+        return chunk_size
+
+    @staticmethod
+    def _chunks(items: Iterator[Model], chunk_size: int) -> Iterator[List[Model]]:
+        """Splits items by chunks.
+
+        Args:
+            items: The items.
+            chunk_size: The maximum number of items in the chunk.
+
+        Returns:
+            Iterator[List[Model]]: The chunks.
+        """
+        while True:
+            chunk = list(islice(items, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _insert_chunk(self, schema, chunk: List[Model],
+                      conflict_columns: List[str] | None = None,
+                      update_columns: List[str] | None = None) -> Steps[List[Any]]:
+        """The steps of the multi-row INSERT stmp of the chunk.
+
+        Args:
+            schema(ModelSchema): The schema of the model.
+            chunk: The inserting items.
+            conflict_columns: The columns of ON CONFLICT. None if not upsert.
+            update_columns: The updating columns of ON CONFLICT.
+
+        Returns:
+            List[Any]: Rows with ids. Empty if column_id is not exist.
+        """
+        columns = schema.columns
+        params: List[Any] = []
+        sql = self._adpter.insert_items(
+            table=schema.tablename,
+            columns=[c.name for c in columns],
+            id_column=schema.primary_key.name if schema.primary_key is not None else None,
+            list_values=[[c.bind_value(value, self._adpter, params)
+                          for c, value in zip(columns, item._values)]
+                         for item in chunk],
+            conflict_columns=conflict_columns,
+            update_columns=update_columns,
+        )
+        if schema.primary_key is None:
+            yield 'execute', (sql, params)
+            self._flushed(schema, chunk, None)
+            return []
+        rows = yield 'fetch_all', (sql, params)
+        self._flushed(schema, chunk, rows)
+        return rows
+
+    def _flushed(self, schema, chunk: List[Model], rows: List[Any] | None):
+        """Marks items as saved in the database, sets generated ids
+        and adds items to the session identity map.
+        Items are not marked if some of them were skipped by `on_conflict`.
+
+        Args:
+            schema(ModelSchema): The schema of the model.
+            chunk: The inserted items.
+            rows: Rows with ids in the order of items. None if column_id is not exist.
+        """
+        if rows is not None:
+            if len(rows) != len(chunk):
+                return
+            index = schema.primary_key_index
+            for item, row in zip(chunk, rows):
+                if item._values[index] is None:
+                    item._values[index] = row[0]
+        add = self._session.identity_map.add
+        for item in chunk:
+            item._flushed()
+            add(item)
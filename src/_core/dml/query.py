@@ -1,12 +1,51 @@
-from typing import Any, Dict, List, Tuple, TypeVar, Generic
+from collections import namedtuple
+from copy import copy
+from functools import lru_cache
+from types import FunctionType
+from typing import (Any, Callable, Dict, Hashable, Iterator, List, NamedTuple,
+                    Sequence, Tuple, TypeVar, Generic)
+from .compiled_query import CompiledQuery
+from .conditional import ConditionalStmt
+from .errors import ColumnNotFoundError, CompileError, JoinError
+from .steps import Steps, run
+from ..result_cache import MISS
+from ..schemas import Page
 from ..drivers.sql_adapter import SqlAdapter
 from ..ddl.column import Column
+from ..ddl.column_types.column_type import ColumnType
+from ..ddl.errors import RelationshipError
+from ..ddl.model import UNLOADED
+from ..ddl.relationship import Relationship, relationship_of
 
 _T = TypeVar('_T')
 
+SELECTIN = 'selectin'
+JOINED = 'joined'
+AGGREGATES = ('count', 'sum', 'min', 'max', 'avg')
 
-class Query(Generic[_T]):
+
+def _column_name(column: Column) -> str:
+    """The name of the column."""
+    return column.name
+
+
+@lru_cache(maxsize=256)
+def _row_class(field_names: Tuple[str, ...]):
+    """Creates the namedtuple class for the shape of rows.
+    Cached, so every shape creates the class once.
+
+    Args:
+        field_names: The names of the row fields.
+
+    Returns:
+        Type[NamedTuple]: The row class.
+    """
+    return namedtuple('Row', field_names, rename=True)
+
+
+class Query(ConditionalStmt, Generic[_T]):
     """Query object for creating queries and fetching result(s).
+    Use `where`, `and_`, `or_` for specifying fetching rows.
 
     Args:
         model_class(Model): The model for query. 
@@ -14,83 +53,353 @@ class Query(Generic[_T]):
         adapter: The SQL adapter for different drivers.
         session(Session): The session for executing query.
     """
+    _compiled_class = CompiledQuery
 
     def __init__(self, model_class, adapter: SqlAdapter, session):
+        super().__init__(adapter, session)
         self._model_class = model_class
-        self._model = model_class()
-        self._adapter = adapter
-        self._session = session
+        self._schema = model_class.__schema__
         self._limit: int | None = None
-        self._conditions: List[str] = []
+        self._columns: Tuple[Column, ...] = self._schema.columns
+        self._positions: Tuple[int, ...] | None = None
+        self._cached = False
+        self._cache_ttl: float | None = None
+        self._loads: List[Tuple[Relationship, str]] = []
+        self._joins: List[Tuple[Any, Column, Column, bool]] = []
+        self._group_by: List[Column] = []
+        self._having: List[Tuple[str, str, Column | None, str, Any]] = []
+        self._order: List[Tuple[Column, bool]] = []
+        self._after: Tuple[Any, ...] | None = None
+        self._column_tables: Dict[int, str] = {
+            id(column): self._schema.tablename for column in self._schema.columns}
 
-    def _sql(self) -> str:
+    def _sql(self, columns: Sequence[Column] | None = None,
+             joined: Sequence[Relationship] = ()) -> Tuple[str, List[Any]]:
         """Creates SQL for query.
 
+        Args:
+            columns: The selecting columns.
+             The selected columns of the query (and joined models) if None.
+            joined: The relationships loaded by JOIN.
+
         Returns:
-            str: SQL query.
+            Tuple[str, List[Any]]: SQL query and its parameters.
         """
-        adapter = self._adapter
-        query = adapter.select(
-            table=self._model.__tablename__,
-            where=self._conditions,
-            limit=self._limit,
+        if joined or self._joins:
+            return self._joined_sql(columns, joined)
+        names = [column.name for column in (columns or self._columns)]
+        tablename = self._schema.tablename
+        key = ('select', tablename, tuple(names),
+               self._conditions_key(), self._order_key(_column_name), self._limit)
+        return self._cached_sql(
+            key,
+            lambda params: self._adapter.select(
+                table=tablename,
+                columns=names,
+                where=self._where_sql(params),
+                limit=self._limit,
+                order_by=self._order_sql(_column_name),
+            ),
+            self._select_params,
         )
 
-        return query
+    def _joined_sql(self, columns: Sequence[Column] | None,
+                    joined: Sequence[Relationship]) -> Tuple[str, List[Any]]:
+        """Creates SQL for query with JOINs. Columns are qualified by tables.
+        The selected columns of the model are followed by all columns 
+        of joined models and then by all columns of relationships loaded
+        by LEFT OUTER JOIN. Related tables are aliased, 
+        so a table can be joined many times.
 
-    def where(self, column: Column, value: Any, condition: str = '='):
-        """Adds WHERE condition to query.
-        For getting row(s) use `first` or `all` method.
+        Args:
+            columns: The selecting columns. All columns if None.
+            joined: The relationships loaded by JOIN.
+
+        Returns:
+            Tuple[str, List[Any]]: SQL query and its parameters.
+        """
+        tablename = self._schema.tablename
+        key = ('select', tablename,
+               tuple(self._qualify(c) for c in columns) if columns is not None else None,
+               tuple(c.name for c in self._columns),
+               self._joins_key(),
+               tuple((r.owner, r.name) for r in joined),
+               self._conditions_key(self._qualify), self._order_key(self._qualify),
+               self._limit)
+
+        def render(params: List[Any]) -> str:
+            adapter = self._adapter
+            qualify = self._qualify
+            joins = self._join_clauses()
+            if columns is not None:
+                names = [qualify(column) for column in columns]
+            else:
+                names = [f'{tablename}.{column.name}' for column in self._columns]
+                for model, _, _, _ in self._joins:
+                    joined_tablename = model.__schema__.tablename
+                    names.extend(f'{joined_tablename}.{column.name}'
+                                 for column in model.__schema__.columns)
+            for number, relationship in enumerate(joined):
+                alias = f'_r{number}'
+                names.extend(f'{alias}.{column.name}'
+                             for column in relationship.model.__schema__.columns)
+                joins.append(adapter.join(
+                    relationship.model.__schema__.tablename,
+                    f'{tablename}.{relationship.local.name} = '
+                    f'{alias}.{relationship.remote.name}',
+                    alias=alias, outer=True))
+            return adapter.select(
+                table=tablename,
+                columns=names,
+                where=self._where_sql(params, qualify),
+                limit=self._limit,
+                joins=joins,
+                order_by=self._order_sql(qualify),
+            )
+
+        return self._cached_sql(key, render, self._select_params)
+
+    def _where_sql(self, params: List[Any],
+                   qualify: Callable[[Column], str] | None = None) -> List[str]:
+        """Creates SQL of conditions followed by the keyset condition of `paginate`.
 
         Args:
-            column: Condition column.
-            value: Condition value.
-            condition: Condition. For example: `=`, `LIKE`, `IN`.
-            `=` by default.
+            params: The parameters of the query.
+            qualify: Creates the qualified name of the column.
+
+        Returns:
+            List[str]: SQL of conditions.
+        """
+        where = self._conditions_sql(params, qualify)
+        if self._after is None:
+            return where
+        keyset = self._keyset_sql(params, qualify or _column_name)
+        if not where:
+            return [keyset]
+        return [f'({" ".join(where)})', f'AND ({keyset})']
+
+    def _keyset_sql(self, params: List[Any], qualify: Callable[[Column], str]) -> str:
+        """Creates SQL of the keyset condition: rows after the key `_after`
+        in the order of the query. Columns of the same direction
+        are compared as a row value: `(a, b) > (1, 2)`. Mixed directions
+        are expanded: `a > 1 OR (a = 1 AND b < 2)`.
+
+        Args:
+            params: The parameters of the query.
+            qualify: Creates the qualified name of the column.
+
+        Returns:
+            str: SQL of the keyset condition.
+        """
+        bind = self._adapter.bind
+        names = [qualify(column) for column, _ in self._order]
+        operators = ['<' if desc else '>' for _, desc in self._order]
+        values = self._after
+        if len(set(operators)) == 1:
+            if len(names) == 1:
+                return f'{names[0]} {operators[0]} {bind(values[0], params)}'
+            binds = ', '.join(bind(value, params) for value in values)
+            return f'({", ".join(names)}) {operators[0]} ({binds})'
+        terms = []
+        for index, (name, operator) in enumerate(zip(names, operators)):
+            equals = [f'{names[i]} = {bind(values[i], params)} AND '
+                      for i in range(index)]
+            terms.append(
+                f'({"".join(equals)}{name} {operator} {bind(values[index], params)})')
+        return ' OR '.join(terms)
+
+    def _select_params(self) -> List[Any]:
+        """Creates parameters of the query without rendering.
+        The same parameters as `_where_sql` adds.
+
+        Returns:
+            List[Any]: The parameters of the query.
+        """
+        params = self._conditions_params([])
+        values = self._after
+        if values is None:
+            return params
+        param_value = self._adapter.param_value
+        if len({desc for _, desc in self._order}) == 1:
+            params.extend(param_value(value) for value in values)
+        else:
+            for index in range(len(values)):
+                params.extend(param_value(value) for value in values[:index + 1])
+        return params
+
+    def _order_sql(self, qualify: Callable[[Column], str]) -> List[str]:
+        """SQL of the ORDER BY columns."""
+        order = self._adapter.order
+        return [order(qualify(column), desc) for column, desc in self._order]
+
+    def _order_key(self, qualify: Callable[[Column], str]) -> Tuple[Hashable, ...]:
+        """The shape of the order and the keyset condition."""
+        return (tuple((qualify(column), desc) for column, desc in self._order),
+                self._after is not None)
+
+    def _join_clauses(self) -> List[str]:
+        """SQL of joins added by `join` and `outerjoin`."""
+        qualify = self._qualify
+        return [self._adapter.join(model.__schema__.tablename,
+                                   f'{qualify(left)} = {qualify(right)}',
+                                   outer=outer)
+                for model, left, right, outer in self._joins]
+
+    def _joins_key(self) -> Tuple[Hashable, ...]:
+        """The shape of joins added by `join` and `outerjoin`."""
+        return tuple((model.__schema__.tablename, left.name, right.name, outer)
+                     for model, left, right, outer in self._joins)
+
+    def join(self, model, on: Tuple[Column, Column] | None = None):
+        """Joins the table of the model by INNER JOIN.
+        Rows of the query become tuples of models: 
+        the model of the query followed by joined models in order of joins.
+        Columns of joined models can be used in conditions.
+
+        Example:
+            rows = session.query(Project).join(User).\
+                where(User.is_admin, True).all()
+            for project, user in rows:
+                ...
+
+        Args:
+            model(Model): The joining model.
+            on: The pair of equal columns: the column of the query model 
+             (or the joined model) and the column of the joining model.
+             Found by Foreign Keys if None.
 
         Returns:
             self: Query object for rows fetching.
+
+        Raises:
+            JoinError: The table is already in the query 
+             or the Foreign Key is not found.
+            ColumnNotFoundError: The column of `on` is not in the query.
         """
-        value = column.type.insert_value(value, self._adapter)
-        self._conditions.append(f'{column.name} {condition} {value}')
-        return self
+        return self._add_join(model, on, outer=False)
 
-    def and_(self, column: Column, value: Any, condition: str = '='):
-        """Adds AND condition to query.
-        Use `where` first!
-        For getting row(s) use `first` or `all` method.
+    def outerjoin(self, model, on: Tuple[Column, Column] | None = None):
+        """Joins the table of the model by LEFT OUTER JOIN.
+        The joined model is None in rows without the pair.
+        Check out `join`.
 
         Args:
-            column: Condition column.
-            value: Condition value.
-            condition: Condition. For example: `=`, `LIKE`, `IN`.
-            `=` by default.
+            model(Model): The joining model.
+            on: The pair of equal columns. Found by Foreign Keys if None.
 
         Returns:
             self: Query object for rows fetching.
         """
-        value = column.type.insert_value(value, self._adapter)
-        self._conditions.append(f'AND {column.name} {condition} {value}')
+        return self._add_join(model, on, outer=True)
+
+    def _add_join(self, model, on: Tuple[Column, Column] | None, outer: bool):
+        """Adds the join. Check out `join`."""
+        tablename = model.__schema__.tablename
+        if tablename in self._column_tables.values():
+            raise JoinError(f'Table {tablename} is already in the query.')
+        left, right = on if on is not None else self._foreign_key_on(model)
+        tables = dict(self._column_tables)
+        tables.update((id(column), tablename) for column in model.__schema__.columns)
+        for column in (left, right):
+            if id(column) not in tables:
+                raise ColumnNotFoundError(
+                    f'Column {column.name} is not a column of the query tables.')
+        self._column_tables = tables
+        self._joins.append((model, left, right, outer))
         return self
 
-    def or_(self, column: Column, value: Any, condition: str = '='):
-        """Adds OR condition to query.
-        Use `where` first!
-        For getting row(s) use `first` or `all` method.
+    def _foreign_key_on(self, model) -> Tuple[Column, Column]:
+        """Finds the join columns by Foreign Keys between the model 
+        and the models of the query.
 
         Args:
-            column: Condition column.
-            value: Condition value.
-            condition: Condition. For example: `=`, `LIKE`, `IN`.
-            `=` by default.
+            model(Model): The joining model.
+
+        Returns:
+            Tuple[Column, Column]: The column of the query and the column of the model.
+
+        Raises:
+            JoinError: The Foreign Key is not found.
+        """
+        schema = model.__schema__
+        for other in [self._model_class] + [join[0] for join in self._joins]:
+            other_schema = other.__schema__
+            for foreign_key in schema.foreign_keys:
+                if foreign_key.parent_tablename == other_schema.tablename:
+                    return (self._named_column(other_schema, foreign_key.parent_key_columns),
+                            self._named_column(schema, foreign_key.key_column))
+            for foreign_key in other_schema.foreign_keys:
+                if foreign_key.parent_tablename == schema.tablename:
+                    return (self._named_column(other_schema, foreign_key.key_column),
+                            self._named_column(schema, foreign_key.parent_key_columns))
+        raise JoinError(
+            f'No Foreign Key between {schema.tablename} and the query tables.')
+
+    @staticmethod
+    def _named_column(schema, name: str) -> Column:
+        """Finds the column of the schema by the name of the Foreign Key.
+
+        Raises:
+            JoinError: The column is not found.
+        """
+        index = schema.column_index.get(name.strip().strip('"'))
+        if index is None:
+            raise JoinError(f'Column {name} is not a column of {schema.tablename}.')
+        return schema.columns[index]
+
+    def _qualify(self, column: Column) -> str:
+        """The name of the column qualified by the table.
+
+        Raises:
+            ColumnNotFoundError: The column is not a column of the query tables.
+        """
+        tablename = self._column_tables.get(id(column))
+        if tablename is None:
+            raise ColumnNotFoundError(
+                f'Column {column.name} is not a column of the query tables.')
+        return f'{tablename}.{column.name}'
+
+    def load(self, relationship: Relationship, strategy: str = SELECTIN):
+        """Loads related rows of the relationship with rows of the query.
+        Related rows of all rows are loaded at once, not by a query per row.
+        `selectin` loads them by `IN` queries after rows of the query,
+        one query per chunk of the driver parameters limit.
+        `joined` loads them by LEFT OUTER JOIN in the query.
+        One-to-many relationships of `first` and queries with `limit`
+        are loaded by `selectin`, JOIN rows can not be limited by rows.
+        Loaded by `first`, `all` and `iter` (`iter` uses `selectin` by batches).
+
+        Example:
+            projects = session.query(Project).load(Project.user).all()
+            users = {project.user for project in projects}
+
+        Args:
+            relationship: The relationship of the model.
+            strategy: `selectin` or `joined`. `selectin` by default.
 
         Returns:
             self: Query object for rows fetching.
+
+        Raises:
+            RelationshipError: The relationship is not a relationship of the model.
+            ValueError: The strategy is unknown.
         """
-        value = column.type.insert_value(value, self._adapter)
-        self._conditions.append(f'OR {column.name} {condition} {value}')
+        if strategy not in (SELECTIN, JOINED):
+            raise ValueError(
+                f'Unknown load strategy {strategy}. Use {SELECTIN} or {JOINED}.')
+        relationship_of(self._model_class, relationship)
+        self._loads.append((relationship, strategy))
         return self
 
+    def _joined(self) -> List[Relationship]:
+        """The relationships loaded by JOIN. 
+        Relationships of queries with `join` are loaded by `selectin`."""
+        if self._joins:
+            return []
+        return [relationship for relationship, strategy in self._loads
+                if strategy == JOINED and
+                (not relationship.many or self._limit is None)]
+
     def limit(self, limit: int):
         """Sets limit by rows to query.
         For getting row(s) use `first` or `all` method.
@@ -104,18 +413,355 @@ class Query(Generic[_T]):
         self._limit = limit
         return self
 
+    def order_by(self, column: Column, desc: bool = False):
+        """Adds the column to ORDER BY of query.
+        Call many times for ordering by many columns.
+
+        Example:
+            users = session.query(User).order_by(User.email, desc=True).all()
+
+        Args:
+            column: The ordering column.
+            desc: Descending order if True. Ascending by default.
+
+        Returns:
+            self: Query object for rows fetching.
+
+        Raises:
+            ColumnNotFoundError: The column is not a column of the query tables.
+        """
+        self._qualify(column)
+        self._order.append((column, desc))
+        return self
+
+    def paginate(self, after: Any = None, page_size: int = 100) -> Page[_T]:
+        """Fetch the page of rows by keyset pagination.
+        Rows are selected by the condition on the ordered columns
+        (`WHERE (created, id) > (?, ?)`), not by OFFSET, so the database 
+        reads only rows of the page however deep the page is.
+        The Primary Key is added to `order_by` columns, 
+        so the order of rows is unique. Ordered columns should be NOT NULL.
+
+        Example:
+            query = session.query(User).order_by(User.email)
+            page = query.paginate(page_size=50)
+            while page.has_next:
+                page = query.paginate(after=page.after, page_size=50)
+
+        Args:
+            after: The key of the last row of the previous page: 
+             values of the ordered columns. `Page`.after.
+             The first page if None.
+            page_size: The maximum number of rows of the page. 100 by default.
+
+        Returns:
+            Page[_T]: The page of rows.
+
+        Raises:
+            ValueError: `page_size` is less than 1
+             or the query has no order and Primary Key.
+            TypeError: The number of key values is wrong.
+            ColumnNotFoundError: The ordered column is not selected.
+        """
+        return run(self._paginate_steps(after, page_size), self._session)
+
+    def _paginate_steps(self, after: Any, page_size: int) -> Steps[Page[_T]]:
+        """The steps of `paginate`. Check out `Steps`.
+        The page is fetched by the copy of the query, the query is not changed."""
+        if page_size < 1:
+            raise ValueError('page_size must be at least 1.')
+        query = self._copy()
+        fields = query._keyset_fields()
+        if after is not None:
+            values = tuple(after) if isinstance(after, (tuple, list)) else (after,)
+            if len(values) != len(query._order):
+                raise TypeError(
+                    f'The key takes {len(query._order)} values but {len(values)} were given.')
+            for (column, _), value in zip(query._order, values):
+                column.type.check_value(value)
+            query._after = values
+        query._limit = page_size + 1
+        items = yield from query._all_steps()
+        has_next = len(items) > page_size
+        items = items[:page_size]
+        if not items:
+            return Page(items=items, after=None, has_next=False)
+        last = items[-1][0] if self._joins else items[-1]
+        return Page(items=items, after=tuple(getattr(last, field) for field in fields),
+                    has_next=has_next)
+
+    def _copy(self) -> 'Query[_T]':
+        """Creates the copy of the query. 
+        Changes of the copy do not change the query.
+
+        Returns:
+            Query[_T]: The copy of the query.
+        """
+        query = copy(self)
+        query._conditions = list(self._conditions)
+        query._loads = list(self._loads)
+        query._joins = list(self._joins)
+        query._group_by = list(self._group_by)
+        query._having = list(self._having)
+        query._order = list(self._order)
+        query._column_tables = dict(self._column_tables)
+        return query
+
+    def _keyset_fields(self) -> List[str]:
+        """Adds the Primary Key to the order and finds field names of ordered columns.
+
+        Returns:
+            List[str]: The field names of ordered columns.
+
+        Raises:
+            ValueError: The query has no order and Primary Key.
+            ColumnNotFoundError: The ordered column is not selected.
+        """
+        schema = self._schema
+        key = schema.primary_key
+        if key is not None and all(column is not key for column, _ in self._order):
+            self._order.append((key, False))
+        if not self._order:
+            raise ValueError('Keyset pagination needs order_by or the Primary Key.')
+        fields = []
+        for column, _ in self._order:
+            if all(column is not selected for selected in self._columns):
+                raise ColumnNotFoundError(
+                    f'Column {column.name} is not a selected column of {schema.tablename}.')
+            fields.append(schema.field_names[schema.column_index[column.name]])
+        return fields
+
+    def group_by(self, *columns: Column):
+        """Groups rows by columns. Used by `aggregate`, `count` and `exists`:
+        `aggregate` returns a row per group, `count` counts groups.
+
+        Example:
+            rows = session.query(Project).group_by(Project.user_id).\
+                aggregate(count=True)
+
+        Args:
+            columns: The grouping columns.
+
+        Returns:
+            self: Query object for rows fetching.
+        """
+        self._group_by.extend(columns)
+        return self
+
+    def having(self, function: str, column: Column | None, value: Any,
+               condition: str = '='):
+        """Adds HAVING condition on the aggregate of groups to query.
+        Conditions are joined by AND. Use with `group_by`.
+
+        Example:
+            rows = session.query(Project).group_by(Project.user_id).\
+                having('count', None, 1, '>').aggregate(count=True)
+
+        Args:
+            function: `count`, `sum`, `min`, `max` or `avg`.
+            column: The aggregated column. All rows if None (for `count`).
+            value: Condition value.
+            condition: Condition. For example: `=`, `>`, `<=`.
+             `=` by default.
+
+        Returns:
+            self: Query object for rows fetching.
+
+        Raises:
+            ValueError: The function is unknown.
+        """
+        self._check_function(function)
+        operator = 'AND ' if self._having else ''
+        self._having.append((operator, function, column, condition, value))
+        return self
+
+    @staticmethod
+    def _check_function(function: str):
+        """Checks the aggregate function.
+
+        Raises:
+            ValueError: The function is unknown.
+        """
+        if function not in AGGREGATES:
+            raise ValueError(
+                f'Unknown aggregate {function}. Use one of {", ".join(AGGREGATES)}.')
+
+    def cache(self, ttl: float | None = None):
+        """Caches results of the query in the `result_cache` of the engine.
+        The key is SQL with parameters. Results are invalidated 
+        when `Insert`, `Update`, `Delete` or `Migration` of the engine
+        change the table. Changes of other processes are visible 
+        after `ttl`. SQLite reports them by `PRAGMA data_version`,
+        so the cache is cleared after them.
+        Queries of `transaction` are not cached. `iter` is not cached.
+
+        Args:
+            ttl: Seconds while the result is valid. Until invalidation if None.
+
+        Returns:
+            self: Query object for rows fetching.
+        """
+        self._cached = True
+        self._cache_ttl = ttl
+        return self
+
+    def only(self, *columns: Column):
+        """Selects only `columns` of the table.
+        Other columns of fetched models are not loaded.
+        Reading of not loaded column raises `UnloadedColumnError`.
+
+        Args:
+            columns: The columns of the model.
+
+        Returns:
+            self: Query object for rows fetching.
+
+        Raises:
+            ColumnNotFoundError: If the column is not a column of the model.
+        """
+        self._select(columns)
+        return self
+
+    def defer(self, *columns: Column):
+        """Does not select `columns` of the table.
+        For example large TEXT columns.
+        Reading of not loaded column raises `UnloadedColumnError`.
+
+        Args:
+            columns: The columns of the model.
+
+        Returns:
+            self: Query object for rows fetching.
+
+        Raises:
+            ColumnNotFoundError: If the column is not a column of the model.
+        """
+        names = {column.name for column in columns}
+        for name in names:
+            self._column_position(name)
+        self._select([column for column in self._columns
+                      if column.name not in names])
+        return self
+
+    def _select(self, columns: Sequence[Column]):
+        """Sets up selected columns and their positions in the model.
+
+        Args:
+            columns: The selected columns.
+        """
+        positions = tuple(self._column_position(column.name)
+                          for column in columns)
+        self._columns = tuple(columns)
+        if positions == tuple(range(len(self._schema.columns))):
+            self._positions = None
+        else:
+            self._positions = positions
+
+    def _column_position(self, name: str) -> int:
+        """Finds the position of the column in the model.
+
+        Args:
+            name: The column name.
+
+        Returns:
+            int: The position of the column.
+
+        Raises:
+            ColumnNotFoundError: If the column is not a column of the model.
+        """
+        position = self._schema.column_index.get(name)
+        if position is None:
+            raise ColumnNotFoundError(
+                f'Column {name} is not a column of {self._schema.tablename}.')
+        return position
+
+    def compile(self) -> CompiledQuery[_T]:
+        """Compiles the query. SQL is created once, 
+        the compiled query can be executed many times with new values
+        of conditions: `compiled.all(value1, value2)`.
+
+        Returns:
+            CompiledQuery[_T]: The compiled query.
+
+        Raises:
+            CompileError: If the query has `join`, `load` or `cache`.
+             The compiled query would ignore them.
+        """
+        if self._joins:
+            raise CompileError('The query with join can not be compiled.')
+        if self._loads:
+            raise CompileError('The query with load can not be compiled.')
+        if self._cached:
+            raise CompileError('The query with cache can not be compiled.')
+        sql, params = self._sql()
+        columns = []
+        if self._adapter.bind_params:
+            columns = [column for _, column, _, value in self._conditions
+                       if not isinstance(value, FunctionType)]
+        return self._compiled_class(self._model_class, self._adapter, self._session,
+                             sql, params, columns, self._positions)
+
     def first(self) -> _T | None:
         """Fetch the first row by query. None if not exist.
 
         Returns:
             _T | None: The first row by query. None if not exist.
         """
+        return run(self._first_steps(), self._session)
+
+    def _read_steps(self, method: str, sql: str, params: List[Any]) -> Steps[Any]:
+        """Reads the query by the session method.
+        Uses the result cache if the query is cached.
+
+        Args:
+            method: The read method of the session.
+            sql: SQL of the query.
+            params: The parameters of the query.
+
+        Returns:
+            Any: The result of the read method.
+        """
+        session = self._session
+        cache = session.result_cache
+        if not self._cached or cache is None or session.in_transaction:
+            return (yield method, (sql, params))
+        try:
+            key = (method, sql, tuple(params))
+            hash(key)
+        except TypeError:
+            return (yield method, (sql, params))
+
+        # Clears the cache if other connections changed the database.
+        yield 'data_version', ()
+        result = cache.get(key)
+        if result is not MISS:
+            return list(result) if method == 'read_all' else result
+
+        result = yield method, (sql, params)
+        cache.put(key, tuple(result) if method == 'read_all' else result,
+                  self._tables(), self._cache_ttl)
+        return result
+
+    def _tables(self) -> Tuple[str, ...]:
+        """The tables of the query. Their changes invalidate cached results."""
+        return (self._schema.tablename,) + tuple(
+            model.__schema__.tablename for model, _, _, _ in self._joins) + tuple(
+            relationship.model.__schema__.tablename
+            for relationship, _ in self._loads)
+
+    def _first_steps(self) -> Steps[_T | None]:
+        """The steps of `first`. Check out `Steps`."""
         if self._limit is None:
             self.limit(1)
-        query = self._sql()
-        one = self._session.fetch_one(query)
-
-        return self._tuple_to_model(one) if one is not None else None
+        joined = self._joined()
+        query, params = self._sql(joined=joined)
+        one = yield from self._read_steps('read_one', query, params)
+        if one is None:
+            return None
+        if not self._loads and not self._joins:
+            return self._tuple_to_model(one)
+        models = yield from self._models_steps([one], joined)
+        return models[0]
 
     def all(self) -> List[_T]:
         """Fetch all table rows by query.
@@ -123,12 +769,544 @@ class Query(Generic[_T]):
         Returns:
             List[_T]: All table rows by query
         """
-        query = self._sql()
-        all = self._session.fetch_all(query)
-        return [self._tuple_to_model(one) for one in all]
+        return run(self._all_steps(), self._session)
+
+    def _all_steps(self) -> Steps[List[_T]]:
+        """The steps of `all`. Check out `Steps`."""
+        joined = self._joined()
+        query, params = self._sql(joined=joined)
+        all = yield from self._read_steps('read_all', query, params)
+        if self._loads or self._joins:
+            return (yield from self._models_steps(all, joined))
+        from_row = self._model_class._from_row
+        add = self._session.identity_map.add
+        positions = self._positions
+        if positions is None:
+            return [add(from_row(one)) for one in all]
+        return [add(from_row(one, positions)) for one in all]
+
+    def _models_steps(self, rows: List[Tuple[Any, ...]],
+                      joined: Sequence[Relationship]) -> Steps[List[_T]]:
+        """Creates models of rows and loads their relationships.
+
+        Args:
+            rows: The database response.
+            joined: The relationships loaded by JOIN. 
+             Their columns follow the selected columns in rows.
+
+        Returns:
+            List[_T]: Models (tuples of models with `join`) 
+             with loaded relationships.
+        """
+        if not joined:
+            make = self._row_factory()
+            models = [make(one) for one in rows]
+        else:
+            models = self._joined_models(rows, joined)
+        yield from self._load_steps(models, joined)
+        return models
+
+    def _load_steps(self, models: List[_T],
+                    joined: Sequence[Relationship] = ()) -> Steps[List[_T]]:
+        """Loads relationships of models which are not loaded by JOIN.
+
+        Args:
+            models: The rows of the query. Models or tuples of models with `join`.
+            joined: The relationships loaded by JOIN.
+
+        Returns:
+            List[_T]: `models`.
+        """
+        if not self._loads:
+            return models
+        main = [row[0] for row in models] if self._joins else models
+        for relationship, _ in self._loads:
+            if relationship not in joined:
+                yield from self._selectin_steps(relationship, main)
+        return models
+
+    def _row_factory(self) -> Callable[[Sequence[Any]], Any]:
+        """Creates the function which makes the row of the query
+        from the database response: the model or the tuple of models with `join`.
+        The joined model of the outer join is None if its Primary Key 
+        (or all values if the model has no Primary Key) is NULL.
+
+        Returns:
+            Callable[[Sequence[Any]], Any]: The row function.
+        """
+        from_row = self._model_class._from_row
+        add = self._session.identity_map.add
+        positions = self._positions
+        if not self._joins:
+            return lambda one: add(from_row(one, positions))
+
+        width = len(self._columns)
+        parts = []
+        start = width
+        for model, _, _, _ in self._joins:
+            schema = model.__schema__
+            stop = start + len(schema.columns)
+            parts.append((model._from_row, start, stop, schema.primary_key_index))
+            start = stop
+
+        def make(one: Sequence[Any]) -> Tuple[Any, ...]:
+            row = [add(from_row(one[:width], positions))]
+            for part_from_row, start, stop, key in parts:
+                values = one[start:stop]
+                if values[key] is None if key is not None else \
+                        all(value is None for value in values):
+                    row.append(None)
+                else:
+                    row.append(add(part_from_row(values)))
+            return tuple(row)
+
+        return make
+
+    def _joined_models(self, rows: List[Tuple[Any, ...]],
+                       joined: Sequence[Relationship]) -> List[_T]:
+        """Creates models and related models of JOIN rows.
+        Rows of one-to-many relationships repeat the model, 
+        the model is returned once.
+
+        Args:
+            rows: The database response.
+            joined: The relationships loaded by JOIN.
+
+        Returns:
+            List[_T]: Models with loaded relationships.
+        """
+        from_row = self._model_class._from_row
+        add = self._session.identity_map.add
+        positions = self._positions
+        width = len(self._columns)
+        slices = []
+        for relationship in joined:
+            schema = relationship.model.__schema__
+            stop = width + len(schema.columns)
+            remote = width + schema.column_index[relationship.remote.name]
+            slices.append((relationship, width, stop, remote))
+            width = stop
+
+        models: Dict[int, _T] = {}
+        many: Dict[Tuple[int, Relationship], Dict[int, Any]] = {}
+        for one in rows:
+            model = add(from_row(one[:len(self._columns)], positions))
+            models.setdefault(id(model), model)
+            for relationship, start, stop, remote in slices:
+                related = None
+                if one[remote] is not None:
+                    related = add(relationship.model._from_row(one[start:stop]))
+                if relationship.many:
+                    found = many.setdefault((id(model), relationship), {})
+                    if related is not None:
+                        found.setdefault(id(related), related)
+                else:
+                    relationship.__set__(model, related)
+        for (model_id, relationship), found in many.items():
+            relationship.__set__(models[model_id], list(found.values()))
+        return list(models.values())
+
+    def _selectin_steps(self, relationship: Relationship,
+                        models: List[Any]) -> Steps[None]:
+        """Loads related rows of models by `IN` queries.
+        One query per chunk of the driver parameters limit.
+
+        Args:
+            relationship: The relationship of the model.
+            models: The rows of the model.
+
+        Raises:
+            RelationshipError: The column of the relationship is not loaded.
+        """
+        schema = self._schema
+        local_index = schema.column_index[relationship.local.name]
+        keys = {}
+        for model in models:
+            key = model._values[local_index]
+            if key is UNLOADED:
+                raise RelationshipError(
+                    f'Column {relationship.local.name} of {relationship.name} is not loaded.')
+            if key is not None:
+                keys[key] = None
+
+        related_model = relationship.model
+        related_schema = related_model.__schema__
+        remote_name = relationship.remote.name
+        remote_index = related_schema.column_index[remote_name]
+        columns = [column.name for column in related_schema.columns]
+        adapter = self._adapter
+        from_row = related_model._from_row
+        add = self._session.identity_map.add
+        found: Dict[Any, List[Any]] = {}
+        key_list = list(keys)
+        for start in range(0, len(key_list), adapter.max_params):
+            params: List[Any] = []
+            placeholders = ', '.join(
+                adapter.bind(key, params)
+                for key in key_list[start:start + adapter.max_params])
+            sql = adapter.select(
+                table=related_schema.tablename,
+                columns=columns,
+                where=[f'{remote_name} IN ({placeholders})'],
+            )
+            rows = yield 'read_all', (sql, params)
+            for one in rows:
+                related = add(from_row(one))
+                found.setdefault(related._values[remote_index], []).append(related)
+
+        for model in models:
+            related = found.get(model._values[local_index], [])
+            if relationship.many:
+                relationship.__set__(model, list(related))
+            else:
+                relationship.__set__(model, related[0] if related else None)
+
+    def iter(self, batch_size: int = 1000) -> Iterator[_T]:
+        """Iterate over table rows by query.
+        Rows are fetched from the database by batches,
+        so no more than `batch_size` rows are kept in memory at once.
+        `for row in query:` is the same as `for row in query.iter():`.
+
+        Args:
+            batch_size: The number of rows fetched at once. 1000 by default.
+
+        Returns:
+            Iterator[_T]: Table rows by query.
+        """
+        make = self._row_factory()
+        query, params = self._sql()
+        rows = self._session.read_many(query, batch_size, params)
+        if not self._loads:
+            for one in rows:
+                yield make(one)
+            return
+        batch = []
+        for one in rows:
+            batch.append(make(one))
+            if len(batch) >= batch_size:
+                yield from run(self._load_steps(batch), self._session)
+                batch = []
+        if batch:
+            yield from run(self._load_steps(batch), self._session)
+
+    def __iter__(self) -> Iterator[_T]:
+        return self.iter()
+
+    def tuples(self) -> List[Tuple[Any, ...]]:
+        """Fetch all table rows by query as tuples.
+        Values are in the order of the selected columns.
+        Does not create models.
+
+        Returns:
+            List[Tuple[Any, ...]]: All table rows by query.
+        """
+        return run(self._tuples_steps(), self._session)
+
+    def _tuples_steps(self) -> Steps[List[Tuple[Any, ...]]]:
+        """The steps of `tuples`. Check out `Steps`."""
+        all = yield from self._read_steps('read_all', *self._sql())
+        decoders = self._decoders()
+        if not decoders:
+            return all
+        return [self._decode(one, decoders) for one in all]
+
+    def dicts(self) -> List[Dict[str, Any]]:
+        """Fetch all table rows by query as dictionaries.
+        Keys are the model field names. Does not create models.
+
+        Returns:
+            List[Dict[str, Any]]: All table rows by query.
+        """
+        return run(self._dicts_steps(), self._session)
+
+    def _dicts_steps(self) -> Steps[List[Dict[str, Any]]]:
+        """The steps of `dicts`. Check out `Steps`."""
+        field_names = self._field_names()
+        tuples = yield from self._tuples_steps()
+        return [dict(zip(field_names, one)) for one in tuples]
+
+    def named(self) -> List[NamedTuple]:
+        """Fetch all table rows by query as named tuples.
+        Fields are the model field names. Does not create models.
+        The row class is created once per fields shape.
+
+        Returns:
+            List[NamedTuple]: All table rows by query.
+        """
+        return run(self._named_steps(), self._session)
+
+    def _named_steps(self) -> Steps[List[NamedTuple]]:
+        """The steps of `named`. Check out `Steps`."""
+        make = _row_class(self._field_names())._make
+        tuples = yield from self._tuples_steps()
+        return [make(one) for one in tuples]
+
+    def scalars(self, column: Column) -> List[Any]:
+        """Fetch values of the one column by query.
+        Selects only this column. Does not create models.
+
+        Args:
+            column: The column of the model.
+
+        Returns:
+            List[Any]: The column values of all table rows by query.
+        """
+        return run(self._scalars_steps(column), self._session)
+
+    def _scalars_steps(self, column: Column) -> Steps[List[Any]]:
+        """The steps of `scalars`. Check out `Steps`."""
+        all = yield from self._read_steps('read_all', *self._sql([column]))
+        fix_value = column.type.fix_value
+        if fix_value.__func__ is ColumnType.fix_value:
+            return [one[0] for one in all]
+        return [fix_value(one[0]) if one[0] is not None else None
+                for one in all]
+
+    def count(self) -> int:
+        """Counts rows by query by `COUNT(*)` in the database.
+        Counts groups with `group_by`. Does not fetch rows.
+
+        Returns:
+            int: The number of rows.
+        """
+        return run(self._count_steps(), self._session)
+
+    def _count_steps(self) -> Steps[int]:
+        """The steps of `count`. Check out `Steps`."""
+        if self._group_by or self._limit is not None:
+            expressions = self._row_expressions()
+            sql, params = self._aggregate_sql(expressions, self._limit, wrap=True)
+        else:
+            sql, params = self._aggregate_sql([('count', None)], None)
+        one = yield from self._read_steps('read_one', sql, params)
+        return one[0]
+
+    def exists(self) -> bool:
+        """Checks if rows by query exist. Fetches one value at most.
+
+        Returns:
+            bool: True if rows exist.
+        """
+        return run(self._exists_steps(), self._session)
+
+    def _exists_steps(self) -> Steps[bool]:
+        """The steps of `exists`. Check out `Steps`."""
+        limit = 1 if self._limit is None or self._limit > 1 else self._limit
+        sql, params = self._aggregate_sql(self._row_expressions(), limit)
+        one = yield from self._read_steps('read_one', sql, params)
+        return one is not None
+
+    def aggregate(self, count: bool = False,
+                  sum: Column | Sequence[Column] | None = None,
+                  min: Column | Sequence[Column] | None = None,
+                  max: Column | Sequence[Column] | None = None,
+                  avg: Column | Sequence[Column] | None = None) -> Any:
+        """Computes aggregates of rows by query in the database.
+        Does not create models. Fields of rows are grouping columns 
+        (the field names of the model) followed by `count` 
+        and aggregates named `{function}_{field}`: `sum_age`.
+        Values of `min` and `max` are decoded like values of the column.
+
+        Example:
+            row = session.query(User).aggregate(count=True, max=User.id)
+            row.count, row.max_id
+
+        Args:
+            count: Counts rows if True.
+            sum: The column(s) for SUM.
+            min: The column(s) for MIN.
+            max: The column(s) for MAX.
+            avg: The column(s) for AVG.
+
+        Returns:
+            NamedTuple | List[NamedTuple]: The row of aggregates.
+             The list of rows per group with `group_by`.
+
+        Raises:
+            ValueError: No aggregate is passed.
+        """
+        return run(self._aggregate_steps(
+            self._aggregates(count, sum=sum, min=min, max=max, avg=avg)),
+            self._session)
+
+    def _aggregates(self, count: bool, **columns: Column | Sequence[Column] | None
+                    ) -> List[Tuple[str | None, Column | None]]:
+        """The expressions of `aggregate`: grouping columns and aggregates.
+
+        Raises:
+            ValueError: No aggregate is passed.
+        """
+        expressions: List[Tuple[str | None, Column | None]] = []
+        if count:
+            expressions.append(('count', None))
+        for function, value in columns.items():
+            if value is None:
+                continue
+            values = [value] if isinstance(value, Column) else value
+            expressions.extend((function, column) for column in values)
+        if not expressions:
+            raise ValueError('Pass at least one aggregate.')
+        return [(None, column) for column in self._group_by] + expressions
+
+    def _aggregate_steps(self, expressions: List[Tuple[str | None, Column | None]]
+                         ) -> Steps[Any]:
+        """The steps of `aggregate`. Check out `Steps`."""
+        sql, params = self._aggregate_sql(expressions, self._limit)
+        all = yield from self._read_steps('read_all', sql, params)
+        field_names = []
+        decoders = []
+        for index, (function, column) in enumerate(expressions):
+            if column is None:
+                field_names.append(function)
+                continue
+            field = self._column_field(column)
+            field_names.append(field if function is None else f'{function}_{field}')
+            fix_value = column.type.fix_value
+            if function in (None, 'min', 'max') and \
+                    fix_value.__func__ is not ColumnType.fix_value:
+                decoders.append((index, fix_value))
+        make = _row_class(tuple(field_names))._make
+        rows = [make(self._decode(one, decoders)) for one in all]
+        return rows if self._group_by else rows[0]
+
+    def _row_expressions(self) -> List[Tuple[str | None, Column | None]]:
+        """The expressions selecting a value per row (or per group) of the query."""
+        if self._group_by:
+            return [(None, column) for column in self._group_by]
+        return [(None, self._schema.columns[0])]
+
+    def _aggregate_sql(self, expressions: Sequence[Tuple[str | None, Column | None]],
+                       limit: int | None, wrap: bool = False) -> Tuple[str, List[Any]]:
+        """Creates SQL of aggregates with GROUP BY and HAVING.
+
+        Args:
+            expressions: The pairs of the aggregate function and the column.
+             The function is None for a plain column,
+             the column is None for all rows (`COUNT(*)`).
+            limit: The limit of rows.
+            wrap: Counts rows of the query if True.
+
+        Returns:
+            Tuple[str, List[Any]]: SQL query and its parameters.
+        """
+        adapter = self._adapter
+        tablename = self._schema.tablename
+        qualify = self._qualify if self._joins else _column_name
+        key = ('aggregate', tablename,
+               tuple((function, qualify(column) if column is not None else None)
+                     for function, column in expressions),
+               self._joins_key(),
+               tuple(qualify(column) for column in self._group_by),
+               tuple((operator, function,
+                      qualify(column) if column is not None else None, condition,
+                      value(adapter) if isinstance(value, FunctionType) else None)
+                     for operator, function, column, condition, value in self._having),
+               self._conditions_key(qualify), self._order_key(qualify), limit, wrap)
+
+        def expression(function: str | None, column: Column | None) -> str:
+            if function is None:
+                return qualify(column)
+            return adapter.aggregate(
+                function, qualify(column) if column is not None else None)
+
+        def render(params: List[Any]) -> str:
+            names = [expression(function, column) for function, column in expressions]
+            sql = adapter.select(
+                table=tablename,
+                columns=names,
+                where=self._where_sql(params, qualify if self._joins else None),
+                limit=limit,
+                joins=self._join_clauses(),
+                group_by=[qualify(column) for column in self._group_by],
+                having=[f'{operator}{expression(function, column)} '
+                        f'{condition} {adapter.bind(value, params)}'
+                        for operator, function, column, condition, value in self._having],
+                order_by=(self._order_sql(qualify)
+                          if self._group_by and not wrap else None),
+            )
+            return adapter.count(sql) if wrap else sql
+
+        def params() -> List[Any]:
+            values = self._select_params()
+            param_value = adapter.param_value
+            values.extend(param_value(value) for _, _, _, _, value in self._having
+                          if not isinstance(value, FunctionType))
+            return values
+
+        return self._cached_sql(key, render, params)
+
+    def _column_field(self, column: Column) -> str:
+        """The field name of the column. 
+        Prefixed by the table name with `join`: `user_email`.
+
+        Raises:
+            ColumnNotFoundError: The column is not a column of the query tables.
+        """
+        for model in [self._model_class] + [join[0] for join in self._joins]:
+            schema = model.__schema__
+            for index, other in enumerate(schema.columns):
+                if other is column:
+                    name = schema.field_names[index]
+                    return f'{schema.tablename}_{name}' if self._joins else name
+        raise ColumnNotFoundError(
+            f'Column {column.name} is not a column of the query tables.')
+
+    def _field_names(self) -> Tuple[str, ...]:
+        """The field names of the selected columns.
+        Names are prefixed by the table name with `join`: `user_email`."""
+        field_names = self._schema.field_names
+        if self._positions is not None:
+            field_names = tuple(field_names[index] for index in self._positions)
+        if not self._joins:
+            return field_names
+        tablename = self._schema.tablename
+        names = [f'{tablename}_{name}' for name in field_names]
+        for model, _, _, _ in self._joins:
+            schema = model.__schema__
+            names.extend(f'{schema.tablename}_{name}' for name in schema.field_names)
+        return tuple(names)
+
+    def _decoders(self) -> Tuple[Tuple[int, Callable[[Any], Any]], ...]:
+        """`ModelSchema`.decoders of the selected columns.
+        With `join` decoders of joined models follow."""
+        decoders = self._schema.decoders
+        if self._positions is not None and decoders:
+            decoder_map = dict(decoders)
+            decoders = tuple((i, decoder_map[index])
+                             for i, index in enumerate(self._positions)
+                             if index in decoder_map)
+        if not self._joins:
+            return decoders
+        decoders = list(decoders)
+        start = len(self._columns)
+        for model, _, _, _ in self._joins:
+            schema = model.__schema__
+            decoders.extend((start + index, decode) for index, decode in schema.decoders)
+            start += len(schema.columns)
+        return tuple(decoders)
+
+    def _decode(self, result: Tuple[Any], decoders) -> Tuple[Any, ...]:
+        """Decodes the database response.
+        Check out `ModelSchema`.decoders.
+
+        Args:
+            result: database response.
+            decoders: The column position and decoder pairs.
+
+        Returns:
+            Tuple[Any, ...]: Decoded values.
+        """
+        values = list(result)
+        for index, decode in decoders:
+            value = values[index]
+            if value is not None:
+                values[index] = decode(value)
+        return tuple(values)
 
     def _tuple_to_model(self, result: Tuple[Any]) -> _T:
         """Convert tuple - database response to Model.
+        Values from the database are trusted and are not validated.
+        The row of the session identity map is returned if it exists.
 
         Args:
             result: database response.
@@ -136,7 +1314,5 @@ class Query(Generic[_T]):
         Returns:
             _T: Model.
         """
-        kwargs: Dict[str, Any] = {}
-        for i, item in enumerate(result):
-            kwargs[self._model.column_values.columns[i].field_name] = item
-        return self._model_class(**kwargs)
+        return self._session.identity_map.add(
+            self._model_class._from_row(result, self._positions))
@@ -0,0 +1,56 @@
+from typing import Any, Generator, Tuple, TypeVar
+
+_R = TypeVar('_R')
+
+Steps = Generator[Tuple[str, Tuple[Any, ...]], Any, _R]
+"""The stmp logic without I/O. The generator yields session calls
+(the method name and arguments), receives their results 
+and returns the result of the stmp. Errors of session calls are thrown
+into the generator, so steps can clean up. The same steps are run by 
+`Session` (`run`) and by `AsyncSession` (`run_async`)."""
+
+
+def run(steps: Steps[_R], session) -> _R:
+    """Runs steps by the session.
+
+    Args:
+        steps: The steps of the stmp.
+        session(Session): The session for executing steps.
+
+    Returns:
+        _R: The result of the stmp.
+    """
+    try:
+        method, args = next(steps)
+        while True:
+            try:
+                result = getattr(session, method)(*args)
+            except BaseException as error:
+                method, args = steps.throw(error)
+            else:
+                method, args = steps.send(result)
+    except StopIteration as stop:
+        return stop.value
+
+
+async def run_async(steps: Steps[_R], session) -> _R:
+    """Runs steps by the async session.
+
+    Args:
+        steps: The steps of the stmp.
+        session(AsyncSession): The session for executing steps.
+
+    Returns:
+        _R: The result of the stmp.
+    """
+    try:
+        method, args = next(steps)
+        while True:
+            try:
+                result = await getattr(session, method)(*args)
+            except BaseException as error:
+                method, args = steps.throw(error)
+            else:
+                method, args = steps.send(result)
+    except StopIteration as stop:
+        return stop.value
@@ -27,7 +27,7 @@ class TableInfo:
         Return:
             List[ColumnInfo]: The columns information.
         """
-        sql = self._adapter.table_columns_info(self.model.tn())
+        sql = self._adapter.table_columns_info(self.model.__schema__.tablename)
         rows = self._session.fetch_all(sql)
         infos = []
         for row in rows:
@@ -41,11 +41,11 @@ class TableInfo:
         Return:
             List[ColumnInfo]: The constraints information.
         """
-        sql = self._adapter.table_constraints_info(self.model.tn())
+        sql = self._adapter.table_constraints_info(self.model.__schema__.tablename)
         rows = self._session.fetch_all(sql)
         infos = []
         for row in rows:
             info = self._adapter.constrains_info_row_to_constrains_info(
-                row, self.model.tn())
+                row, self.model.__schema__.tablename)
             infos.append(info)
         return infos
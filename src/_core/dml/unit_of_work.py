@@ -0,0 +1,236 @@
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Tuple
+from .bulk_update import BulkUpdate
+from .insert import Insert
+from .steps import run
+from ..ddl.model import Model, UNLOADED
+from ..drivers.sql_adapter import SqlAdapter
+
+
+def dependency_order(models: List[type]) -> List[type]:
+    """Sorts models so that parent tables go before child tables.
+    Parents are found by Foreign Keys. Models of a cycle keep 
+    the original order.
+
+    Args:
+        models: The models.
+
+    Returns:
+        List[type]: The models in the order of inserting.
+    """
+    by_table = {model.__schema__.tablename: model for model in models}
+    parents = {
+        model: {by_table[fk.parent_tablename]
+                for fk in model.__schema__.foreign_keys
+                if fk.parent_tablename in by_table
+                and by_table[fk.parent_tablename] is not model}
+        for model in models}
+    ordered: List[type] = []
+    while len(ordered) < len(models):
+        ready = [model for model in models
+                 if model not in ordered and parents[model].issubset(ordered)]
+        if not ready:
+            ready = [model for model in models if model not in ordered][:1]
+        ordered.extend(ready)
+    return ordered
+
+
+class UnitOfWork:
+    """Pending changes of the session.
+    New rows are inserted, changed columns of persistent rows are updated
+    and removed rows are deleted by `flush` in batched stmps.
+
+    Args:
+        adapter: The SQL adapter for different drivers.
+        session(Session): The session for executing stmps.
+    """
+
+    def __init__(self, adapter: SqlAdapter, session):
+        self._adapter = adapter
+        self._session = session
+        self._added: Dict[int, Model] = {}
+        self._removed: Dict[int, Model] = {}
+
+    def add(self, item: Model):
+        """Adds the row to the unit of work.
+        The new row is inserted, the persistent row is updated 
+        by changed columns.
+
+        Args:
+            item: The row.
+        """
+        self._removed.pop(id(item), None)
+        self._added[id(item)] = item
+
+    def remove(self, item: Model):
+        """Marks the row for deleting. The new row is just forgotten.
+
+        Args:
+            item: The row.
+        """
+        self._added.pop(id(item), None)
+        if item._persistent:
+            self._removed[id(item)] = item
+
+    def flush(self, items: Iterable[Model] = ()):
+        """Executes pending changes in one transaction.
+        Inserts go parents first, then updates, 
+        then deletes go children first.
+        Stmps are grouped by table and shape.
+
+        Args:
+            items: Other rows which are checked for changes.
+             For example rows of the identity map.
+        """
+        added = list(self._added.values())
+        removed = list(self._removed.values())
+        inserts: Dict[type, List[Model]] = {}
+        updates: Dict[type, List[Model]] = {}
+        for item in added:
+            group = updates if item._persistent else inserts
+            group.setdefault(type(item), []).append(item)
+        for item in items:
+            if item._persistent and item._dirty and id(item) not in self._added \
+                    and id(item) not in self._removed:
+                updates.setdefault(type(item), []).append(item)
+        deletes: Dict[type, List[Model]] = {}
+        for item in removed:
+            deletes.setdefault(type(item), []).append(item)
+
+        flushing = [item for rows in (*inserts.values(), *updates.values())
+                    for item in rows]
+        snapshot = self._snapshot(flushing)
+        try:
+            with self._session.transaction():
+                for model in dependency_order(list(inserts)):
+                    Insert(self._adapter, self._session).\
+                        add_items(inserts[model]).commit()
+                for model, rows in updates.items():
+                    rows = [row for row in rows if row._dirty]
+                    self._update(model, rows)
+                for model in reversed(dependency_order(list(deletes))):
+                    self._delete(model, deletes[model])
+        except BaseException:
+            self._restore(snapshot)
+            raise
+
+        for item in removed:
+            item._persistent = False
+            self._session.identity_map.discard(item)
+        self._added.clear()
+        self._removed.clear()
+
+    def _snapshot(self, items: List[Model]) -> List[Tuple[Model, bool, List[Any], Any, bool]]:
+        """Keeps the state of rows changed by `flush`: 
+        `_persistent`, values (the Primary Key of inserted rows), 
+        `_dirty` and the membership in the identity map.
+
+        Args:
+            items: The inserting and updating rows.
+
+        Returns:
+            List[Tuple[Model, bool, List[Any], Any, bool]]: The state of rows.
+        """
+        identity_map = self._session.identity_map
+        snapshot = []
+        for item in items:
+            index = item.__schema__.primary_key_index
+            mapped = index is not None and \
+                identity_map.get(type(item), item._values[index]) is item
+            dirty = set(item._dirty) if item._dirty is not None else None
+            snapshot.append((item, item._persistent, list(item._values), dirty, mapped))
+        return snapshot
+
+    def _restore(self, snapshot: List[Tuple[Model, bool, List[Any], Any, bool]]):
+        """Restores the state of rows after the rolled back `flush`,
+        so the flush can be retried. Check out `_snapshot`.
+
+        Args:
+            snapshot: The state of rows.
+        """
+        identity_map = self._session.identity_map
+        for item, persistent, values, dirty, mapped in snapshot:
+            if not mapped:
+                identity_map.discard(item)
+            item._values[:] = values
+            item._dirty = dirty
+            item._persistent = persistent
+
+    def _update(self, model, rows: List[Model]):
+        """Updates changed columns of rows.
+
+        Args:
+            model(Model): Table model.
+            rows: The changed rows.
+
+        Raises:
+            ValueError: The model has no Primary Key or the Primary Key
+             of the row is changed. Rows are found by the key, 
+             the original key value is not kept.
+        """
+        if not rows:
+            return
+        schema = model.__schema__
+        key = schema.primary_key
+        if key is None:
+            raise ValueError(
+                f'{model.__name__} has no Primary Key. Rows can not be updated.')
+        for row in rows:
+            if schema.primary_key_index in row._dirty:
+                raise ValueError(
+                    f'The key {key.name} of the persistent row can not be changed.')
+        # Rows of the unit of work are the rows of the identity map,
+        # they are marked as flushed instead of expiring.
+        bulk_update = BulkUpdate(model, self._adapter, self._session)
+        run(bulk_update._commit_steps(
+            ({key.name: self._key_value(row), **row._changes()} for row in rows),
+            expire=False), self._session)
+        for row in rows:
+            row._flushed()
+
+    def _delete(self, model, rows: List[Model]):
+        """Deletes rows by Primary Key. One stmp per chunk.
+
+        Args:
+            model(Model): Table model.
+            rows: The deleting rows.
+
+        Raises:
+            ValueError: The model has no Primary Key or the key is not loaded.
+        """
+        schema = model.__schema__
+        key = schema.primary_key
+        if key is None:
+            raise ValueError(
+                f'{model.__name__} has no Primary Key. Rows can not be deleted.')
+        adapter = self._adapter
+        keys_iter = iter([self._key_value(row) for row in rows])
+        while True:
+            chunk = list(islice(keys_iter, adapter.max_params))
+            if not chunk:
+                break
+            params: List[Any] = []
+            placeholders = ', '.join([adapter.bind(value, params) for value in chunk])
+            self._session.execute(adapter.delete(
+                schema.tablename, [f'{key.name} IN ({placeholders})']), params)
+        self._session.tables_changed(schema.tablename)
+
+    @staticmethod
+    def _key_value(row: Model) -> Any:
+        """The Primary Key value of the row.
+
+        Args:
+            row: The row.
+
+        Returns:
+            Any: The Primary Key value.
+
+        Raises:
+            ValueError: The Primary Key is None or not loaded.
+        """
+        schema = row.__schema__
+        value = row._values[schema.primary_key_index]
+        if value is None or value is UNLOADED:
+            raise ValueError(
+                f'The key {schema.primary_key.name} value should be loaded.')
+        return value
@@ -1,10 +1,14 @@
-from typing import Any, Dict, List
+from types import FunctionType
+from typing import Any, Dict, List, Tuple
+from .conditional import ConditionalStmt
+from .steps import Steps, run
+from .errors import ColumnNotFoundError
 from ..drivers.sql_adapter import SqlAdapter
-from ..ddl.column import Column
 
 
-class Update:
+class Update(ConditionalStmt):
     """Update object for creating and executing updatinging stmps.
+    Use `where`, `and_`, `or_` for specifying updating rows.
 
     Args:
         model_class(Model): The model for stmp. 
@@ -12,77 +16,70 @@ class Update:
         adapter: The SQL adapter for different drivers.
         session(Session): The session for executing stmp.
         name_value: Name value mapping for SET in UPDATE stmp.
+         Names are column names of the model.
+
+    Raises:
+        ColumnNotFoundError: If the name is not a column of the model.
     """
 
     def __init__(self, model, adapter: SqlAdapter, session,
-                 name_value: Dict[str, str]):
-        self._adapter = adapter
-        self._session = session
+                 name_value: Dict[str, Any]):
+        super().__init__(adapter, session)
         self._model = model
-        self._name_value = name_value
-        self._conditions = []
-
-    def where(self, column: Column, value: Any, condition: str = '='):
-        """Adds WHERE condition to stmp.
-        For getting row(s) use `first` or `all` method.
+        schema = model.__schema__
+        self._name_value = []
+        for name, value in name_value.items():
+            index = schema.column_index.get(name)
+            if index is None:
+                raise ColumnNotFoundError(
+                    f'Column {name} is not a column of {schema.tablename}.')
+            column = schema.columns[index]
+            column.type.check_value(value)
+            self._name_value.append((column, value))
 
-        Args:
-            column: Condition column.
-            value: Condition value.
-            condition: Condition. For example: `=`, `LIKE`, `IN`.
-            `=` by default.
+    def _sql(self) -> Tuple[str, List[Any]]:
+        """Creates SQL of the stmp.
 
         Returns:
-            self: Query object for rows fetching.
+            Tuple[str, List[Any]]: SQL and its parameters.
         """
-        value = column.type.insert_value(value, self._adapter)
-        self._conditions.append(f'{column.name} {condition} {value}')
-        return self
-
-    def and_(self, column: Column, value: Any, condition: str = '='):
-        """Adds AND condition to stmp.
-        Use `where` first!
-        For getting row(s) use `first` or `all` method.
+        adapter = self._adapter
+        tablename = self._model.__schema__.tablename
 
-        Args:
-            column: Condition column.
-            value: Condition value.
-            condition: Condition. For example: `=`, `LIKE`, `IN`.
-            `=` by default.
+        def render(params: List[Any]) -> str:
+            name_value = {column.name: adapter.bind(value, params)
+                          for column, value in self._name_value}
+            return adapter.update(
+                tablename,
+                self._conditions_sql(params),
+                name_value,
+            )
 
-        Returns:
-            self: Query object for rows fetching.
-        """
-        value = column.type.insert_value(value, self._adapter)
-        self._conditions.append(f'AND {column.name} {condition} {value}')
-        return self
+        def params() -> List[Any]:
+            values = [adapter.param_value(value)
+                      for _, value in self._name_value
+                      if not isinstance(value, FunctionType)]
+            return self._conditions_params(values)
 
-    def or_(self, column: Column, value: Any, condition: str = '='):
-        """Adds OR condition to stmp.
-        Use `where` first!
-        For getting row(s) use `first` or `all` method.
+        key = ('update', tablename,
+               tuple((column.name, value(adapter) if isinstance(value, FunctionType) else None)
+                     for column, value in self._name_value),
+               self._conditions_key())
+        return self._cached_sql(key, render, params)
 
-        Args:
-            column: Condition column.
-            value: Condition value.
-            condition: Condition. For example: `=`, `LIKE`, `IN`.
-            `=` by default.
+    def commit(self) -> int:
+        """Executes UPDATE stmp
 
         Returns:
-            self: Query object for rows fetching.
+            int: The number of updated rows.
         """
-        value = column.type.insert_value(value, self._adapter)
-        self._conditions.append(f'OR {column.name} {condition} {value}')
-        return self
-
-    def commit(self):
-        """Executes UPDATE stmp"""
+        return run(self._commit_steps(), self._session)
 
-        model = self._model()
-        stmp = self._adapter.update(
-            model.__tablename__,
-            self._conditions,
-            self._name_value,
-        )
-        self._session.execute(stmp)
-        self._session.commit()
+    def _commit_steps(self) -> Steps[int]:
+        """The steps of `commit`. Check out `Steps`."""
+        stmp, params = self._sql()
+        rowcount = yield 'execute', (stmp, params)
+        self._session.identity_map.expire(self._model)
+        yield 'commit', ()
+        self._session.tables_changed(self._model.__schema__.tablename)
+        return rowcount
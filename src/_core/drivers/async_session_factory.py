@@ -0,0 +1,47 @@
+import asyncio
+from abc import ABC
+from concurrent.futures import Executor
+
+from ..async_session import AsyncSession
+from ..errors import UnknownDriverError
+from ..statement_cache import StatementCache
+from ..pool import ConnectionPool
+from ..result_cache import ResultCache
+from .sql_adapter import SqlAdapter
+
+from .psycopg2.constants import DRIVER_NAME as PSYCOPG2_DRIVER_NAME
+from .psycopg2.async_session import Psycopg2AsyncSession
+
+from .sqlite3.constants import DRIVER_NAME as SQLITE3_DRIVER_NAME
+from .sqlite3.async_session import SQLite3AsyncSession
+
+
+class AsyncSessionFactory(ABC):
+    """The AsyncSession factory."""
+
+    def create(driver: str, adapter: SqlAdapter, pool: ConnectionPool,
+               statement_cache: StatementCache, in_flight: asyncio.Semaphore,
+               executor: Executor | None = None,
+               result_cache: ResultCache | None = None) -> AsyncSession:
+        """Create `AsyncSession` by driver name.
+
+        Args:
+            driver: The name of the driver.
+            adapter: The SQL adapter for creating queries.
+            pool: The pool of connections.
+            statement_cache: The cache of SQL stmps by their shape.
+            in_flight: Bounds the number of executing stmps.
+            executor: The executor of blocking calls. sqlite3 only.
+            result_cache: The cache of query results.
+
+        Raises:
+            UnknownDriverError: If the driver is unknown.
+        """
+        if driver == PSYCOPG2_DRIVER_NAME:
+            return Psycopg2AsyncSession(adapter, pool, statement_cache, in_flight,
+                                        result_cache)
+        elif driver == SQLITE3_DRIVER_NAME:
+            return SQLite3AsyncSession(adapter, pool, statement_cache,
+                                       in_flight, executor, result_cache)
+
+        raise UnknownDriverError(f'unkknown driver {driver}')
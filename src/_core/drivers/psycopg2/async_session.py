@@ -0,0 +1,139 @@
+import asyncio
+from itertools import count
+from typing import Any, AsyncIterator, List, Sequence, Tuple
+
+import psycopg2
+import psycopg2.extensions
+
+from ...async_session import AsyncSession
+
+_cursor_ids = count()
+
+
+class Psycopg2AsyncSession(AsyncSession):
+    """Psycopg2 AsyncSession implementation on the psycopg2 asynchronous mode.
+    The connection socket is watched by the event loop, 
+    so the loop is not blocked while the database works.
+
+    The asynchronous connection is always in autocommit mode, 
+    so transactions are begun and finished by SQL. 
+    `fetch_many` uses the cursor declared by `DECLARE ... WITH HOLD`
+    because named cursors are not supported in the asynchronous mode.
+
+    If the awaiting task is cancelled, the stmp is cancelled by 
+    `connection.cancel()` and the connection is discarded by `disconnect`,
+    it is not returned to the pool in the middle of the command.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._begun = False
+        self._cursor = None
+
+    async def connect(self):
+        await super().connect()
+        self._cursor = self._connection.cursor()
+
+    async def disconnect(self):
+        if self._cursor is not None:
+            cursor, self._cursor = self._cursor, None
+            cursor.close()
+        self._begun = False
+        await super().disconnect()
+
+    async def _execute(self, sql: str, params: Sequence[Any] | None) -> int:
+        await self._run(sql, params)
+        return self._cursor.rowcount
+
+    async def _fetch_one(self, sql: str,
+                         params: Sequence[Any] | None) -> Tuple[Any] | None:
+        await self._run(sql, params)
+        return self._cursor.fetchone()
+
+    async def _fetch_all(self, sql: str,
+                         params: Sequence[Any] | None) -> List[Tuple[Any]]:
+        await self._run(sql, params)
+        return self._cursor.fetchall()
+
+    async def _fetch_batches(self, sql: str, batch_size: int,
+                             params: Sequence[Any] | None) -> AsyncIterator[List[Tuple[Any]]]:
+        name = f'orm_cursor_{next(_cursor_ids)}'
+        cursor = self._connection.cursor()
+        try:
+            await self._run(f'DECLARE {name} CURSOR WITH HOLD FOR {sql}',
+                            params, cursor)
+            try:
+                while True:
+                    await self._run(f'FETCH FORWARD {batch_size} FROM {name}',
+                                    None, cursor)
+                    rows = cursor.fetchall()
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                if not self._broken:
+                    await self._run(f'CLOSE {name}', None, cursor)
+        finally:
+            cursor.close()
+
+    async def _begin(self):
+        await self._run('BEGIN', None)
+        self._begun = True
+
+    async def _commit(self):
+        if self._begun:
+            self._begun = False
+            await self._run('COMMIT', None)
+
+    async def _rollback(self):
+        if self._begun:
+            self._begun = False
+            # The broken connection is closed, the database rolls back itself.
+            if not self._broken:
+                await self._run('ROLLBACK', None)
+
+    async def _run(self, sql: str, params: Sequence[Any] | None, cursor=None):
+        """Sends sql and waits for the result without blocking the loop."""
+        (cursor or self._cursor).execute(sql, params or None)
+        await self._wait()
+
+    async def _wait(self):
+        """Polls the connection until the operation is finished.
+        Waits for the socket by `add_reader` and `add_writer` of the loop."""
+        loop = asyncio.get_running_loop()
+        connection = self._connection
+        while True:
+            state = connection.poll()
+            if state == psycopg2.extensions.POLL_OK:
+                return
+            if state == psycopg2.extensions.POLL_READ:
+                add, remove = loop.add_reader, loop.remove_reader
+            elif state == psycopg2.extensions.POLL_WRITE:
+                add, remove = loop.add_writer, loop.remove_writer
+            else:
+                raise psycopg2.OperationalError(f'Bad poll state: {state}.')
+
+            future = loop.create_future()
+
+            def ready():
+                if not future.done():
+                    future.set_result(None)
+
+            fileno = connection.fileno()
+            add(fileno, ready)
+            try:
+                await future
+            except asyncio.CancelledError:
+                self._cancel()
+                raise
+            finally:
+                remove(fileno)
+
+    def _cancel(self):
+        """Cancels the stmp of the cancelled task. The connection 
+        is in the middle of the command, so it is discarded by `disconnect`."""
+        self._broken = True
+        try:
+            self._connection.cancel()
+        except psycopg2.Error:
+            pass
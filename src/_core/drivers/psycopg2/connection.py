@@ -1,17 +1,61 @@
 import psycopg2
+import psycopg2.extensions
+import psycopg2.extras
 
 from typing import Any
 from ...connection import Connectin
 from ...db_url import DbUrl
 
 
+def reset_async(connection: Any):
+    """Rolls back the not finished transaction of the async connection.
+    Async connections do not support `rollback`."""
+    status = connection.get_transaction_status()
+    if status == psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+        return
+    cursor = connection.cursor()
+    try:
+        cursor.execute('ROLLBACK')
+        psycopg2.extras.wait_select(connection)
+    finally:
+        cursor.close()
+
+
+def ping_async(connection: Any):
+    """Checks the async connection by `SELECT 1`."""
+    cursor = connection.cursor()
+    try:
+        cursor.execute('SELECT 1')
+        psycopg2.extras.wait_select(connection)
+        cursor.fetchall()
+    finally:
+        cursor.close()
+
+
 class Psycopg2Connection(Connectin):
     """Psycopg2 Connection implementation."""
 
     def connect(self, url: DbUrl) -> Any:
-        self.connection = psycopg2.connect(
-            f"dbname='{url.database}' host='{url.host}' port='{url.port}' user='{url.user}' password='{url.password}'")
-        return self.connection
+        return psycopg2.connect(self._dsn(url))
+
+    def connect_async(self, url: DbUrl) -> Any:
+        """Connects to database in the psycopg2 asynchronous mode.
+        Blocks until the connection is established.
+
+        Args:
+            url: The url for the database connection. 
+
+        Returns:
+            Any: The async database connection.
+        """
+        connection = psycopg2.connect(self._dsn(url), async_=True)
+        psycopg2.extras.wait_select(connection)
+        return connection
 
     def close(self):
-        self.connection.close()
+        """Connections are closed by the pool."""
+        pass
+
+    @staticmethod
+    def _dsn(url: DbUrl) -> str:
+        return f"dbname='{url.database}' host='{url.host}' port='{url.port}' user='{url.user}' password='{url.password}'"
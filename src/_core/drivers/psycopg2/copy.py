@@ -0,0 +1,100 @@
+from io import TextIOBase
+from typing import Any, Iterable, Iterator, List, Sequence
+
+from ...ddl.column import Column
+
+
+def copy_columns(schema) -> List[Column]:
+    """The columns of `COPY ... FROM STDIN` in the order of the model.
+    The autoincrement Primary Key is generated by the database
+    and is not copied.
+
+    Args:
+        schema(ModelSchema): The schema of the model.
+
+    Returns:
+        List[Column]: The copied columns.
+    """
+    return [column for column in schema.columns
+            if not (column is schema.primary_key
+                    and column.type._is_autoincrement)]
+
+
+def copy_lines(model_class, columns: Sequence[Column],
+               rows: Iterable[Any]) -> Iterator[str]:
+    """Encodes rows to lines of the `COPY` text format.
+
+    Args:
+        model_class(Model): The model of rows.
+        columns: The copied columns.
+        rows: Models or tuples of values in the order of `columns`.
+         Tuple values are checked, model values are already valid.
+
+    Returns:
+        Iterator[str]: Lines with the trailing line break.
+
+    Raises:
+        TypeError: The row is other model or has wrong number of values.
+        ValueError: The value is invalid.
+    """
+    positions = [model_class.__schema__.column_index[c.name] for c in columns]
+    for row in rows:
+        if isinstance(row, model_class):
+            values = row._values
+            yield '\t'.join([c.copy_value(values[i])
+                             for c, i in zip(columns, positions)]) + '\n'
+            continue
+        if isinstance(row, tuple) and len(row) == len(columns):
+            for column, value in zip(columns, row):
+                column.type.check_value(value)
+            yield '\t'.join([c.copy_value(value)
+                             for c, value in zip(columns, row)]) + '\n'
+            continue
+        raise TypeError(
+            f'Row {row!r} should be {model_class.__name__} '
+            f'or tuple of {len(columns)} values.')
+
+
+class CopyReader(TextIOBase):
+    """Read-only file over the iterator of lines.
+    `copy_expert` reads it by blocks, so only one block
+    of lines is kept in memory at once.
+
+    Args:
+        lines: The lines of the file.
+    """
+
+    def __init__(self, lines: Iterable[str]):
+        super().__init__()
+        self._lines = iter(lines)
+        self._buffer = ''
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> str:
+        if size is None or size < 0:
+            data = self._buffer + ''.join(self._lines)
+            self._buffer = ''
+            return data
+
+        parts = [self._buffer]
+        length = len(self._buffer)
+        for line in self._lines:
+            parts.append(line)
+            length += len(line)
+            if length >= size:
+                break
+        data = ''.join(parts)
+        self._buffer = data[size:]
+        return data[:size]
+
+    def readline(self, size: int | None = -1) -> str:
+        if not self._buffer:
+            self._buffer = next(self._lines, '')
+        end = self._buffer.find('\n') + 1 or len(self._buffer)
+        if size is not None and 0 <= size < end:
+            end = size
+        line = self._buffer[:end]
+        self._buffer = self._buffer[end:]
+        return line
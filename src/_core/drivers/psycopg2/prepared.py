@@ -0,0 +1,153 @@
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Sequence
+from weakref import WeakKeyDictionary
+
+_PREPARABLE = ('SELECT', 'INSERT', 'UPDATE', 'DELETE')
+
+_registries: 'WeakKeyDictionary[Any, PreparedStatements]' = WeakKeyDictionary()
+
+
+def to_server_params(sql: str) -> str:
+    """Replaces psycopg2 `%s` placeholders with PostgreSQL `$1`, `$2`...
+    `%%` is replaced with `%`.
+
+    Args:
+        sql: SQL with psycopg2 placeholders.
+
+    Returns:
+        str: SQL with PostgreSQL placeholders.
+    """
+    parts = []
+    number = 0
+    i = 0
+    while i < len(sql):
+        char = sql[i]
+        if char == '%' and i + 1 < len(sql):
+            next_char = sql[i + 1]
+            if next_char == 's':
+                number += 1
+                parts.append(f'${number}')
+                i += 2
+                continue
+            if next_char == '%':
+                parts.append('%')
+                i += 2
+                continue
+        parts.append(char)
+        i += 1
+    return ''.join(parts)
+
+
+class PreparedStatements:
+    """Bounded registry of server-side prepared stmps of one connection.
+    The stmp is prepared by `PREPARE` after it was executed `threshold` times.
+    The least recently used stmp is deallocated by `DEALLOCATE`
+    when more than `maxsize` stmps are prepared.
+
+    Args:
+        threshold: The number of executions before preparing.
+        maxsize: The maximum number of prepared stmps.
+    """
+
+    def __init__(self, threshold: int, maxsize: int):
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._names: OrderedDict[str, str] = OrderedDict()
+        self._counts: OrderedDict[str, int] = OrderedDict()
+        self._ids = count()
+        self.generation = 0
+
+    @staticmethod
+    def of(connection: Any, threshold: int, maxsize: int) -> 'PreparedStatements':
+        """Finds the registry of the connection or creates it.
+
+        Args:
+            connection: The psycopg2 connection.
+            threshold: The number of executions before preparing.
+            maxsize: The maximum number of prepared stmps.
+
+        Returns:
+            PreparedStatements: The registry of the connection.
+        """
+        registry = _registries.get(connection)
+        if registry is None:
+            registry = PreparedStatements(threshold, maxsize)
+            _registries[connection] = registry
+        return registry
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def execute(self, cursor: Any, sql: str, params: Sequence[Any] | None,
+                generation: int | None = None):
+        """Executes the stmp. Uses `EXECUTE` if the stmp is prepared.
+        Prepared stmps of an older schema generation are deallocated before.
+
+        Args:
+            cursor: The psycopg2 cursor.
+            sql: The SQL which will be execute.
+            params: The bound parameters of the SQL.
+            generation: The current schema generation. Not checked if None.
+        """
+        if generation is not None and generation != self.generation:
+            self.invalidate(cursor, generation)
+        name = self._name(cursor, sql, bool(params))
+        if name is None:
+            cursor.execute(sql, params or None)
+        elif params:
+            placeholders = ', '.join(['%s'] * len(params))
+            cursor.execute(f'EXECUTE {name} ({placeholders})', params)
+        else:
+            cursor.execute(f'EXECUTE {name}')
+
+    def invalidate(self, cursor: Any, generation: int | None = None):
+        """Deallocates all prepared stmps. For example after DDL.
+
+        Args:
+            cursor: The psycopg2 cursor.
+            generation: The schema generation of the new stmps.
+             Not changed if None.
+        """
+        if self._names:
+            cursor.execute('DEALLOCATE ALL')
+        self._names.clear()
+        self._counts.clear()
+        if generation is not None:
+            self.generation = generation
+
+    def _name(self, cursor: Any, sql: str, has_params: bool) -> str | None:
+        """Finds the name of the prepared stmp.
+        Prepares the stmp if it was executed `threshold` times.
+
+        Args:
+            cursor: The psycopg2 cursor.
+            sql: The SQL of the stmp.
+            has_params: True if SQL has placeholders.
+
+        Returns:
+            str | None: The name of the prepared stmp. None if not prepared.
+        """
+        name = self._names.get(sql)
+        if name is not None:
+            self._names.move_to_end(sql)
+            return name
+
+        if sql.lstrip()[:6].upper() not in _PREPARABLE:
+            return None
+
+        executions = self._counts.pop(sql, 0) + 1
+        if executions < self.threshold:
+            self._counts[sql] = executions
+            while len(self._counts) > self.maxsize * 4:
+                self._counts.popitem(last=False)
+            return None
+
+        name = f'orm_stmt_{next(self._ids)}'
+        body = to_server_params(sql) if has_params else sql
+        cursor.execute(f'PREPARE {name} AS {body.rstrip().rstrip(";")}')
+        self._names[sql] = name
+        while len(self._names) > self.maxsize:
+            _, old_name = self._names.popitem(last=False)
+            cursor.execute(f'DEALLOCATE {old_name}')
+        return name
@@ -1,14 +1,58 @@
-from typing import Any, List, Tuple
+from itertools import count
+from typing import Any, IO, Iterable, Iterator, List, Sequence, Tuple
 
+import psycopg2.extensions
+
+from .copy import CopyReader, copy_columns, copy_lines
+from .prepared import PreparedStatements
 from ...session import Session
+from ...drivers.sql_adapter import SqlAdapter
+from ...statement_cache import StatementCache
+from ...pool import ConnectionPool
+from ...replicas import ReplicaSet
+from ...result_cache import ResultCache
+from ...schema_generation import SchemaGeneration
+
+_cursor_ids = count()
 
 
 class Psycopg2Sesion(Session):
-    """Psycopg2 Session implementation."""
+    """Psycopg2 Session implementation.
+
+    Args:
+        prepare_threshold: Opt-in server-side prepared stmps. 
+         If set, the stmp executed `prepare_threshold` times is prepared
+         by `PREPARE` and then executed by `EXECUTE`. None by default.
+        prepared_cache_size: The maximum number of prepared stmps
+         per connection. 100 by default.
+        schema_generation: The schema generation of the engine.
+         Prepared stmps of other connections are deallocated after DDL by it.
+    """
+
+    def __init__(self, connection: Any, adapter: SqlAdapter,
+                 statement_cache: StatementCache | None = None,
+                 prepare_threshold: int | None = None,
+                 prepared_cache_size: int = 100,
+                 pool: ConnectionPool | None = None,
+                 replicas: ReplicaSet | None = None,
+                 result_cache: ResultCache | None = None,
+                 schema_generation: SchemaGeneration | None = None):
+        super().__init__(connection, adapter, statement_cache, pool, replicas,
+                         result_cache)
+        self._begun = False
+        self._prepare_threshold = prepare_threshold
+        self._prepared_cache_size = prepared_cache_size
+        self._schema_generation = (schema_generation if schema_generation is not None
+                                   else SchemaGeneration())
+        self._prepared = None
 
     def connect(self):
         super().connect()
         self._cursor = self._connection.cursor()
+        if self._prepare_threshold is not None:
+            self._prepared = PreparedStatements.of(
+                self._connection, self._prepare_threshold,
+                self._prepared_cache_size)
 
     def __iter__(self):
         self.connect()
@@ -19,21 +63,144 @@ class Psycopg2Sesion(Session):
         return self
 
     def disconnect(self):
-        super().disconnect()
         self._cursor.close()
+        super().disconnect()
+
+    def execute(self, sql: str, params: Sequence[Any] | None = None) -> int:
+        self._execute(sql, params)
+        return self._cursor.rowcount
+
+    @property
+    def autocommit(self) -> bool:
+        return self._connection.autocommit
+
+    @autocommit.setter
+    def autocommit(self, value: bool):
+        self._connection.autocommit = value
+
+    def _begin(self):
+        """psycopg2 begins the transaction implicitly 
+        if autocommit is off. Otherwise it is begun explicitly."""
+        if self._connection.autocommit:
+            self._cursor.execute('BEGIN')
+            self._begun = True
+
+    def _connection_in_transaction(self) -> bool:
+        """psycopg2 begins the transaction before the first stmp 
+        if autocommit is off, so reads of the primary are kept 
+        on it till the commit as well."""
+        return self._connection is not None and \
+            self._connection.get_transaction_status() != \
+            psycopg2.extensions.TRANSACTION_STATUS_IDLE
 
-    def execute(self, sql: str):
-        self._cursor.execute(sql)
+    def _commit(self):
+        if self._begun:
+            self._begun = False
+            self._cursor.execute('COMMIT')
+        else:
+            self._connection.commit()
 
-    def commit(self):
-        self._connection.commit()
+    def _rollback(self):
+        if self._begun:
+            self._begun = False
+            self._cursor.execute('ROLLBACK')
+        else:
+            self._connection.rollback()
 
-    def fetch_one(self, sql: str) -> Tuple[Any] | None:
-        self._cursor.execute(sql)
+    def fetch_one(self, sql: str,
+                  params: Sequence[Any] | None = None) -> Tuple[Any] | None:
+        self._execute(sql, params)
         result = self._cursor.fetchone()
         return result
 
-    def fetch_all(self, sql: str) -> List[Tuple[str, Any]]:
-        self._cursor.execute(sql)
+    def fetch_all(self, sql: str,
+                  params: Sequence[Any] | None = None) -> List[Tuple[str, Any]]:
+        self._execute(sql, params)
         result = self._cursor.fetchall()
         return result
+
+    def fetch_many(self, sql: str, batch_size: int,
+                   params: Sequence[Any] | None = None) -> Iterator[Tuple[Any]]:
+        """Fetch results of sql by batches through the named (server-side) cursor.
+        The cursor is declared `WITH HOLD` in autocommit mode."""
+        cursor = self._connection.cursor(name=f'orm_cursor_{next(_cursor_ids)}',
+                                         withhold=self._connection.autocommit)
+        cursor.itersize = batch_size
+        try:
+            cursor.execute(sql, params or None)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    def copy_in(self, model, rows: Iterable[Any], size: int = 8192) -> int:
+        """Loads rows to the table by `COPY ... FROM STDIN` and commits them.
+        Rows are encoded by `ColumnType`.copy_value and streamed by blocks,
+        memory does not depend on the number of rows.
+        The autoincrement Primary Key is generated by the database.
+
+        Args:
+            model(Model): Table model.
+            rows: Models or tuples of values in the order of model columns
+             (without the autoincrement Primary Key). Can be a generator.
+            size: The size of block sent to the database. 8192 by default.
+
+        Returns:
+            int: The number of loaded rows.
+
+        Raises:
+            TypeError: The row is other model or has wrong number of values.
+            ValueError: The value is invalid.
+        """
+        schema = model.__schema__
+        columns = copy_columns(schema)
+        sql = self.adapter.copy_from(
+            schema.tablename, [c.name for c in columns])
+        file = CopyReader(copy_lines(model, columns, rows))
+        self._cursor.copy_expert(sql, file, size)
+        self.commit()
+        self.tables_changed(schema.tablename)
+        return self._cursor.rowcount
+
+    def copy_out(self, model, file: IO, size: int = 8192) -> int:
+        """Dumps the table by `COPY ... TO STDOUT` 
+        in the text format to the file. All columns in the model order.
+
+        Args:
+            model(Model): Table model.
+            file: The writable file.
+            size: The size of block. 8192 by default.
+
+        Returns:
+            int: The number of dumped rows.
+        """
+        schema = model.__schema__
+        sql = self.adapter.copy_to(
+            schema.tablename, [c.name for c in schema.columns])
+        self._cursor.copy_expert(sql, file, size)
+        return self._cursor.rowcount
+
+    def schema_changed(self):
+        """Deallocates prepared stmps after DDL. Prepared stmps of other
+        connections are deallocated before their next execution."""
+        super().schema_changed()
+        generation = self._schema_generation.bump()
+        if self._prepared is not None:
+            self._prepared.invalidate(self._cursor, generation)
+
+    def _create_replica_session(self, pool: ConnectionPool) -> 'Psycopg2Sesion':
+        return Psycopg2Sesion(None, self.adapter, self.statement_cache,
+                              self._prepare_threshold, self._prepared_cache_size,
+                              pool=pool, schema_generation=self._schema_generation)
+
+    def _execute(self, sql: str, params: Sequence[Any] | None):
+        """Executes sql by the session cursor. 
+        Uses prepared stmps if `prepare_threshold` is set."""
+        if self._prepared is None:
+            self._cursor.execute(sql, params or None)
+        else:
+            self._prepared.execute(self._cursor, sql, params,
+                                   self._schema_generation.value)
@@ -3,6 +3,11 @@ from typing import Any
 
 from ..session import Session
 from ..errors import UnknownDriverError
+from ..statement_cache import StatementCache
+from ..pool import ConnectionPool
+from ..replicas import ReplicaSet
+from ..result_cache import ResultCache
+from ..schema_generation import SchemaGeneration
 from .sql_adapter import SqlAdapter
 
 from .psycopg2.constants import DRIVER_NAME as PSYCOPG2_DRIVER_NAME
@@ -15,20 +20,38 @@ from .sqlite3.session import SQLite3Sesion
 class SessionFactory(ABC):
     """The Session factory."""
 
-    def create(driver: str, connection: Any, adapter: SqlAdapter) -> Session:
+    def create(driver: str, connection: Any, adapter: SqlAdapter,
+               statement_cache: StatementCache | None = None,
+               prepare_threshold: int | None = None,
+               pool: ConnectionPool | None = None,
+               replicas: ReplicaSet | None = None,
+               result_cache: ResultCache | None = None,
+               schema_generation: SchemaGeneration | None = None) -> Session:
         """Create `Session` by driver name.
 
         Args:
             driver: The name of the driver.
             connection: The connection to database.
             adapter: The SQL adapter for creating queries.
+            statement_cache: The cache of SQL stmps by their shape.
+            prepare_threshold: The number of executions before the stmp
+             is prepared on the server. psycopg2 only. Disabled if None.
+            pool: The pool of connections. `connection` is not used if set.
+            replicas: Read replicas of queries.
+            result_cache: The cache of query results.
+            schema_generation: The schema generation of the engine.
+             psycopg2 only.
 
         Raises:
             UnknownDriverError: If the driver is unknown.
         """
         if driver == PSYCOPG2_DRIVER_NAME:
-            return Psycopg2Sesion(connection, adapter)
+            return Psycopg2Sesion(connection, adapter, statement_cache,
+                                  prepare_threshold, pool=pool,
+                                  replicas=replicas, result_cache=result_cache,
+                                  schema_generation=schema_generation)
         elif driver == SQLITE3_DRIVER_NAME:
-            return SQLite3Sesion(connection, adapter)
+            return SQLite3Sesion(connection, adapter, statement_cache, pool,
+                                 replicas, result_cache)
 
         raise UnknownDriverError(f'unkknown driver {driver}')
@@ -22,6 +22,48 @@ class SqlAdapter(ABC):
 
     def __init__(self):
         self.create_unique: bool = False
+        self.bind_params: bool = True
+
+    @property
+    def placeholder(self) -> str:
+        """The placeholder of the bound parameter in SQL."""
+        return '%s'
+
+    @property
+    def max_params(self) -> int:
+        """The maximum number of bound parameters in one stmp."""
+        return 65535
+
+    def param_value(self, value: Any) -> Any:
+        """Adapts value to the bound parameter of the driver.
+
+        Args:
+            value: The adapting value.
+
+        Returns:
+            Any: The parameter value.
+        """
+        return value
+
+    def bind(self, value: Any, params: List[Any]) -> str:
+        """Adapts value to SQL.
+        If `bind_params` is True adds the value to `params` 
+        and returns the placeholder. Otherwise returns SQL literal.
+        Functions (for example `datetime_now`) are always rendered to SQL.
+
+        Args:
+            value: The adapting value.
+            params: The parameters of the statement.
+
+        Returns:
+            str: The placeholder or SQL literal.
+        """
+        if isinstance(value, FunctionType):
+            return value.__call__(self)
+        if not self.bind_params:
+            return self.any_value(value)
+        params.append(self.param_value(value))
+        return self.placeholder
 
     def string_column(self, len: int) -> str:
         return f'VARCHAR({len})'
@@ -130,21 +172,65 @@ class SqlAdapter(ABC):
         return f'now()'
 
     def select(self, table: str, columns: List[str] | None = None,
-               limit: int | None = None, where: List[str] | None = None) -> str:
+               limit: int | None = None, where: List[str] | None = None,
+               joins: List[str] | None = None, group_by: List[str] | None = None,
+               having: List[str] | None = None,
+               order_by: List[str] | None = None) -> str:
         columns = ',\n    '.join(columns) if columns is not None else '*'
         sql = f'''SELECT {columns} FROM {table}'''
 
+        if joins:
+            sql += ' ' + ' '.join(joins)
         if where is not None and where:
             sql += ' WHERE '
             sql += ' '.join(where)
+        if group_by:
+            sql += ' GROUP BY ' + ', '.join(group_by)
+        if having:
+            sql += ' HAVING '
+            sql += ' '.join(having)
+        if order_by:
+            sql += ' ORDER BY ' + ', '.join(order_by)
         if limit is not None:
             sql += f' {self.limit(limit)}'
         sql += ';'
         return sql
 
+    def join(self, table: str, on: str, alias: str | None = None,
+             outer: bool = False) -> str:
+        kind = 'LEFT OUTER JOIN' if outer else 'INNER JOIN'
+        alias_sql = f' AS {alias}' if alias is not None else ''
+        return f'{kind} {table}{alias_sql} ON {on}'
+
     def limit(self, limit: int) -> str:
         return f'LIMIT {limit}'
 
+    def order(self, column: str, desc: bool = False) -> str:
+        return f'{column} DESC' if desc else column
+
+    def aggregate(self, function: str, column: str | None = None) -> str:
+        """The aggregate function of the column.
+
+        Args:
+            function: `count`, `sum`, `min`, `max` or `avg`.
+            column: The column name. All rows (`*`) if None.
+
+        Returns:
+            str: SQL of the aggregate. For example: `SUM(age)`.
+        """
+        return f'{function.upper()}({column if column is not None else "*"})'
+
+    def count(self, sql: str) -> str:
+        """Counts rows of the SELECT stmp.
+
+        Args:
+            sql: SQL of the SELECT stmp.
+
+        Returns:
+            str: SQL of the count.
+        """
+        return f'SELECT COUNT(*) FROM ({sql.rstrip().rstrip(";")}) AS _count;'
+
     @property
     def clear_database(self) -> List[str]:
         return ['''DROP SCHEMA public CASCADE;
@@ -153,17 +239,95 @@ GRANT ALL ON SCHEMA public TO postgres;
 GRANT ALL ON SCHEMA public TO public;''']
 
     def insert_items(self, table: str, columns: List[str],
-                     list_values: List[List[Any]], id_column: str | None = None) -> str:
+                     list_values: List[List[Any]], id_column: str | None = None,
+                     conflict_columns: List[str] | None = None,
+                     update_columns: List[str] | None = None) -> str:
         columns_str = ', '.join(columns)
         values_str_list = []
         returing = f'\nRETURNING {id_column}' if id_column is not None else ''
+        on_conflict = ''
+        if conflict_columns is not None:
+            on_conflict = self.on_conflict(conflict_columns, update_columns)
 
         for values in list_values:
             values_str_list.append(','.join(values))
 
         values_str = ', \n('.join([value + ')' for value in values_str_list])
         return f'''INSERT INTO {table}({columns_str})
-VALUES ({values_str}{returing};'''
+VALUES ({values_str}{on_conflict}{returing};'''
+
+    def on_conflict(self, conflict_columns: List[str],
+                    update_columns: List[str] | None) -> str:
+        """The upsert clause of INSERT stmp.
+        Supported by PostgreSQL and SQLite 3.24+.
+
+        Args:
+            conflict_columns: The columns of unique constraint.
+            update_columns: The updating columns. DO NOTHING if None or empty.
+
+        Returns:
+            str: The ON CONFLICT clause.
+        """
+        target = ', '.join(conflict_columns)
+        if not update_columns:
+            return f'\nON CONFLICT ({target}) DO NOTHING'
+        set_str = ',\n    '.join(
+            [f'{name} = excluded.{name}' for name in update_columns])
+        return f'''
+ON CONFLICT ({target}) DO UPDATE SET
+    {set_str}'''
+
+    def bulk_update(self, table: str, key_column: str, columns: List[str],
+                    types: List[str], rows: List[List[Any]],
+                    params: List[Any]) -> str:
+        """UPDATE of many rows with different values in one stmp.
+        PostgreSQL implementation: `UPDATE ... FROM (VALUES ...)`.
+        Values are casted to column types, VALUES are untyped otherwise.
+
+        Args:
+            table: The name of the table.
+            key_column: The column which identifies rows.
+            columns: The updating columns.
+            types: SQL types of the key column and updating columns.
+            rows: The key value and updating values of every row.
+            params: The parameters of the stmp. Values are added to them.
+
+        Returns:
+            str: SQL of the stmp.
+        """
+        values = ',\n    '.join(
+            ['(' + ', '.join([f'{self.bind(value, params)}::{type}'
+                              for value, type in zip(row, types)]) + ')'
+             for row in rows])
+        set_str = ',\n    '.join([f'{name} = _v.{name}' for name in columns])
+        names = ', '.join([key_column, *columns])
+        return f'''UPDATE {table} SET
+    {set_str}
+FROM (VALUES
+    {values}
+) AS _v({names})
+WHERE {table}.{key_column} = _v.{key_column};'''
+
+    def savepoint(self, name: str) -> str:
+        return f'SAVEPOINT {name};'
+
+    def release_savepoint(self, name: str) -> str:
+        return f'RELEASE SAVEPOINT {name};'
+
+    def rollback_to_savepoint(self, name: str) -> str:
+        return f'ROLLBACK TO SAVEPOINT {name};'
+
+    @property
+    def data_version(self) -> str | None:
+        """The query of the database version changed by other connections.
+        None if the database does not have it."""
+        return None
+
+    def copy_from(self, table: str, columns: List[str]) -> str:
+        return f'COPY {table} ({", ".join(columns)}) FROM STDIN;'
+
+    def copy_to(self, table: str, columns: List[str]) -> str:
+        return f'COPY {table} ({", ".join(columns)}) TO STDOUT;'
 
     def delete(self, tablename: str, conditions: List[str]) -> str:
         condition_str = ''
@@ -181,7 +345,7 @@ VALUES ({values_str}{returing};'''
             condition_str += '\n'.join(conditions)
 
         name_value_str = ' SET '
-        name_value_str += '\n'.join([f'{name} = {item}'for name,
+        name_value_str += ',\n'.join([f'{name} = {item}'for name,
                                     item in name_value.items()])
         return f'''UPDATE {tablename}{name_value_str}{condition_str};'''
 
@@ -275,3 +439,28 @@ WHERE tc.table_schema='public'
 
     def create_unique_index(self, name: str, on_table: str, on_column: str) -> str:
         return f'CREATE UNIQUE INDEX {name} ON {on_table}({on_column});'
+
+    @property
+    def concurrent_index(self) -> bool:
+        """True if indexes can be built without locking writes to the table.
+        Such stmps can not be executed inside a transaction."""
+        return True
+
+    def create_index(self, name: str, table: str, columns: List[str],
+                     unique: bool = False, where: str | None = None,
+                     include: List[str] | None = None, if_not_exist: bool = False,
+                     concurrently: bool = False) -> str:
+        unique_sql = 'UNIQUE ' if unique else ''
+        concurrently_sql = 'CONCURRENTLY ' if concurrently else ''
+        if_not_exist_sql = f'{self.if_not_exist} ' if if_not_exist else ''
+        sql = (f'CREATE {unique_sql}INDEX {concurrently_sql}{if_not_exist_sql}{name} '
+               f'ON {table}({", ".join(columns)})')
+        if include:
+            sql += f' INCLUDE ({", ".join(include)})'
+        if where:
+            sql += f' WHERE {where}'
+        return sql + ';'
+
+    def drop_index(self, name: str, concurrently: bool = False) -> str:
+        concurrently_sql = 'CONCURRENTLY ' if concurrently else ''
+        return f'DROP INDEX {concurrently_sql}IF EXISTS {name};'
@@ -0,0 +1,90 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Callable, List, Sequence, Tuple
+
+from ...async_session import AsyncSession
+from ...drivers.sql_adapter import SqlAdapter
+from ...pool import ConnectionPool
+from ...result_cache import ResultCache
+from ...statement_cache import StatementCache
+
+
+class SQLite3AsyncSession(AsyncSession):
+    """sqlite3 AsyncSession implementation. 
+    sqlite3 has no asynchronous API, so calls are run in the thread executor
+    and the event loop is not blocked.
+
+    Args:
+        executor: The executor of sqlite3 calls.
+    """
+
+    def __init__(self, adapter: SqlAdapter, pool: ConnectionPool,
+                 statement_cache: StatementCache, in_flight: asyncio.Semaphore,
+                 executor: Executor, result_cache: ResultCache | None = None):
+        super().__init__(adapter, pool, statement_cache, in_flight, result_cache)
+        self._executor = executor
+        self._cursor = None
+
+    async def connect(self):
+        await super().connect()
+        self._cursor = await self._run(self._connection.cursor)
+
+    async def disconnect(self):
+        if self._cursor is not None:
+            cursor, self._cursor = self._cursor, None
+            await self._run(cursor.close)
+        await super().disconnect()
+
+    async def _execute(self, sql: str, params: Sequence[Any] | None) -> int:
+        def execute() -> int:
+            self._cursor.execute(sql, params or ())
+            return self._cursor.rowcount
+        return await self._run(execute)
+
+    async def _fetch_one(self, sql: str,
+                         params: Sequence[Any] | None) -> Tuple[Any] | None:
+        def fetch_one() -> Tuple[Any] | None:
+            self._cursor.execute(sql, params or ())
+            return self._cursor.fetchone()
+        return await self._run(fetch_one)
+
+    async def _fetch_all(self, sql: str,
+                         params: Sequence[Any] | None) -> List[Tuple[Any]]:
+        def fetch_all() -> List[Tuple[Any]]:
+            self._cursor.execute(sql, params or ())
+            return self._cursor.fetchall()
+        return await self._run(fetch_all)
+
+    async def _fetch_batches(self, sql: str, batch_size: int,
+                             params: Sequence[Any] | None) -> AsyncIterator[List[Tuple[Any]]]:
+        def open_cursor():
+            cursor = self._connection.cursor()
+            cursor.execute(sql, params or ())
+            return cursor
+
+        cursor = await self._run(open_cursor)
+        try:
+            while True:
+                rows = await self._run(cursor.fetchmany, batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            await self._run(cursor.close)
+
+    async def _begin(self):
+        def begin():
+            if not self._connection.in_transaction:
+                self._cursor.execute('BEGIN')
+        await self._run(begin)
+
+    async def _commit(self):
+        await self._run(self._connection.commit)
+
+    async def _rollback(self):
+        await self._run(self._connection.rollback)
+
+    async def _run(self, function: Callable, *args: Any) -> Any:
+        """Runs the sqlite3 call in the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
@@ -1,17 +1,58 @@
 import sqlite3
 
-from typing import Any
+from typing import Any, Dict
 from ...connection import Connectin
 from ...db_url import DbUrl
 
+MEMORY_DATABASE = ':memory:'
+
 
 class SQLite3Connection(Connectin):
-    """sqlite3 Connection implementation."""
+    """sqlite3 Connection implementation.
+    Connections are pooled by the engine, so the connection is used
+    by one thread at once but by different threads over time.
+
+    Every `:memory:` connection would open own empty database,
+    so pooled connections of the `:memory:` url share one named
+    in-memory database (`file:...?mode=memory&cache=shared`).
+    The first connection is kept open till `close`, so the database
+    lives while the pool reopens connections.
+    Shared-cache databases lock tables instead of the database file:
+    connections read with `PRAGMA read_uncommitted`, so readers are not 
+    locked by writers and see their not commited rows, the writer 
+    of the table locked by other transaction gets `sqlite3.OperationalError` 
+    (database table is locked) at once.
+    """
+
+    def __init__(self):
+        self._memory: Dict[str, sqlite3.Connection] = {}
 
     def connect(self, url: DbUrl) -> Any:
-        self.connection = sqlite3.connect(url.database, detect_types=sqlite3.PARSE_DECLTYPES |
-                                          sqlite3.PARSE_COLNAMES)
-        return self.connection
+        if url.database != MEMORY_DATABASE:
+            return self._connect(url.database)
+        name = f'file:orm_memory_{id(self)}_{id(url)}?mode=memory&cache=shared'
+        if name not in self._memory:
+            self._memory[name] = self._connect(name, uri=True)
+        connection = self._connect(name, uri=True)
+        connection.execute('PRAGMA read_uncommitted = true')
+        return connection
 
     def close(self):
-        self.connection.close()
+        """Closes in-memory databases."""
+        for connection in self._memory.values():
+            connection.close()
+        self._memory.clear()
+
+    def _connect(self, database: str, uri: bool = False) -> sqlite3.Connection:
+        """Opens the sqlite3 connection.
+
+        Args:
+            database: The database file or the uri.
+            uri: If True `database` is the uri. False by default.
+
+        Returns:
+            sqlite3.Connection: The connection.
+        """
+        return sqlite3.connect(database, detect_types=sqlite3.PARSE_DECLTYPES |
+                               sqlite3.PARSE_COLNAMES,
+                               check_same_thread=False, uri=uri)
@@ -1,4 +1,4 @@
-from typing import Any, List, Tuple
+from typing import Any, Iterator, List, Sequence, Tuple
 
 from ...session import Session
 
@@ -19,21 +19,59 @@ class SQLite3Sesion(Session):
         return self
 
     def disconnect(self):
-        super().disconnect()
         self._cursor.close()
+        super().disconnect()
+
+    def execute(self, sql: str, params: Sequence[Any] | None = None) -> int:
+        self._cursor.execute(sql, params or ())
+        return self._cursor.rowcount
+
+    @property
+    def autocommit(self) -> bool:
+        return self._connection.isolation_level is None
 
-    def execute(self, sql: str):
-        self._cursor.execute(sql)
+    @autocommit.setter
+    def autocommit(self, value: bool):
+        """Autocommit by `isolation_level` None. 
+        Otherwise sqlite3 begins the transaction before DML stmps."""
+        self._connection.isolation_level = None if value else ''
 
-    def commit(self):
+    def _begin(self):
+        """sqlite3 does not begin the transaction before DDL stmps
+        and in autocommit mode, so it is begun explicitly."""
+        if not self._connection.in_transaction:
+            self._cursor.execute('BEGIN')
+
+    def _connection_in_transaction(self) -> bool:
+        return self._connection is not None and self._connection.in_transaction
+
+    def _commit(self):
         self._connection.commit()
 
-    def fetch_one(self, sql: str) -> Tuple[Any] | None:
-        self._cursor.execute(sql)
+    def _rollback(self):
+        self._connection.rollback()
+
+    def fetch_one(self, sql: str,
+                  params: Sequence[Any] | None = None) -> Tuple[Any] | None:
+        self._cursor.execute(sql, params or ())
         result = self._cursor.fetchone()
         return result
 
-    def fetch_all(self, sql: str) -> List[Tuple[str, Any]]:
-        self._cursor.execute(sql)
+    def fetch_all(self, sql: str,
+                  params: Sequence[Any] | None = None) -> List[Tuple[str, Any]]:
+        self._cursor.execute(sql, params or ())
         result = self._cursor.fetchall()
         return result
+
+    def fetch_many(self, sql: str, batch_size: int,
+                   params: Sequence[Any] | None = None) -> Iterator[Tuple[Any]]:
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(sql, params or ())
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
@@ -1,3 +1,5 @@
+import sqlite3
+
 from datetime import datetime
 from types import FunctionType
 from typing import Any, List, Tuple
@@ -10,8 +12,23 @@ class SqLite3SqlAdapter(SqlAdapter):
     """The specific implementation of SQL adapter for sqlite3 driver."""
 
     def __init__(self):
+        super().__init__()
         self.create_unique: bool = True
 
+    @property
+    def placeholder(self) -> str:
+        return '?'
+
+    @property
+    def max_params(self) -> int:
+        """SQLITE_MAX_VARIABLE_NUMBER. 32766 since SQLite 3.32.0, 999 before."""
+        return 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+    def param_value(self, value: Any) -> Any:
+        if isinstance(value, datetime):
+            return str(value)
+        return value
+
     def string_column(self, len: int) -> str:
         return f'TEXT'
 
@@ -67,6 +84,29 @@ class SqLite3SqlAdapter(SqlAdapter):
     def autoincrement_default(self) -> str:
         return 'NULL'
 
+    def bulk_update(self, table: str, key_column: str, columns: List[str],
+                    types: List[str], rows: List[List[Any]],
+                    params: List[Any]) -> str:
+        """SQLite implementation of `SqlAdapter`.bulk_update: 
+        `SET column = CASE key WHEN ... THEN ... END WHERE key IN (...)`."""
+        set_list = []
+        for index, name in enumerate(columns, 1):
+            cases = '\n        '.join(
+                [f'WHEN {self.bind(row[0], params)} THEN {self.bind(row[index], params)}'
+                 for row in rows])
+            set_list.append(f'''{name} = CASE {key_column}
+        {cases}
+    END''')
+        keys = ', '.join([self.bind(row[0], params) for row in rows])
+        set_str = ',\n    '.join(set_list)
+        return f'''UPDATE {table} SET
+    {set_str}
+WHERE {key_column} IN ({keys});'''
+
+    @property
+    def data_version(self) -> str | None:
+        return 'PRAGMA data_version;'
+
     @property
     def clear_database(self) -> List[str]:
         return [
@@ -116,3 +156,22 @@ class SqLite3SqlAdapter(SqlAdapter):
             foreign_table_name=row[2],
             foreign_column_name=row[4],
         )
+
+    @property
+    def concurrent_index(self) -> bool:
+        return False
+
+    def create_index(self, name: str, table: str, columns: List[str],
+                     unique: bool = False, where: str | None = None,
+                     include: List[str] | None = None, if_not_exist: bool = False,
+                     concurrently: bool = False) -> str:
+        """SQLite has no INCLUDE, so included columns are added to the key
+        of not unique indexes. The unique key can not be changed.
+        SQLite locks the database by writes, CONCURRENTLY is not supported."""
+        if include and not unique:
+            columns = list(columns) + [name for name in include if name not in columns]
+        return super().create_index(name, table, columns, unique=unique, where=where,
+                                    if_not_exist=if_not_exist)
+
+    def drop_index(self, name: str, concurrently: bool = False) -> str:
+        return super().drop_index(name)
@@ -1,11 +1,17 @@
+import warnings
 from types import FunctionType, MethodType
-from typing import List
+from typing import Any, List, Sequence
 from .drivers.sql_adapter_factory import SqlAdapterFactory
 from .drivers.session_factory import SessionFactory
 from .drivers.connection_factory import ConnectionFactory
 
 from .db_url import DbUrl
 from .session import Session
+from .statement_cache import StatementCache
+from .result_cache import ResultCache
+from .schema_generation import SchemaGeneration
+from .pool import ConnectionPool
+from .replicas import ROUND_ROBIN, Replica, ReplicaSet
 from .orm_db_version import OrmDBVersion
 from .ddl.model import Model
 from .ddl.migration import Migration
@@ -32,7 +38,7 @@ def _on_create(create_table: FunctionType| MethodType):
 
 class Engine:
     """The Engine of python_orm package. 
-    Engine connecting to the database and create `connection`. 
+    Engine connecting to the database and create the `pool` of connections. 
     Check out the `_connect_to_db` function.
 
     Args:
@@ -42,28 +48,93 @@ class Engine:
         on_create: Callback for tables creations. Check out the `_on_create` function.
         on_update: Callback for migration. Check out the `_on_update` function.
         connect: The object for connection.
-        connection: The connection with the database.
         adapter: The SQL adapter. Contains methods and properties with SQL languages.
+        bind_params: If True values of DML stmps and queries are passed to 
+         the driver as bound parameters. Otherwise values are SQL literals.
+         True by default.
+        statement_cache_size: The maximum number of SQL stmps cached by shape.
+         Check out `statement_cache`. 256 by default.
+        result_cache_size: The maximum number of query results cached 
+         by `Query`.cache. Check out `result_cache`. 1024 by default.
+        prepare_threshold: Opt-in server-side prepared stmps. psycopg2 only.
+         The stmp executed `prepare_threshold` times on the connection
+         is prepared by `PREPARE` and then executed by `EXECUTE`. 
+         None (disabled) by default.
+        pool_size: The number of connections kept by the pool. 5 by default.
+        pool_min_size: The number of connections opened at once. 1 by default.
+        pool_max_overflow: The number of extra connections opened under load
+         and closed after use. 10 by default.
+        pool_timeout: Seconds to wait for the free connection. 30 by default.
+        pool_max_waiters: The maximum number of threads waiting 
+         for the connection. Others get `PoolTimeoutError` instantly.
+         Unbounded if None.
+        pool_recycle: The maximum age of the connection in seconds. Disabled if None.
+        pool_pre_ping: Checks connections by `SELECT 1` on checkout. False by default.
+        replicas: Urls of read replicas. Queries are read from replicas,
+         DML stmps, `Migration` and reads of transactions use the primary `db_url`.
+         Every replica has own pool with the same options. None by default.
+        replica_strategy: Chooses the replica for the session. `round_robin` or 
+         `least_busy` (the fewest connections in use). `round_robin` by default.
+        replica_retry_after: Seconds while the failed replica is skipped,
+         its queries are read from the primary. 30 by default.
+        statement_cache: The cache of SQL stmps shared by all engine sessions.
+        result_cache: The cache of query results shared by all engine sessions.
+        schema_generation: The schema generation shared by all engine sessions.
+         Incremented after DDL, stale prepared stmps of connections are deallocated by it.
+        pool: The pool of connections. Every session checks out 
+         own connection on `connect`. Check out `ConnectionPool`.
+        replicas: Read replicas and their health. None if not configured.
+         Check out `ReplicaSet`.
+        connection: Deprecated. The connection checked out from the `pool`
+         for the engine till `disconnect`. Use sessions instead.
     """
 
     def __init__(self, db_url: DbUrl, version: int = 0, on_create: FunctionType = _on_create,
-                 on_update: FunctionType = _on_update):
+                 on_update: FunctionType = _on_update, bind_params: bool = True,
+                 statement_cache_size: int = 256, prepare_threshold: int | None = None,
+                 pool_size: int = 5, pool_min_size: int = 1, pool_max_overflow: int = 10,
+                 pool_timeout: float = 30.0, pool_max_waiters: int | None = None,
+                 pool_recycle: float | None = None, pool_pre_ping: bool = False,
+                 replicas: Sequence[DbUrl] | None = None,
+                 replica_strategy: str = ROUND_ROBIN,
+                 replica_retry_after: float = 30.0,
+                 result_cache_size: int = 1024):
         self._db_url = db_url
+        self._replica_urls = list(replicas or ())
+        self._replica_options = dict(
+            strategy=replica_strategy,
+            retry_after=replica_retry_after,
+        )
+        self.prepare_threshold = prepare_threshold
+        self._pool_options = dict(
+            min_size=pool_min_size,
+            max_size=pool_size,
+            max_overflow=pool_max_overflow,
+            timeout=pool_timeout,
+            max_waiters=pool_max_waiters,
+            recycle=pool_recycle,
+            pre_ping=pool_pre_ping,
+        )
         self.version = version
         self._on_update = on_update
         self._on_create = on_create
+        self.statement_cache = StatementCache(statement_cache_size)
+        self.result_cache = ResultCache(result_cache_size)
+        self.schema_generation = SchemaGeneration()
+        self._connection = None
         self._connect_to_db()
         self.adapter = SqlAdapterFactory.create(self.driver)
+        self.adapter.bind_params = bind_params
         self._migrate()
 
     def drop_all_tables(self):
         """Drops all tables in the table."""
-        seesion_obj = SessionFactory.create(
-            self.driver, self.connection, self.adapter)
+        seesion_obj = self._create_session()
         with seesion_obj as session:
             for sql in self.adapter.clear_database:
                 session.execute(sql)
             session.commit()
+            session.schema_changed()
 
     def create_tables(self, tables: List[Model]):
         """Creates all tables connected to the module.
@@ -71,26 +142,74 @@ class Engine:
         Args:
             tables: A list of table classes that need to be created.
         """
-        seesion_obj = SessionFactory.create(
-            self.driver, self.connection, self.adapter)
+        seesion_obj = self._create_session()
         with seesion_obj as session:
             for item in tables:
                 session.create_table(item)
 
+    @property
+    def connection(self) -> Any:
+        """Deprecated. The connection of the engine. Before the pool the engine
+        had one connection, now sessions check out own connections.
+        The connection is checked out on the first access and 
+        checked in by `disconnect`.
+
+        Returns:
+            Any: The database connection.
+        """
+        warnings.warn('Engine.connection is deprecated, sessions check out '
+                      'connections from Engine.pool.', DeprecationWarning, stacklevel=2)
+        if self._connection is None:
+            self._connection = self.pool.checkout()
+        return self._connection
+
     def disconnect(self):
-        """Disconnected from the database. Closes connection."""
+        """Disconnected from the database. Closes idle connections of pools
+        and resources of the connector (in-memory SQLite databases)."""
+        if self._connection is not None:
+            self.pool.checkin(self._connection)
+            self._connection = None
+        self.pool.dispose()
+        if self.replicas is not None:
+            self.replicas.dispose()
         self.connect.close()
 
+    def _create_session(self) -> Session:
+        """Creates the session of the engine."""
+        return SessionFactory.create(
+            self.driver, None, self.adapter, self.statement_cache,
+            self.prepare_threshold, self.pool, self.replicas, self.result_cache,
+            self.schema_generation)
+
     def _connect_to_db(self):
-        """Creates connection with the database."""
+        """Creates the pool of connections with the database."""
         self.connect = ConnectionFactory.create(self.driver)
-        self.connection = self.connect.connect(self._db_url)
+        self.pool = ConnectionPool(
+            lambda: self.connect.connect(self._db_url), **self._pool_options)
+        self.replicas = None
+        if self._replica_urls:
+            self.replicas = ReplicaSet(
+                [Replica(url, self._replica_pool(url)) for url in self._replica_urls],
+                **self._replica_options)
+
+    def _replica_pool(self, url: DbUrl) -> ConnectionPool:
+        """Creates the pool of the replica connections. 
+        Connections are opened on demand, so the unavailable replica
+        does not break the engine.
+
+        Args:
+            url: The url of the replica.
+
+        Returns:
+            ConnectionPool: The pool.
+        """
+        options = dict(self._pool_options, min_size=0)
+        return ConnectionPool(lambda: self.connect.connect(url), **options)
 
     def _migrate(self):
         """Migration flow."""
-        seesion_obj = SessionFactory.create(
-            self.driver, self.connection, self.adapter)
-        with seesion_obj as session:
+        seesion_obj = self._create_session()
+        with seesion_obj as session, session.use_primary():
             self._init_version_table(session)
             self._run_migration(session)
 
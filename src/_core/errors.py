@@ -1,3 +1,9 @@
 class UnknownDriverError(Exception):
     """Raise the error if cannot find supported driver realization."""
     pass
+
+
+class PoolTimeoutError(Exception):
+    """Raise the error if the connection is not checked out 
+    from the pool during the timeout or the waiter queue is full."""
+    pass
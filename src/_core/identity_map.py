@@ -0,0 +1,101 @@
+from typing import Any, Hashable, Iterable, List, Tuple
+from weakref import WeakValueDictionary
+
+from .ddl.model import Model, UNLOADED
+
+
+class IdentityMap:
+    """Rows of the session by the model and the Primary Key value.
+    One row of the table is one object in the session.
+    Rows are kept by weak references, the row is forgotten 
+    when it is not used anymore.
+    """
+
+    def __init__(self):
+        self._rows: WeakValueDictionary[Tuple[type, Hashable], Model] = \
+            WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, model, key: Any) -> Any:
+        """Finds the row by the Primary Key value.
+
+        Args:
+            model(Model): Table model.
+            key: The Primary Key value.
+
+        Returns:
+            Model | None: The row. None if not loaded.
+        """
+        return self._rows.get((model, key))
+
+    def add(self, row: Model) -> Model:
+        """Adds the row to the map.
+        If the map has the row with the same Primary Key, 
+        the loaded values of `row` refresh it and it is returned.
+        The row with not flushed changes is not refreshed.
+        Rows without Primary Key value are not added.
+
+        Args:
+            row: The row.
+
+        Returns:
+            Model: The row of the map.
+        """
+        schema = row.__schema__
+        index = schema.primary_key_index
+        if index is None:
+            return row
+        key = row._values[index]
+        if key is None or key is UNLOADED:
+            return row
+        existing = self._rows.get((type(row), key))
+        if existing is None:
+            self._rows[(type(row), key)] = row
+            return row
+        if existing is not row and not existing._dirty:
+            values = existing._values
+            for position, value in enumerate(row._values):
+                if value is not UNLOADED:
+                    values[position] = value
+        return existing
+
+    def discard(self, row: Model):
+        """Removes the row from the map.
+
+        Args:
+            row: The row.
+        """
+        index = row.__schema__.primary_key_index
+        if index is not None:
+            key = (type(row), row._values[index])
+            if self._rows.get(key) is row:
+                del self._rows[key]
+
+    def expire(self, model, keys: Iterable[Any] | None = None):
+        """Removes rows of the model. For example after UPDATE or DELETE stmp
+        which changed unknown rows.
+
+        Args:
+            model(Model): Table model.
+            keys: The Primary Key values of removed rows. All rows if None.
+        """
+        if keys is not None:
+            for key in keys:
+                self._rows.pop((model, key), None)
+            return
+        for key in [key for key in self._rows.keys() if key[0] is model]:
+            self._rows.pop(key, None)
+
+    def clear(self):
+        """Removes all rows."""
+        self._rows.clear()
+
+    def rows(self) -> List[Model]:
+        """All rows of the map.
+
+        Returns:
+            List[Model]: The rows.
+        """
+        return list(self._rows.values())
@@ -0,0 +1,266 @@
+from collections import deque
+from threading import Condition
+from time import monotonic
+from typing import Any, Callable, Deque, Dict, Tuple
+
+from .errors import PoolTimeoutError
+from .schemas import PoolStats
+
+
+def ping(connection: Any):
+    """Checks the connection by `SELECT 1`.
+
+    Args:
+        connection: The DB-API connection.
+
+    Raises:
+        Exception: The driver error if the connection is broken.
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute('SELECT 1')
+        cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def rollback(connection: Any):
+    """Rolls back the not finished transaction of the connection.
+
+    Args:
+        connection: The DB-API connection.
+    """
+    connection.rollback()
+
+
+class ConnectionPool:
+    """Thread-safe pool of database connections.
+    Keeps up to `max_size` connections open, 
+    opens up to `max_overflow` extra connections under load
+    (they are closed on checkin). If all connections are in use,
+    `checkout` waits up to `timeout` seconds. No more than `max_waiters`
+    threads wait at once, others fail instantly (backpressure).
+
+    Args:
+        connect: Opens the new connection.
+        min_size: The number of connections opened at once. 1 by default.
+        max_size: The number of kept connections. 5 by default.
+        max_overflow: The number of extra connections. 10 by default.
+        timeout: The checkout timeout in seconds. 30 by default.
+        max_waiters: The maximum number of waiting threads. Unbounded if None.
+        recycle: The maximum age of the connection in seconds.
+         Older connections are reopened on checkout. Disabled if None.
+        pre_ping: Checks the connection by `ping` on checkout 
+         and reopens it if broken. False by default.
+        ping: Checks the connection. `SELECT 1` by default.
+        reset: Cleans the connection on checkin. `rollback` by default.
+    """
+
+    def __init__(self, connect: Callable[[], Any], min_size: int = 1,
+                 max_size: int = 5, max_overflow: int = 10,
+                 timeout: float = 30.0, max_waiters: int | None = None,
+                 recycle: float | None = None, pre_ping: bool = False,
+                 ping: Callable[[Any], None] = ping,
+                 reset: Callable[[Any], None] = rollback):
+        if max_size < 1 or not 0 <= min_size <= max_size or max_overflow < 0:
+            raise ValueError(
+                'Pool sizes should be 0 <= min_size <= max_size, 1 <= max_size, '
+                '0 <= max_overflow.')
+        self._connect = connect
+        self.max_size = max_size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.max_waiters = max_waiters
+        self.recycle = recycle
+        self.pre_ping = pre_ping
+        self._ping = ping
+        self._reset = reset
+        self._condition = Condition()
+        self._idle: Deque[Any] = deque()
+        self._created: Dict[int, float] = {}
+        self._size = 0
+        self._waiting = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._recycled = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+        for _ in range(min_size):
+            self._size += 1
+            self._idle.append(self._open())
+
+    def checkout(self) -> Any:
+        """Takes the connection from the pool.
+
+        Returns:
+            Any: The connection. Should be returned by `checkin`.
+
+        Raises:
+            PoolTimeoutError: The connection is not free during `timeout`
+             or `max_waiters` threads are already waiting.
+        """
+        start = monotonic()
+        connection, is_new = self._take(start)
+        if not is_new:
+            connection = self._check(connection)
+        return connection
+
+    def checkin(self, connection: Any):
+        """Returns the connection to the pool.
+        The not finished transaction is rolled back.
+        Overflow connections are closed.
+
+        Args:
+            connection: The connection from `checkout`.
+        """
+        try:
+            self._reset(connection)
+        except Exception:
+            self._discard(connection)
+            return
+        with self._condition:
+            if self._size > self.max_size:
+                self._size -= 1
+                self._created.pop(id(connection), None)
+                close = True
+            else:
+                self._idle.append(connection)
+                close = False
+            self._condition.notify()
+        if close:
+            self._close(connection)
+
+    def discard(self, connection: Any):
+        """Closes the checked out connection instead of `checkin`.
+        For the connection in the unknown state, for example 
+        in the middle of the cancelled stmp.
+
+        Args:
+            connection: The connection from `checkout`.
+        """
+        self._discard(connection)
+
+    def dispose(self):
+        """Closes idle connections. Checked out connections
+        are closed or kept on checkin as usual."""
+        with self._condition:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            for connection in idle:
+                self._created.pop(id(connection), None)
+        for connection in idle:
+            self._close(connection)
+
+    def stats(self) -> PoolStats:
+        """The statistic of the pool.
+
+        Returns:
+            PoolStats: The statistic.
+        """
+        with self._condition:
+            return PoolStats(
+                size=self._size,
+                in_use=self._size - len(self._idle),
+                idle=len(self._idle),
+                overflow=max(self._size - self.max_size, 0),
+                waiting=self._waiting,
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                recycled=self._recycled,
+                wait_time=self._wait_time,
+                max_wait_time=self._max_wait_time,
+            )
+
+    def _take(self, start: float) -> Tuple[Any, bool]:
+        """Takes the idle connection or opens the new one.
+
+        Args:
+            start: The time of the checkout start.
+
+        Returns:
+            Tuple[Any, bool]: The connection and True if it was just opened.
+        """
+        deadline = start + self.timeout
+        with self._condition:
+            while not self._idle and self._size >= self.max_size + self.max_overflow:
+                remaining = deadline - monotonic()
+                if remaining <= 0 or (self.max_waiters is not None
+                                      and self._waiting >= self.max_waiters):
+                    self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f'No free connection: {self._size} in use, '
+                        f'{self._waiting} waiting.')
+                self._waiting += 1
+                try:
+                    self._condition.wait(remaining)
+                finally:
+                    self._waiting -= 1
+            waited = monotonic() - start
+            self._checkouts += 1
+            self._wait_time += waited
+            self._max_wait_time = max(self._max_wait_time, waited)
+            if self._idle:
+                return self._idle.pop(), False
+            self._size += 1
+        try:
+            return self._open(), True
+        except BaseException:
+            self._release_slot()
+            raise
+
+    def _check(self, connection: Any) -> Any:
+        """Reopens the connection if it is too old or broken.
+
+        Args:
+            connection: The idle connection.
+
+        Returns:
+            Any: The connection ready for use.
+        """
+        created = self._created.get(id(connection), 0.0)
+        expired = self.recycle is not None and monotonic() - created > self.recycle
+        if not expired and self.pre_ping:
+            try:
+                self._ping(connection)
+            except Exception:
+                expired = True
+        if not expired:
+            return connection
+
+        with self._condition:
+            self._recycled += 1
+            self._created.pop(id(connection), None)
+        self._close(connection)
+        try:
+            return self._open()
+        except BaseException:
+            self._release_slot()
+            raise
+
+    def _open(self) -> Any:
+        """Opens the new connection and remembers its age."""
+        connection = self._connect()
+        self._created[id(connection)] = monotonic()
+        return connection
+
+    def _discard(self, connection: Any):
+        """Closes the broken connection and frees its slot."""
+        with self._condition:
+            self._created.pop(id(connection), None)
+        self._close(connection)
+        self._release_slot()
+
+    def _release_slot(self):
+        """Frees the slot of the connection which is not open."""
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    @staticmethod
+    def _close(connection: Any):
+        """Closes the connection. Errors of broken connections are ignored."""
+        try:
+            connection.close()
+        except Exception:
+            pass
@@ -0,0 +1,124 @@
+from itertools import count
+from threading import Lock
+from time import monotonic
+from typing import List, Sequence
+
+from .db_url import DbUrl
+from .pool import ConnectionPool
+from .schemas import ReplicaStats
+
+ROUND_ROBIN = 'round_robin'
+LEAST_BUSY = 'least_busy'
+STRATEGIES = (ROUND_ROBIN, LEAST_BUSY)
+
+
+class Replica:
+    """The read replica of the database.
+
+    Args:
+        url: The url of the replica.
+        pool: The pool of replica connections.
+    """
+
+    def __init__(self, url: DbUrl, pool: ConnectionPool):
+        self.url = url
+        self.pool = pool
+        self.reads = 0
+        self.failures = 0
+        self.last_error: str | None = None
+        self._retry_at = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        """False after the failure until the retry time."""
+        return monotonic() >= self._retry_at
+
+    def stats(self) -> ReplicaStats:
+        """The statistic of the replica.
+
+        Returns:
+            ReplicaStats: The statistic.
+        """
+        return ReplicaStats(
+            database=self.url.database,
+            host=self.url.host,
+            healthy=self.healthy,
+            in_use=self.pool.stats().in_use,
+            reads=self.reads,
+            failures=self.failures,
+            last_error=self.last_error,
+        )
+
+
+class ReplicaSet:
+    """Read replicas of the engine. Chooses the replica for reading
+    by the strategy and tracks their health. The failed replica
+    is skipped for `retry_after` seconds.
+
+    Args:
+        replicas: Replicas of the database.
+        strategy: `round_robin` or `least_busy` 
+         (the fewest checked out connections). `round_robin` by default.
+        retry_after: Seconds while the failed replica is skipped. 30 by default.
+
+    Raises:
+        ValueError: The strategy is unknown.
+    """
+
+    def __init__(self, replicas: Sequence[Replica], strategy: str = ROUND_ROBIN,
+                 retry_after: float = 30.0):
+        if strategy not in STRATEGIES:
+            raise ValueError(
+                f'Unknown replica strategy {strategy}. Use one of {STRATEGIES}.')
+        self.replicas = list(replicas)
+        self.strategy = strategy
+        self.retry_after = retry_after
+        self._turns = count()
+        self._lock = Lock()
+
+    def choose(self) -> Replica | None:
+        """Chooses the healthy replica by the strategy.
+
+        Returns:
+            Replica | None: The replica. None if all replicas are failed.
+        """
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        if self.strategy == LEAST_BUSY:
+            return min(healthy, key=lambda replica: replica.pool.stats().in_use)
+        return healthy[next(self._turns) % len(healthy)]
+
+    def read(self, replica: Replica):
+        """Counts the successful read of the replica.
+
+        Args:
+            replica: The replica.
+        """
+        with self._lock:
+            replica.reads += 1
+
+    def failed(self, replica: Replica, error: Exception):
+        """Skips the replica for `retry_after` seconds.
+
+        Args:
+            replica: The failed replica.
+            error: The error of the replica.
+        """
+        with self._lock:
+            replica.failures += 1
+            replica.last_error = repr(error)
+            replica._retry_at = monotonic() + self.retry_after
+
+    def dispose(self):
+        """Closes idle connections of replicas."""
+        for replica in self.replicas:
+            replica.pool.dispose()
+
+    def stats(self) -> List[ReplicaStats]:
+        """The statistic of replicas.
+
+        Returns:
+            List[ReplicaStats]: The statistic in the order of replicas.
+        """
+        return [replica.stats() for replica in self.replicas]
@@ -0,0 +1,159 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Hashable, Iterable, Set, Tuple
+
+from .schemas import CacheStats
+
+MISS = object()
+"""The result of `ResultCache`.get if the key is not cached."""
+
+_MAX_CONNECTIONS = 64
+
+
+class ResultCache:
+    """LRU cache of query results. Created by the engine, shared by its sessions.
+    The key is SQL with parameters of the query. Results are invalidated
+    by tables: DML stmps of the engine invalidate results of their table,
+    `Migration` clears the cache.
+
+    Changes of other processes are not visible to the engine. 
+    SQLite reports them by `PRAGMA data_version`, check out `check_version`.
+
+    Args:
+        maxsize: The maximum number of cached results. 1024 by default.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._items: OrderedDict[Hashable, Tuple[Any, float | None, Tuple[str, ...]]] = \
+            OrderedDict()
+        self._tables: Dict[str, Set[Hashable]] = {}
+        self._versions: Dict[int, Tuple[Any, Any]] = {}
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Finds the result of the query.
+
+        Args:
+            key: SQL with parameters.
+
+        Returns:
+            Any: The result. `MISS` if not cached or expired.
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self._misses += 1
+                return MISS
+            result, expires, tables = item
+            if expires is not None and expires <= monotonic():
+                self._remove(key, tables)
+                self._misses += 1
+                return MISS
+            self._items.move_to_end(key)
+            self._hits += 1
+            return result
+
+    def put(self, key: Hashable, result: Any, tables: Tuple[str, ...],
+            ttl: float | None = None):
+        """Caches the result of the query.
+        Evicts the least recently used result if the cache is full.
+
+        Args:
+            key: SQL with parameters.
+            result: The result of the query. Should not be changed later.
+            tables: The tables of the query.
+            ttl: Seconds while the result is valid. Until invalidation if None.
+        """
+        expires = monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._unindex(key, old[2])
+            self._items[key] = (result, expires, tables)
+            for table in tables:
+                self._tables.setdefault(table, set()).add(key)
+            while len(self._items) > self.maxsize:
+                old_key, (_, _, old_tables) = self._items.popitem(last=False)
+                self._unindex(old_key, old_tables)
+                self._evictions += 1
+
+    def invalidate(self, tables: Iterable[str]):
+        """Removes results of queries of tables.
+
+        Args:
+            tables: Changed tables.
+        """
+        with self._lock:
+            for table in tables:
+                for key in list(self._tables.get(table, ())):
+                    self._remove(key, self._items[key][2])
+                    self._invalidations += 1
+
+    def check_version(self, connection: Any, version: Any):
+        """Clears the cache if the database was changed by other connections.
+        `version` is `PRAGMA data_version` of SQLite: it is changed 
+        when other connections commit. Versions of different connections
+        are not comparable, so the last version is kept per connection.
+        The version of the connection seen for the first time is only kept,
+        so new pooled connections do not clear the cache.
+
+        Args:
+            connection: The connection of the version.
+            version: The data version of the connection.
+        """
+        with self._lock:
+            seen = self._versions.get(id(connection))
+            if seen is not None and seen[0] is connection and seen[1] == version:
+                return
+            if len(self._versions) >= _MAX_CONNECTIONS:
+                self._versions.clear()
+            # The connection is kept, so its id is not reused by other one.
+            self._versions[id(connection)] = (connection, version)
+            if seen is None or seen[0] is not connection:
+                return
+            self._invalidations += len(self._items)
+            self._items.clear()
+            self._tables.clear()
+
+    def clear(self):
+        """Removes all cached results. Counters are not reset."""
+        with self._lock:
+            self._invalidations += len(self._items)
+            self._items.clear()
+            self._tables.clear()
+
+    def stats(self) -> CacheStats:
+        """Statistic of the cache.
+
+        Returns:
+            CacheStats: The cache statistic.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._items),
+                maxsize=self.maxsize,
+                invalidations=self._invalidations,
+            )
+
+    def _remove(self, key: Hashable, tables: Tuple[str, ...]):
+        """Removes the result. The lock should be held."""
+        del self._items[key]
+        self._unindex(key, tables)
+
+    def _unindex(self, key: Hashable, tables: Tuple[str, ...]):
+        """Removes the key from the table index. The lock should be held."""
+        for table in tables:
+            keys = self._tables.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tables[table]
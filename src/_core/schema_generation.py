@@ -0,0 +1,28 @@
+from threading import Lock
+
+
+class SchemaGeneration:
+    """The generation of the database schema. Shared by sessions of the engine.
+    Incremented after DDL by `Session`.schema_changed.
+    Connections compare it with the generation of their server-side state
+    (for example prepared stmps) and reset the state if it is older.
+    """
+
+    def __init__(self):
+        self._value = 0
+        self._lock = Lock()
+
+    @property
+    def value(self) -> int:
+        """The current generation."""
+        return self._value
+
+    def bump(self) -> int:
+        """Starts the new generation.
+
+        Returns:
+            int: The new generation.
+        """
+        with self._lock:
+            self._value += 1
+            return self._value
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Generic, List, Tuple, TypeVar
+
+_T = TypeVar('_T')
 
 
 @dataclass
@@ -40,3 +42,88 @@ class ConstrainsInfo:
     foreign_table_schema: str
     foreign_table_name: str
     foreign_column_name: str
+
+
+@dataclass
+class CacheStats:
+    """Cache statistic data class.
+
+    Args:
+        hits: The number of found items.
+        misses: The number of not found items.
+        evictions: The number of items removed because the cache was full.
+        size: The current number of items.
+        maxsize: The maximum number of items.
+        invalidations: The number of items removed because their data was changed.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+    invalidations: int = 0
+
+
+@dataclass
+class PoolStats:
+    """Connection pool statistic data class.
+
+    Args:
+        size: The current number of open connections.
+        in_use: The number of checked out connections.
+        idle: The number of connections ready for checkout.
+        overflow: The number of open connections over `max_size`.
+        waiting: The number of threads waiting for the connection.
+        checkouts: The number of checkouts.
+        timeouts: The number of failed checkouts.
+        recycled: The number of connections closed by age or failed ping.
+        wait_time: The total time of waiting for connections in seconds.
+        max_wait_time: The longest waiting for the connection in seconds.
+    """
+    size: int
+    in_use: int
+    idle: int
+    overflow: int
+    waiting: int
+    checkouts: int
+    timeouts: int
+    recycled: int
+    wait_time: float
+    max_wait_time: float
+
+
+@dataclass
+class ReplicaStats:
+    """Read replica statistic data class.
+
+    Args:
+        database: The database of the replica.
+        host: The host of the replica.
+        healthy: False if the replica is skipped after the failure.
+        in_use: The number of checked out connections.
+        reads: The number of successful reads.
+        failures: The number of failures.
+        last_error: The last error of the replica.
+    """
+    database: str
+    host: str | None
+    healthy: bool
+    in_use: int
+    reads: int
+    failures: int
+    last_error: str | None
+
+
+@dataclass
+class Page(Generic[_T]):
+    """Page of keyset pagination data class. Check out `Query`.paginate.
+
+    Args:
+        items: The rows of the page.
+        after: The key of the last row. Pass it to `paginate` 
+         for the next page. None if the page is empty.
+        has_next: True if rows after the page exist.
+    """
+    items: List[_T]
+    after: Tuple[Any, ...] | None
+    has_next: bool
@@ -1,14 +1,23 @@
 from logging import getLogger
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Tuple
+from contextlib import contextmanager
+from itertools import count
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Set, Tuple
 
 from .dml.query import Query
 from .dml.insert import Insert
 from .dml.delete import Delete
 from .dml.update import Update
+from .dml.bulk_update import BulkUpdate
+from .dml.unit_of_work import UnitOfWork
 from .dml.table_info import TableInfo
 from .drivers.sql_adapter import SqlAdapter
 from .ddl.create import CreateTable
+from .statement_cache import StatementCache
+from .identity_map import IdentityMap
+from .pool import ConnectionPool
+from .replicas import Replica, ReplicaSet
+from .result_cache import ResultCache
 
 logger = getLogger(__name__)
 
@@ -19,11 +28,44 @@ class Session(ABC):
     Args:
         connection: The connection to the database.
         adapter: The SQL adapter for queries.
+        statement_cache: The cache of SQL stmps by their shape.
+         Usually shared by all sessions of the engine.
+         The session creates own cache if None.
+        pool: The pool of connections. If set, the connection is
+         checked out by `connect` and checked in by `disconnect`,
+         `connection` is not used.
+        replicas: Read replicas. If set, queries are read from the replica
+         outside of `transaction` and `use_primary` blocks and while
+         the database transaction of the connection is not finished.
+         The replica is chosen on the first read and kept until `disconnect`.
+        result_cache: The cache of query results. Usually shared by all 
+         sessions of the engine. Used by `Query`.cache. 
+
+    Attributes:
+        identity_map: Loaded rows of the session by the Primary Key.
+         Queries return the same object for the same row.
     """
 
-    def __init__(self, connection: Any, adapter: SqlAdapter):
+    def __init__(self, connection: Any, adapter: SqlAdapter,
+                 statement_cache: StatementCache | None = None,
+                 pool: ConnectionPool | None = None,
+                 replicas: ReplicaSet | None = None,
+                 result_cache: ResultCache | None = None):
         self.adapter = adapter
+        self.result_cache = result_cache
+        self._changed_tables: Set[str] = set()
         self._connection = connection
+        self._pool = pool
+        self._replicas = replicas
+        self._replica: Replica | None = None
+        self._replica_session: Session | None = None
+        self._primary_depth = 0
+        self.statement_cache = (statement_cache if statement_cache is not None
+                                else StatementCache())
+        self._transaction_depth = 0
+        self._savepoint_ids = count()
+        self._unit_of_work = UnitOfWork(adapter, self)
+        self.identity_map = IdentityMap()
 
     def __enter__(self):
         """Context Manage enter realization."""
@@ -36,34 +78,213 @@ class Session(ABC):
 
     @abstractmethod
     def connect(self):
-        """Create session connection."""
+        """Create session connection. 
+        Checks out the connection if the session has the pool."""
         logger.info('connect')
+        if self._pool is not None:
+            self._connection = self._pool.checkout()
 
     @abstractmethod
     def disconnect(self):
-        """Disconnect session."""
+        """Disconnect session.
+        Checks in the connection if the session has the pool."""
         logger.info('disconnect')
+        self._release_replica()
+        if self._pool is not None and self._connection is not None:
+            self._pool.checkin(self._connection)
+            self._connection = None
 
     @abstractmethod
-    def execute(self, sql: str):
+    def execute(self, sql: str, params: Sequence[Any] | None = None) -> int:
         """Excute sql.
 
         Args:
             sql: The SQL which will be execute.
+            params: The bound parameters of the SQL.
+
+        Returns:
+            int: The number of affected rows. -1 if unknown.
         """
         pass
 
-    @abstractmethod
     def commit(self):
-        """Commit any changes like insertion, deletion, updating."""
+        """Commit any changes like insertion, deletion, updating.
+        Does nothing inside `transaction`, the transaction is 
+        commited once at the block exit."""
+        if self._transaction_depth:
+            return
+        self._commit()
+
+    def rollback(self):
+        """Rolls back the current database transaction.
+        Inside `transaction` raise the exception instead.
+        Clears `identity_map`, its rows can be changed by the transaction."""
+        self.identity_map.clear()
+        self._rollback()
+
+    @property
+    def in_transaction(self) -> bool:
+        """True inside `transaction` or `savepoint` block."""
+        return self._transaction_depth > 0
+
+    @property
+    @abstractmethod
+    def autocommit(self) -> bool:
+        """The autocommit mode of the connection.
+        If True every stmp is commited by the database when executed,
+        `commit` calls are not needed. False by default.
+        The mode belongs to the connection, so it is shared 
+        by all sessions of the engine."""
+        pass
+
+    @autocommit.setter
+    @abstractmethod
+    def autocommit(self, value: bool):
+        """Sets the autocommit mode of the connection.
+
+        Args:
+            value: True for autocommit mode.
+        """
+        pass
+
+    @contextmanager
+    def transaction(self):
+        """Runs the block in one database transaction.
+        `commit` calls of DML stmps and `Migration` are suppressed,
+        the transaction is commited once at the block exit 
+        or rolled back if the block raises. 
+        The nested `transaction` joins the outer one,
+        use `savepoint` for partial rollbacks.
+
+        Example:
+            with session.transaction():
+                session.insert_item(user).commit()
+                session.update(User, {'age': 20}).commit()
+
+        Returns:
+            Session: The session.
+        """
+        if self._transaction_depth:
+            self._transaction_depth += 1
+            try:
+                yield self
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        self._begin()
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            self.identity_map.clear()
+            try:
+                self._rollback()
+            finally:
+                self._transaction_finished()
+            raise
+        self._transaction_depth -= 1
+        try:
+            self._commit()
+        finally:
+            self._transaction_finished()
+
+    @contextmanager
+    def savepoint(self):
+        """Runs the block in the savepoint of the transaction.
+        The block is rolled back to the savepoint if it raises,
+        the outer transaction continues if the exception is handled.
+        Starts `transaction` if called outside of it.
+
+        Example:
+            with session.transaction():
+                session.insert_item(user).commit()
+                try:
+                    with session.savepoint():
+                        session.insert_item(duplicate).commit()
+                except IntegrityError:
+                    pass
+
+        Returns:
+            Session: The session.
+        """
+        if not self._transaction_depth:
+            with self.transaction():
+                with self.savepoint():
+                    yield self
+            return
+
+        name = f'orm_savepoint_{next(self._savepoint_ids)}'
+        self.execute(self.adapter.savepoint(name))
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            self.execute(self.adapter.rollback_to_savepoint(name))
+            self.execute(self.adapter.release_savepoint(name))
+            raise
+        self._transaction_depth -= 1
+        self.execute(self.adapter.release_savepoint(name))
+
+    @contextmanager
+    def atomic(self):
+        """Runs the block in `transaction` or in `savepoint` if called
+        inside of it. All stmps of the block are saved or rolled back,
+        also when the outer transaction continues after the error.
+        Multi-stmp operations (chunked inserts and updates) run in it.
+
+        Returns:
+            Session: The session.
+        """
+        block = self.savepoint() if self._transaction_depth else self.transaction()
+        with block:
+            yield self
+
+    def tables_changed(self, *tablenames: str):
+        """Called after DML stmps change tables.
+        Invalidates cached results of their queries. Results are invalidated
+        again at the end of `transaction`, when changes are visible to others.
+
+        Args:
+            tablenames: The changed tables.
+        """
+        if self.result_cache is None:
+            return
+        self.result_cache.invalidate(tablenames)
+        if self._transaction_depth:
+            self._changed_tables.update(tablenames)
+
+    def _transaction_finished(self):
+        """Invalidates cached results of tables changed by the transaction."""
+        if self._changed_tables:
+            self.result_cache.invalidate(self._changed_tables)
+            self._changed_tables.clear()
+
+    def _begin(self):
+        """Begins the database transaction. 
+        Drivers override it if the transaction is not started implicitly."""
         pass
 
     @abstractmethod
-    def fetch_one(self, sql: str) -> Tuple[Any] | None:
+    def _commit(self):
+        """Commits the database transaction."""
+        pass
+
+    @abstractmethod
+    def _rollback(self):
+        """Rolls back the database transaction."""
+        pass
+
+    @abstractmethod
+    def fetch_one(self, sql: str,
+                  params: Sequence[Any] | None = None) -> Tuple[Any] | None:
         """Fetch one result of sql.
 
         Args:
             sql: The SQL which will be execute.
+            params: The bound parameters of the SQL.
 
         Returns:
             Tuple[Any] | None: Result of executing. None if result is empty.
@@ -71,17 +292,214 @@ class Session(ABC):
         pass
 
     @abstractmethod
-    def fetch_all(self, sql: str) -> List[Tuple[Any]]:
+    def fetch_all(self, sql: str,
+                  params: Sequence[Any] | None = None) -> List[Tuple[Any]]:
         """Fetch all results of sql.
 
         Args:
             sql: The SQL which will be execute.
+            params: The bound parameters of the SQL.
 
         Returns:
             List[Tuple[Any]]: Results of executing.
         """
         pass
 
+    @abstractmethod
+    def fetch_many(self, sql: str, batch_size: int,
+                   params: Sequence[Any] | None = None) -> Iterator[Tuple[Any]]:
+        """Fetch results of sql by batches. 
+        Keeps in memory no more than `batch_size` rows at once.
+
+        Args:
+            sql: The SQL which will be execute.
+            batch_size: The number of rows fetched from the database at once.
+            params: The bound parameters of the SQL.
+
+        Returns:
+            Iterator[Tuple[Any]]: Results of executing.
+        """
+        pass
+
+    def read_one(self, sql: str,
+                 params: Sequence[Any] | None = None) -> Tuple[Any] | None:
+        """Fetch one result of the query. From the replica if the session has it.
+        Check out `fetch_one`."""
+        return self._read('fetch_one', sql, params)
+
+    def read_all(self, sql: str,
+                 params: Sequence[Any] | None = None) -> List[Tuple[Any]]:
+        """Fetch all results of the query. From the replica if the session has it.
+        Check out `fetch_all`."""
+        return self._read('fetch_all', sql, params)
+
+    def read_many(self, sql: str, batch_size: int,
+                  params: Sequence[Any] | None = None) -> Iterator[Tuple[Any]]:
+        """Fetch results of the query by batches. From the replica 
+        if the session has it. Check out `fetch_many`."""
+        reader = self._reader()
+        if reader is self:
+            yield from self.fetch_many(sql, batch_size, params)
+            return
+
+        replica = self._replica
+        started = False
+        try:
+            for row in reader.fetch_many(sql, batch_size, params):
+                started = True
+                yield row
+            self._replicas.read(replica)
+            return
+        except Exception as error:
+            if started:
+                self._replica_failed(error)
+                raise
+            failure = error
+
+        rows = self.fetch_many(sql, batch_size, params)
+        first = next(rows, None)
+        self._replica_failed(failure)
+        if first is not None:
+            yield first
+            yield from rows
+
+    def data_version(self) -> Any:
+        """The data version of the database which the session reads from:
+        the replica or the primary. SQLite `PRAGMA data_version` 
+        is changed when other connections commit. `result_cache` is checked 
+        by the version of the reading connection, check out `ResultCache`.check_version.
+
+        Returns:
+            Any: The data version. None if the driver has no data version.
+        """
+        sql = self.adapter.data_version
+        if sql is None:
+            return None
+        reader = self._reader()
+        if reader is not self:
+            try:
+                version = reader.fetch_one(sql)[0]
+            except Exception as error:
+                self._replica_failed(error)
+                reader = self
+        if reader is self:
+            version = self.fetch_one(sql)[0]
+        if self.result_cache is not None:
+            self.result_cache.check_version(reader._connection, version)
+        return version
+
+    @contextmanager
+    def use_primary(self):
+        """Reads queries of the block from the primary database.
+        For example to read own writes which are not replicated yet.
+        Reads of `transaction` are always from the primary.
+
+        Example:
+            session.insert_item(user).commit()
+            with session.use_primary():
+                user = session.query(User).where(User.email, email).first()
+
+        Returns:
+            Session: The session.
+        """
+        self._primary_depth += 1
+        try:
+            yield self
+        finally:
+            self._primary_depth -= 1
+
+    def _reader(self) -> 'Session':
+        """The session for reading queries.
+        The session of the replica or self.
+
+        Returns:
+            Session: The session.
+        """
+        if self._replicas is None or self._primary_depth or self._transaction_depth \
+                or self._connection_in_transaction():
+            return self
+        if self._replica_session is None:
+            replica = self._replicas.choose()
+            if replica is None:
+                return self
+            session = self._create_replica_session(replica.pool)
+            try:
+                session.connect()
+            except Exception as error:
+                self._replicas.failed(replica, error)
+                return self
+            self._replica, self._replica_session = replica, session
+        return self._replica_session
+
+    def _connection_in_transaction(self) -> bool:
+        """True if the database transaction of the connection is not finished,
+        for example DML stmps are not commited yet outside of `transaction`.
+        Queries are read from the primary then, so the session reads own writes.
+        Drivers override it.
+
+        Returns:
+            bool: True if the transaction is not finished.
+        """
+        return False
+
+    def _read(self, method: str, sql: str, params: Sequence[Any] | None) -> Any:
+        """Reads the query from the replica.
+        If the replica fails the query is read from the primary. 
+        The replica is marked as failed if the primary succeeds.
+
+        Args:
+            method: The fetch method name.
+            sql: The SQL which will be execute.
+            params: The bound parameters of the SQL.
+
+        Returns:
+            Any: The result of the fetch method.
+        """
+        reader = self._reader()
+        if reader is self:
+            return getattr(self, method)(sql, params)
+        try:
+            result = getattr(reader, method)(sql, params)
+        except Exception as error:
+            result = getattr(self, method)(sql, params)
+            self._replica_failed(error)
+            return result
+        self._replicas.read(self._replica)
+        return result
+
+    def _create_replica_session(self, pool: ConnectionPool) -> 'Session':
+        """Creates the session of the replica.
+
+        Args:
+            pool: The pool of the replica connections.
+
+        Returns:
+            Session: The replica session of the same driver.
+        """
+        return type(self)(None, self.adapter, self.statement_cache, pool=pool)
+
+    def _replica_failed(self, error: Exception):
+        """Marks the replica of the session as failed and releases it."""
+        self._replicas.failed(self._replica, error)
+        self._release_replica()
+
+    def _release_replica(self):
+        """Disconnects the replica session."""
+        session = self._replica_session
+        self._replica, self._replica_session = None, None
+        if session is not None:
+            try:
+                session.disconnect()
+            except Exception:
+                logger.exception('replica disconnect')
+
+    def schema_changed(self):
+        """Called after DDL is executed. For example by `Migration`.
+        Clears `result_cache`. Drivers reset state which depends 
+        on the database schema."""
+        if self.result_cache is not None:
+            self.result_cache.clear()
+
     def query(self, model) -> Query:
         """Database query. 
         Query object contains the method for customization query like
@@ -121,6 +539,24 @@ class Session(ABC):
         """
         return Insert(self.adapter, self).add_items(items)
 
+    def bulk_insert(self, items: Iterable, chunk_size: int | None = None) -> List[int] | None:
+        """Inserts many items by chunks and commits them.
+        Items are consumed lazily, so a generator is never fully materialized.
+        The chunk is limited by the number of bound parameters of the driver.
+
+        Args:
+            items(Iterable[Model]): Adding items. All items should be one model.
+            chunk_size: The maximum number of items in one stmp.
+             1000 or less if the driver parameter limit is reached by default.
+
+        Returns:
+            List[int] | None: Ids of adding items. None if column_id is not exist.
+
+        Raises:
+            DifferentModelsTypeError: if items are different models.
+        """
+        return Insert(self.adapter, self, chunk_size).add_items(items).commit()
+
     def delete(self, model) -> Delete:
         """Delete stmt. 
         Stmt object contains the method for customization stmt like
@@ -148,6 +584,89 @@ class Session(ABC):
         """
         return Update(model, self.adapter, self, name_value)
 
+    def bulk_update(self, model, items: Iterable, key=None,
+                    chunk_size: int | None = None) -> int:
+        """Updates many rows with different values and commits them.
+        One stmp per chunk: `UPDATE ... FROM (VALUES ...)` on PostgreSQL,
+        `CASE` on SQLite.
+
+        Args:
+            model(Model): Table model.
+            items: Models or dicts of column name and value.
+             Every item should have the key value. Can be a generator.
+            key(Column): The column which identifies rows.
+             The Primary Key by default.
+            chunk_size: The maximum number of rows in one stmp.
+             1000 or less if the driver parameter limit is reached by default.
+
+        Returns:
+            int: The number of updated rows.
+        """
+        return BulkUpdate(model, self.adapter, self, key, chunk_size).commit(items)
+
+    def add(self, item):
+        """Adds the row to the unit of work. Executed by `flush`.
+        The new row is inserted, changed columns of the loaded row are updated.
+
+        Args:
+            item(Model): The row.
+        """
+        self._unit_of_work.add(item)
+
+    def add_all(self, items: Iterable):
+        """Adds rows to the unit of work. Check out `add`.
+
+        Args:
+            items(Iterable[Model]): The rows.
+        """
+        for item in items:
+            self._unit_of_work.add(item)
+
+    def remove(self, item):
+        """Marks the row for deleting by `flush`.
+
+        Args:
+            item(Model): The row.
+        """
+        self._unit_of_work.remove(item)
+
+    def get(self, model, key: Any):
+        """Finds the row by the Primary Key value.
+        The row of `identity_map` is returned without a query.
+        Otherwise the row is queried and added to `identity_map`.
+
+        Args:
+            model(Model): Table model.
+            key: The Primary Key value.
+
+        Returns:
+            Model | None: The row. None if not exist.
+
+        Raises:
+            ValueError: The model has no Primary Key.
+        """
+        row = self.identity_map.get(model, key)
+        if row is not None:
+            return row
+        primary_key = model.__schema__.primary_key
+        if primary_key is None:
+            raise ValueError(f'{model.__name__} has no Primary Key.')
+        return self.query(model).where(primary_key, key).first()
+
+    def flush(self):
+        """Executes pending changes of `add`, `add_all`, `remove`
+        in one transaction and commits them.
+        Stmps are grouped by table and shape: one multi-row INSERT,
+        one bulk UPDATE and one DELETE per table and chunk.
+        Inserts go parents first and deletes go children first 
+        by Foreign Keys. Inside `transaction` joins it.
+        Changed rows of `identity_map` are updated without `add`.
+
+        Raises:
+            ValueError: The updating or deleting row has no Primary Key value.
+        """
+        self._unit_of_work.flush(self.identity_map.rows())
+
     def create_table(self, model) -> CreateTable:
         """Create table stmt. No need to call `commit`. 
         Creates a table instantly.
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Hashable
+
+from .schemas import CacheStats
+
+
+class StatementCache:
+    """LRU cache of SQL stmps by their shape.
+    The shape is the table, columns, structure of conditions, limit, etc.
+    Values of the stmp are not a part of the shape, they are bound parameters.
+
+    Args:
+        maxsize: The maximum number of cached stmps. 256 by default.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._items: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> str | None:
+        """Finds SQL by the stmp shape.
+
+        Args:
+            key: The stmp shape.
+
+        Returns:
+            str | None: SQL of the stmp. None if not cached.
+        """
+        with self._lock:
+            sql = self._items.get(key)
+            if sql is None:
+                self._misses += 1
+                return None
+            self._items.move_to_end(key)
+            self._hits += 1
+            return sql
+
+    def put(self, key: Hashable, sql: str):
+        """Caches SQL of the stmp shape. 
+        Evicts the least recently used stmp if the cache is full.
+
+        Args:
+            key: The stmp shape.
+            sql: SQL of the stmp.
+        """
+        with self._lock:
+            self._items[key] = sql
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        """Removes all cached stmps. Counters are not reset."""
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> CacheStats:
+        """Statistic of the cache.
+
+        Returns:
+            CacheStats: The cache statistic.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._items),
+                maxsize=self.maxsize,
+            )
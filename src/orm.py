@@ -1,5 +1,6 @@
 from _core.ddl.column import Column
 from _core.ddl.model import Model
+from _core.ddl.model_schema import ModelSchema
 
 from _core.ddl.column_types.integer import IntegerColumnType
 from _core.ddl.column_types.string import StringColumnType
@@ -7,14 +8,24 @@ from _core.ddl.column_types.datatime import DatetimeColumnType
 from _core.ddl.column_types.boolean import BooleanColumnType
 from _core.ddl.column_types.primary_key import PrimaryKeyColumnType
 from _core.ddl.foreign_key import ForeignKey
+from _core.ddl.index import Index
+from _core.ddl.relationship import Relationship
 from _core.ddl.migration import Migration
 
 from _core.engine import Engine
+from _core.async_engine import AsyncEngine
 from _core.db_url import DbUrl
 
 from _core.session import Session
-from _core.create_session import create_session
+from _core.async_session import AsyncSession
+from _core.create_session import create_session, create_async_session
 
 from _core.dml.query import Query
+from _core.dml.compiled_query import CompiledQuery
+from _core.dml.async_stmps import AsyncQuery
+from _core.statement_cache import StatementCache
+from _core.schemas import Page
+from _core.pool import ConnectionPool
+from _core.errors import PoolTimeoutError
 
 from _core.functions.datetime import datetime_now
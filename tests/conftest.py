@@ -39,10 +39,10 @@ class Project(Model):
 
 
 @pytest.fixture(scope='session')
-def db_session(request) -> Generator:
+def db_session(tmp_path_factory) -> Generator:
     url = DbUrl(
         driver='sqlite3',
-        database='tests/test.sqlite3',
+        database=str(tmp_path_factory.mktemp('db') / 'test.sqlite3'),
     )
 
     def on_create(create_tables):
@@ -0,0 +1,109 @@
+import pytest
+
+from _core.ddl.errors import MigrationError
+from _core.drivers.psycopg2.sql_adapter import Psycopg2SqlAdapter
+from src.orm import (BooleanColumnType, Column, DbUrl, Engine, Index,
+                     IntegerColumnType, Migration, Model, PrimaryKeyColumnType,
+                     StringColumnType, create_session)
+
+
+class Account(Model):
+    __tablename__ = 'account'
+
+    id = Column(name='id', type=PrimaryKeyColumnType(
+        type=IntegerColumnType(), autoincrement=True), unique=True)
+    email = Column(name='email', type=StringColumnType())
+    name = Column(name='name', type=StringColumnType())
+    is_active = Column(name='is_active', type=BooleanColumnType(default=True))
+    __indexes__ = [
+        Index('account_email_idx', email, unique=True, where='is_active = 1'),
+        Index('account_name_idx', [name, 'is_active'], include=[email]),
+    ]
+
+
+class RecordingSession:
+    """The session which records executed SQL and the autocommit mode."""
+
+    def __init__(self, in_transaction=False):
+        self.executed = []
+        self.autocommit = False
+        self.in_transaction = in_transaction
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, self.autocommit))
+
+    def commit(self):
+        pass
+
+    def schema_changed(self):
+        pass
+
+
+@pytest.fixture
+def engine(tmp_path):
+    def on_create(create_tables):
+        create_tables([Account])
+
+    url = DbUrl(driver='sqlite3', database=str(tmp_path / 'index.sqlite3'))
+    engine = Engine(url, on_create=on_create)
+    yield engine
+    engine.disconnect()
+
+
+def _indexes(session):
+    rows = session.fetch_all(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' "
+        "AND tbl_name = 'account' AND sql IS NOT NULL ORDER BY name;")
+    return dict(rows)
+
+
+def test_schema_indexes():
+    assert [index.name for index in Account.__schema__.indexes] == \
+        ['account_email_idx', 'account_name_idx']
+    assert Account.__schema__.indexes[1].columns == ['name', 'is_active']
+
+
+def test_create_table_indexes(engine):
+    with create_session(engine) as session:
+        indexes = _indexes(session)
+    assert indexes['account_email_idx'] == \
+        'CREATE UNIQUE INDEX account_email_idx ON account(email) WHERE is_active = 1'
+    assert indexes['account_name_idx'] == \
+        'CREATE INDEX account_name_idx ON account(name, is_active, email)'
+
+
+def test_migration_indexes(engine):
+    with create_session(engine) as session:
+        migration = Migration(engine.adapter, session)
+        migration.create_index('account', Index('account_id_name_idx', ['id', 'name']))
+        assert 'account_id_name_idx' in _indexes(session)
+        migration.drop_index('account_id_name_idx')
+        migration.drop_index('account_id_name_idx')
+        assert 'account_id_name_idx' not in _indexes(session)
+
+
+def test_postgres_sql():
+    adapter = Psycopg2SqlAdapter()
+    index = Index('account_name_idx', Account.name, where='is_active',
+                  include=[Account.email])
+    assert index.sql(adapter, 'account', concurrently=True) == \
+        'CREATE INDEX CONCURRENTLY account_name_idx ON account(name) ' \
+        'INCLUDE (email) WHERE is_active;'
+    assert adapter.drop_index('account_name_idx', concurrently=True) == \
+        'DROP INDEX CONCURRENTLY IF EXISTS account_name_idx;'
+
+
+def test_postgres_migration_autocommit():
+    session = RecordingSession()
+    migration = Migration(Psycopg2SqlAdapter(), session)
+    migration.create_index('account', Index('account_name_idx', 'name'))
+    migration.drop_index('account_name_idx', concurrently=False)
+    assert session.executed == [
+        ('CREATE INDEX CONCURRENTLY account_name_idx ON account(name);', True),
+        ('DROP INDEX IF EXISTS account_name_idx;', False),
+    ]
+    assert session.autocommit is False
+
+    migration = Migration(Psycopg2SqlAdapter(), RecordingSession(in_transaction=True))
+    with pytest.raises(MigrationError):
+        migration.create_index('account', Index('account_name_idx', 'name'))
@@ -0,0 +1,105 @@
+import pytest
+
+from _core.ddl.errors import ValueError
+from tests.conftest import User, Project
+
+
+def test_class_attribute_is_column():
+    assert User.email.name == 'email'
+    assert User(email='alexm@str.com').table_id is User.id
+
+
+def test_instance_attribute_is_value():
+    user = User(email='alexm@str.com', age=20)
+    assert user.email == 'alexm@str.com'
+    assert user.age == 20
+    assert user.is_admin is None
+
+    user.age = 21
+    assert user.age == 21
+    assert user.dict['age'] == 21
+
+
+def test_set_not_valid_value():
+    user = User(email='alexm@str.com')
+    with pytest.raises(ValueError):
+        user.age = 'twenty'
+    with pytest.raises(ValueError):
+        user.email = None
+    with pytest.raises(ValueError):
+        User(email=None)
+
+
+def test_unknown_column():
+    with pytest.raises(TypeError):
+        User(name='alexm')
+
+
+def test_boolean_value_fixed():
+    project = Project(user_id=1, is_active=1)
+    assert project.is_active is True
+
+
+def test_instances_do_not_share_values():
+    user1 = User(email='alexm1@str.com')
+    user2 = User(email='alexm2@str.com')
+    assert user1.email == 'alexm1@str.com'
+    assert user2.email == 'alexm2@str.com'
+
+
+def test_schema():
+    schema = Project.__schema__
+    assert schema.tablename == 'project'
+    assert schema.field_names == ('id', 'user_id', 'is_active')
+    assert schema.field_index['user_id'] == 1
+    assert schema.column_index['is_active'] == 2
+    assert schema.primary_key is Project.id
+    assert schema.primary_key_index == 0
+    assert len(schema.foreign_keys) == 1
+    assert schema.unique_columns == (Project.id, Project.user_id)
+
+
+def test_schema_is_immutable():
+    schema = User.__schema__
+    with pytest.raises(Exception):
+        schema.tablename = 'users'
+    with pytest.raises(TypeError):
+        schema.field_index['email'] = 0
+
+
+def test_schema_foreign_keys_list():
+    from src.orm import Model, Column, IntegerColumnType, ForeignKey
+
+    class Test(Model):
+        __tablename__ = 'test'
+        value = Column(name='value', type=IntegerColumnType())
+        value2 = Column(name='value2', type=IntegerColumnType())
+        __foreignkeys__ = [
+            ForeignKey('fk_1', 'value', 'test1', 'id'),
+            ForeignKey('fk_2', 'value2', 'test2', 'id'),
+        ]
+
+    assert len(Test.fkeys()) == 2
+    assert all(isinstance(fkey, ForeignKey) for fkey in Test.fkeys())
+
+
+def test_from_row_decodes_values():
+    project = Project._from_row((1, 2, 1))
+    assert project.id == 1
+    assert project.user_id == 2
+    assert project.is_active is True
+
+    project = Project._from_row((1, 2, None))
+    assert project.is_active is None
+
+
+def test_dirty_tracking():
+    user = User._from_row((1, 'a@str.com', 18, 1, None))
+    assert user._persistent
+    assert user._changes() == {}
+    user.age = 20
+    user.email = 'b@str.com'
+    assert user._changes() == {'email': 'b@str.com', 'age': 20}
+    user._flushed()
+    assert user._changes() == {}
+    assert not User(age=1)._persistent
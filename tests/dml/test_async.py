@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from src.orm import AsyncEngine, DbUrl, create_async_session
+from tests.conftest import Project, User
+
+
+@pytest.fixture
+def engine(tmp_path):
+    def on_create(create_tables):
+        create_tables([User, Project])
+
+    url = DbUrl(driver='sqlite3', database=str(tmp_path / 'async.sqlite3'))
+    engine = AsyncEngine(url, on_create=on_create, max_in_flight=2)
+    yield engine
+    asyncio.run(engine.disconnect())
+
+
+def test_async_crud(engine):
+    async def main():
+        async with create_async_session(engine) as session:
+            ids = await session.insert_items(
+                [User(email=f'{i}@async.com', age=i) for i in range(5)]).commit()
+            assert len(ids) == 5
+
+            users = await session.query(User).where(User.age, 2, '>=').all()
+            assert [user.age for user in users] == [2, 3, 4]
+            assert await session.get(User, ids[0]) is not None
+
+            updated = await session.update(User, {'is_admin': False}).\
+                where(User.age, 3, '<').commit()
+            assert updated == 3
+            assert await session.query(User).where(User.is_admin, False).\
+                scalars(User.email) == ['0@async.com', '1@async.com', '2@async.com']
+
+            await session.bulk_update(User, [{'id': ids[0], 'age': 40}])
+            assert (await session.get(User, ids[0])).age == 40
+
+            assert await session.delete(User).where(User.age, 4).commit() == 1
+            emails = [user.email async for user in session.query(User).iter(batch_size=2)]
+            assert len(emails) == 4
+
+    asyncio.run(main())
+
+
+def test_async_transaction_rollback(engine):
+    async def main():
+        async with create_async_session(engine) as session:
+            with pytest.raises(RuntimeError):
+                async with session.transaction():
+                    await session.insert_item(User(email='rolled@async.com')).commit()
+                    raise RuntimeError
+            assert await session.query(User).first() is None
+
+            async with session.transaction():
+                await session.insert_item(User(email='kept@async.com')).commit()
+                with pytest.raises(RuntimeError):
+                    async with session.savepoint():
+                        await session.insert_item(User(email='savepoint@async.com')).commit()
+                        raise RuntimeError
+            assert await session.query(User).scalars(User.email) == ['kept@async.com']
+
+    asyncio.run(main())
+
+
+def test_async_concurrent_sessions(engine):
+    async def insert(number: int):
+        async with create_async_session(engine) as session:
+            await session.bulk_insert(
+                [User(email=f'{number}-{i}@async.com') for i in range(10)])
+
+    async def main():
+        await asyncio.gather(*(insert(number) for number in range(4)))
+        async with create_async_session(engine) as session:
+            return len(await session.query(User).all())
+
+    assert asyncio.run(main()) == 40
+
+
+def test_async_query_is_not_iterable(engine):
+    async def main():
+        async with create_async_session(engine) as session:
+            with pytest.raises(TypeError):
+                list(session.query(User))
+
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+import gc
+
+from src.orm import Session
+from tests.conftest import User
+from tests.init_funcs import insert_all, delete_all
+
+
+def test_get_without_query(db_session: Session, mocker):
+    insert_all(db_session)
+    user = db_session.query(User).where(User.email, 'alexm1@str.com').first()
+    fetch_one = mocker.spy(db_session, 'fetch_one')
+
+    assert db_session.get(User, user.id) is user
+    assert fetch_one.call_count == 0
+    assert db_session.query(User).where(User.id, user.id).first() is user
+    delete_all(db_session)
+
+
+def test_get_queries_missing_row(db_session: Session, mocker):
+    insert_all(db_session)
+    ids = [user.id for user in db_session.query(User).all()]
+    db_session.identity_map.clear()
+    fetch_one = mocker.spy(db_session, 'fetch_one')
+
+    user = db_session.get(User, ids[0])
+    assert user.id == ids[0]
+    assert db_session.get(User, ids[0]) is user
+    assert fetch_one.call_count == 1
+    assert db_session.get(User, -1) is None
+    delete_all(db_session)
+
+
+def test_inserted_rows_in_map(db_session: Session, mocker):
+    user = User(email='map@str.com', age=1)
+    db_session.insert_item(user).commit()
+    fetch_one = mocker.spy(db_session, 'fetch_one')
+    assert db_session.get(User, user.id) is user
+    assert fetch_one.call_count == 0
+    delete_all(db_session)
+
+
+def test_query_refreshes_clean_rows(db_session: Session):
+    insert_all(db_session)
+    user = db_session.query(User).where(User.email, 'alexm1@str.com').first()
+    db_session.bulk_update(User, [{'id': user.id, 'age': 60}])
+    assert db_session.get(User, user.id) is not user
+
+    users = db_session.query(User).all()
+    changed = users[0]
+    changed.age = 70
+    assert db_session.query(User).where(User.id, changed.id).first().age == 70
+
+    db_session.flush()
+    assert db_session.query(User).where(User.id, changed.id).first().age == 70
+    delete_all(db_session)
+
+
+def test_weak_references(db_session: Session):
+    insert_all(db_session)
+    db_session.identity_map.clear()
+    users = db_session.query(User).all()
+    assert len(db_session.identity_map) == 3
+    del users
+    gc.collect()
+    assert len(db_session.identity_map) == 0
+    delete_all(db_session)
@@ -0,0 +1,108 @@
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from _core.dml.errors import DifferentModelsTypeError
+from src.orm import Session
+from tests.conftest import User, Project
+from tests.init_funcs import delete_all
+
+
+def users(count: int, start: int = 0):
+    now = datetime.now()
+    for i in range(start, start + count):
+        yield User(age=i, email=f'bulk{i}@str.com', is_admin=i % 2 == 0,
+                   create_at=now)
+
+
+def test_bulk_insert_generator_by_chunks(db_session: Session, mocker):
+    fetch_all = mocker.spy(db_session, 'fetch_all')
+    ids = db_session.bulk_insert(users(25), chunk_size=10)
+
+    assert fetch_all.call_count == 3
+    assert len(ids) == 25
+    assert len(set(ids)) == 25
+    result = db_session.query(User).all()
+    assert len(result) == 25
+    by_id = {user.id: user for user in result}
+    assert by_id[ids[24]].email == 'bulk24@str.com'
+    assert by_id[ids[3]].is_admin is False
+    delete_all(db_session)
+
+
+def test_bulk_insert_param_limit(db_session: Session, mocker):
+    mocker.patch.object(type(db_session.adapter), 'max_params',
+                        new_callable=mocker.PropertyMock, return_value=20)
+    fetch_all = mocker.spy(db_session, 'fetch_all')
+    ids = db_session.bulk_insert(users(9))
+
+    # 5 columns, 20 parameters: 4 rows in one stmp.
+    assert fetch_all.call_count == 3
+    for call in fetch_all.call_args_list:
+        assert len(call.args[1]) <= 20
+    assert len(ids) == 9
+    delete_all(db_session)
+
+
+def test_bulk_insert_without_autoincrement(db_session: Session):
+    user_ids = db_session.bulk_insert(users(3))
+    projects = (Project(id=i, user_id=user_id)
+                for i, user_id in enumerate(user_ids, 1))
+    ids = db_session.bulk_insert(projects, chunk_size=2)
+
+    assert ids == [1, 2, 3]
+    assert len(db_session.query(Project).all()) == 3
+    db_session.delete(Project).commit()
+    delete_all(db_session)
+
+
+def test_bulk_insert_empty(db_session: Session):
+    assert db_session.bulk_insert(iter([])) is None
+
+
+def test_bulk_insert_different_items(db_session: Session):
+    items = [*users(1), Project(id=1, user_id=1)]
+    with pytest.raises(DifferentModelsTypeError):
+        db_session.bulk_insert(items)
+
+
+def test_bulk_insert_different_items_rolls_back_chunks(db_session: Session):
+    items = [*users(5), Project(id=1, user_id=1)]
+    with pytest.raises(DifferentModelsTypeError):
+        db_session.bulk_insert(items, chunk_size=2)
+
+    assert not db_session.in_transaction
+    assert db_session.query(User).count() == 0
+    assert all(not item._persistent and item.id is None for item in items[:4])
+    ids = db_session.bulk_insert(items[:5], chunk_size=2)
+    assert len(ids) == 5
+    delete_all(db_session)
+
+
+def test_bulk_insert_failed_chunk_rolls_back(db_session: Session):
+    items = [*users(3), User(email='bulk0@str.com')]
+    with pytest.raises(sqlite3.IntegrityError):
+        db_session.bulk_insert(items, chunk_size=2)
+
+    assert not db_session.in_transaction
+    assert db_session.query(User).count() == 0
+    assert all(not item._persistent and item.id is None for item in items)
+    assert len(db_session.identity_map) == 0
+
+
+def test_bulk_insert_failed_chunk_in_transaction(db_session: Session):
+    with db_session.transaction():
+        db_session.insert_item(User(email='kept@str.com')).commit()
+        items = [*users(3), User(email='bulk0@str.com')]
+        with pytest.raises(sqlite3.IntegrityError):
+            db_session.bulk_insert(items, chunk_size=2)
+        assert all(not item._persistent for item in items)
+
+    assert db_session.query(User).scalars(User.email) == ['kept@str.com']
+    delete_all(db_session)
+
+
+def test_bulk_insert_wrong_chunk_size(db_session: Session):
+    with pytest.raises(ValueError):
+        db_session.bulk_insert(users(1), chunk_size=0)
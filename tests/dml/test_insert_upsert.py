@@ -0,0 +1,68 @@
+from datetime import datetime
+
+import pytest
+
+from _core.dml.errors import ColumnNotFoundError
+from src.orm import Session
+from tests.conftest import User, Project
+from tests.init_funcs import insert_all, delete_all
+
+
+def test_upsert_update(db_session: Session, mocker):
+    insert_all(db_session)
+    now = datetime.now()
+    items = [
+        User(email='alexm1@str.com', age=30, is_admin=False, create_at=now),
+        User(email='alexm4@str.com', age=40, is_admin=False, create_at=now),
+    ]
+    fetch_all = mocker.spy(db_session, 'fetch_all')
+    ids = db_session.insert_items(items).\
+        on_conflict([User.email], update=[User.age]).\
+        commit()
+
+    assert fetch_all.call_count == 1
+    assert 'ON CONFLICT (email) DO UPDATE SET' in fetch_all.call_args.args[0]
+    assert len(ids) == 2
+    users = {user.email: user for user in db_session.query(User).all()}
+    assert len(users) == 4
+    assert users['alexm1@str.com'].age == 30
+    assert users['alexm1@str.com'].is_admin is True
+    assert users['alexm4@str.com'].age == 40
+    delete_all(db_session)
+
+
+def test_upsert_update_all_columns(db_session: Session):
+    insert_all(db_session)
+    item = User(email='alexm2@str.com', age=50, is_admin=True,
+                create_at=datetime.now())
+    db_session.insert_item(item).on_conflict([User.email]).commit()
+
+    user = db_session.query(User).where(User.email, 'alexm2@str.com').first()
+    assert user.age == 50
+    assert user.is_admin is True
+    delete_all(db_session)
+
+
+def test_upsert_do_nothing(db_session: Session):
+    insert_all(db_session)
+    items = (User(email=f'alexm{i}@str.com', age=99) for i in range(1, 6))
+    ids = db_session.insert_items(items).\
+        on_conflict([User.email], do_nothing=True).\
+        commit()
+
+    assert len(ids) == 2
+    users = db_session.query(User).all()
+    assert len(users) == 5
+    assert sorted(user.age for user in users) == [18, 19, 20, 99, 99]
+    delete_all(db_session)
+
+
+def test_upsert_wrong_arguments(db_session: Session):
+    with pytest.raises(ValueError):
+        db_session.insert_items([]).on_conflict([])
+    with pytest.raises(ValueError):
+        db_session.insert_items([]).on_conflict(
+            [User.email], update=[User.age], do_nothing=True)
+    with pytest.raises(ColumnNotFoundError):
+        db_session.insert_items([User(email='a@str.com')]).\
+            on_conflict([Project.user_id]).commit()
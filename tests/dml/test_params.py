@@ -0,0 +1,70 @@
+from datetime import datetime
+
+from src.orm import Session, datetime_now
+from tests.conftest import User
+from tests.init_funcs import insert_all, delete_all
+
+
+def test_query_sql_params(db_session: Session):
+    sql, params = db_session.query(User).\
+        where(User.email, 'alexm1@str.com').\
+        and_(User.age, 18).\
+        _sql()
+    assert 'alexm1@str.com' not in sql
+    assert sql.count(db_session.adapter.placeholder) == 2
+    assert params == ['alexm1@str.com', 18]
+
+
+def test_same_sql_for_different_values(db_session: Session):
+    sql1, params1 = db_session.query(User).where(User.age, 18)._sql()
+    sql2, params2 = db_session.query(User).where(User.age, 19)._sql()
+    assert sql1 == sql2
+    assert params1 != params2
+
+
+def test_quoted_values(db_session: Session):
+    item = User(email="o'brien@str.com", age=18, create_at=datetime.now())
+    db_session.insert_item(item).commit()
+    user = db_session.query(User).\
+        where(User.email, "o'brien@str.com").\
+        first()
+    assert user is not None
+    assert user.email == "o'brien@str.com"
+
+    db_session.update(User, {'email': "o'neil@str.com", 'age': 30}).\
+        where(User.email, "o'brien@str.com").\
+        commit()
+    user = db_session.query(User).first()
+    assert user.email == "o'neil@str.com"
+    assert user.age == 30
+
+    db_session.delete(User).\
+        where(User.email, "o'neil@str.com").\
+        commit()
+    assert db_session.query(User).first() is None
+
+
+def test_function_values_rendered(db_session: Session):
+    insert_all(db_session)
+    db_session.update(User, {'create_at': datetime_now}).commit()
+    sql, params = db_session.query(User).\
+        where(User.create_at, datetime_now, '<=')._sql()
+    assert db_session.adapter.datetime_now in sql
+    assert params == []
+    assert len(db_session.query(User).where(User.create_at, datetime_now, '<=').all()) == 3
+    delete_all(db_session)
+
+
+def test_literal_mode(db_session: Session):
+    adapter = db_session.adapter
+    adapter.bind_params = False
+    try:
+        sql, params = db_session.query(User).where(User.age, 18)._sql()
+        assert params == []
+        assert 'age = 18' in sql
+        insert_all(db_session)
+        users = db_session.query(User).where(User.email, 'alexm1@str.com').all()
+        assert len(users) == 1
+        delete_all(db_session)
+    finally:
+        adapter.bind_params = True
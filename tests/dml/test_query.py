@@ -47,3 +47,31 @@ def test_query_where_and_all(db_session: Session):
     assert len(users) == 1
 
     delete_all(db_session)
+
+
+def test_query_all_values(db_session: Session):
+    insert_all(db_session)
+    users = db_session.query(User).\
+        where(User.email, 'alexm2@str.com').\
+        all()
+    assert len(users) == 1
+    user = users[0]
+    assert isinstance(user, User)
+    assert user.age == 19
+    assert not user.is_admin
+    assert user.dict['email'] == 'alexm2@str.com'
+
+    user.age = 30
+    assert user.age == 30
+    delete_all(db_session)
+
+
+def test_query_iter(db_session: Session):
+    insert_all(db_session)
+    users = list(db_session.query(User).iter(batch_size=2))
+    assert len(users) == 3
+    assert {user.age for user in users} == {18, 19, 20}
+
+    emails = [user.email for user in db_session.query(User).where(User.age, 19)]
+    assert emails == ['alexm2@str.com']
+    delete_all(db_session)
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from src.orm import (AsyncEngine, Column, DbUrl, Engine,
+                     IntegerColumnType, Model, PrimaryKeyColumnType,
+                     StringColumnType, create_async_session, create_session)
+
+
+class Sale(Model):
+    __tablename__ = 'sale'
+
+    id = Column(name='id', type=PrimaryKeyColumnType(
+        type=IntegerColumnType(), autoincrement=True), unique=True)
+    region = Column(name='region', type=StringColumnType())
+    amount = Column(name='amount', type=IntegerColumnType())
+
+
+@pytest.fixture
+def engine(tmp_path):
+    def on_create(create_tables):
+        create_tables([Sale])
+
+    url = DbUrl(driver='sqlite3', database=str(tmp_path / 'aggregate.sqlite3'))
+    engine = Engine(url, on_create=on_create)
+    with create_session(engine) as session:
+        session.insert_items(
+            [Sale(region='north', amount=amount) for amount in (10, 20, 30)] +
+            [Sale(region='south', amount=amount) for amount in (5, 15)]).commit()
+    yield engine
+    engine.disconnect()
+
+
+@pytest.fixture
+def session(engine):
+    with create_session(engine) as session:
+        yield session
+
+
+def test_count_and_exists(session, mocker):
+    spy = mocker.spy(session, 'read_one')
+    assert session.query(Sale).count() == 5
+    assert session.query(Sale).where(Sale.region, 'south').count() == 2
+    assert session.query(Sale).limit(3).count() == 3
+    assert 'COUNT(*)' in spy.call_args_list[0].args[0]
+    assert session.query(Sale).where(Sale.amount, 15, '>').exists()
+    assert not session.query(Sale).where(Sale.region, 'west').exists()
+
+
+def test_aggregate(session):
+    row = session.query(Sale).aggregate(
+        count=True, sum=Sale.amount, min=Sale.amount, max=[Sale.amount, Sale.region])
+    assert row == (5, 80, 5, 30, 'south')
+    assert (row.count, row.sum_amount, row.max_region) == (5, 80, 'south')
+    assert session.query(Sale).where(Sale.region, 'west').\
+        aggregate(sum=Sale.amount).sum_amount is None
+    with pytest.raises(ValueError):
+        session.query(Sale).aggregate()
+
+
+def test_group_by_having(session):
+    rows = session.query(Sale).group_by(Sale.region).\
+        aggregate(count=True, avg=Sale.amount)
+    assert sorted(rows) == [('north', 3, 20.0), ('south', 2, 10.0)]
+    assert rows[0]._fields == ('region', 'count', 'avg_amount')
+
+    query = session.query(Sale).group_by(Sale.region).\
+        having('sum', Sale.amount, 30, '>')
+    assert [row.region for row in query.aggregate(count=True)] == ['north']
+    assert query.count() == 1
+    assert query.exists()
+    assert not session.query(Sale).group_by(Sale.region).\
+        having('count', None, 3, '>').exists()
+    with pytest.raises(ValueError):
+        session.query(Sale).having('median', Sale.amount, 1)
+
+
+def test_async_aggregate(tmp_path, engine):
+    async def main():
+        async_engine = AsyncEngine(
+            DbUrl(driver='sqlite3', database=str(tmp_path / 'aggregate.sqlite3')))
+        try:
+            async with create_async_session(async_engine) as session:
+                return (await session.query(Sale).count(),
+                        await session.query(Sale).exists(),
+                        await session.query(Sale).aggregate(max=Sale.amount))
+        finally:
+            await async_engine.disconnect()
+
+    assert asyncio.run(main()) == (5, True, (30,))
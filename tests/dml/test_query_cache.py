@@ -0,0 +1,118 @@
+import pytest
+
+from _core.result_cache import MISS, ResultCache
+from src.orm import (Column, DbUrl, Engine, Migration, StringColumnType,
+                     create_session)
+from tests.conftest import Project, User
+
+
+def on_create(create_tables):
+    create_tables([User, Project])
+
+
+@pytest.fixture
+def url(tmp_path):
+    return DbUrl(driver='sqlite3', database=str(tmp_path / 'cache.sqlite3'))
+
+
+@pytest.fixture
+def engine(url):
+    engine = Engine(url, on_create=on_create)
+    yield engine
+    engine.disconnect()
+
+
+def test_cached_query(engine, mocker):
+    with create_session(engine) as session:
+        session.insert_items([User(email=f'{i}@cache.com', age=i)
+                              for i in range(3)]).commit()
+        spy = mocker.spy(session, 'read_all')
+        query = session.query(User).where(User.age, 1, '>=').cache()
+        assert len(query.all()) == 2
+        assert len(session.query(User).where(User.age, 1, '>=').cache().all()) == 2
+        assert session.query(User).where(User.age, 1, '>=').cache().\
+            scalars(User.email) == ['1@cache.com', '2@cache.com']
+        assert spy.call_count == 2
+
+        session.query(User).where(User.age, 1, '>=').all()
+        assert spy.call_count == 3
+
+    stats = engine.result_cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+
+
+def test_dml_invalidates_table(engine):
+    with create_session(engine) as session:
+        session.insert_item(User(email='first@cache.com')).commit()
+        query = lambda: session.query(User).cache().all()
+        assert len(query()) == 1
+        session.query(Project).cache().all()
+
+        session.insert_item(User(email='second@cache.com')).commit()
+        assert len(query()) == 2
+        session.update(User, {'age': 30}).commit()
+        assert {user.age for user in query()} == {30}
+        session.delete(User).where(User.email, 'first@cache.com').commit()
+        assert len(query()) == 1
+
+        with session.transaction():
+            session.insert_item(User(email='third@cache.com')).commit()
+            assert len(query()) == 2
+        assert len(query()) == 2
+
+    stats = engine.result_cache.stats()
+    assert stats.size == 2
+    assert stats.invalidations == 4
+
+
+def test_migration_clears_cache(engine):
+    with create_session(engine) as session:
+        session.query(User).cache().all()
+        Migration(engine.adapter, session).add_column(
+            'project', Column(name='note', type=StringColumnType()))
+    assert engine.result_cache.stats().size == 0
+
+
+def test_other_process_changes(engine, url):
+    with create_session(engine) as session:
+        query = lambda: session.query(User).cache().all()
+        assert query() == []
+
+        other = Engine(url, on_create=on_create)
+        with create_session(other) as other_session:
+            other_session.insert_item(User(email='other@cache.com')).commit()
+        other.disconnect()
+
+        assert len(query()) == 1
+        assert len(query()) == 1
+    stats = engine.result_cache.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_new_connection_keeps_cache(engine, mocker):
+    with create_session(engine) as session:
+        assert session.query(User).cache().all() == []
+        with create_session(engine) as other:
+            assert other._connection is not session._connection
+            spy = mocker.spy(other, 'read_all')
+            assert other.query(User).cache().all() == []
+            assert spy.call_count == 0
+    stats = engine.result_cache.stats()
+    assert (stats.hits, stats.misses, stats.invalidations) == (1, 1, 0)
+
+
+def test_ttl_and_lru(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr('_core.result_cache.monotonic', lambda: now[0])
+    cache = ResultCache(maxsize=2)
+    cache.put('a', 1, ('user',), ttl=10)
+    cache.put('b', 2, ('user',))
+    assert cache.get('a') == 1
+    cache.put('c', 3, ('project',))
+    assert cache.get('b') is MISS
+    now[0] = 111.0
+    assert cache.get('a') is MISS
+    cache.invalidate(['project'])
+    assert cache.get('c') is MISS
+    stats = cache.stats()
+    assert (stats.evictions, stats.invalidations, stats.size) == (1, 1, 0)
@@ -0,0 +1,52 @@
+import pytest
+
+from _core.ddl.errors import UnloadedColumnError
+from _core.dml.errors import ColumnNotFoundError
+from src.orm import Session
+from tests.conftest import User, Project
+from tests.init_funcs import insert_all, delete_all
+
+
+def test_query_only(db_session: Session):
+    insert_all(db_session)
+    user = db_session.query(User).\
+        only(User.email, User.is_admin).\
+        where(User.email, 'alexm2@str.com').\
+        first()
+    assert user.email == 'alexm2@str.com'
+    assert user.is_admin is False
+    assert user.dict == {'email': 'alexm2@str.com', 'is_admin': False}
+    with pytest.raises(UnloadedColumnError):
+        user.age
+
+    user.age = 30
+    assert user.age == 30
+    delete_all(db_session)
+
+
+def test_query_defer(db_session: Session):
+    insert_all(db_session)
+    users = db_session.query(User).\
+        defer(User.create_at).\
+        all()
+    assert len(users) == 3
+    for user in users:
+        assert user.email.startswith('alexm')
+        assert not hasattr(user, 'create_at')
+    delete_all(db_session)
+
+
+def test_query_only_shapes(db_session: Session):
+    insert_all(db_session)
+    query = db_session.query(User).\
+        only(User.is_admin, User.age).\
+        where(User.age, 19)
+    assert query.tuples() == [(False, 19)]
+    assert query.dicts() == [{'is_admin': False, 'age': 19}]
+    assert query.named()[0].age == 19
+    delete_all(db_session)
+
+
+def test_query_only_other_model_column(db_session: Session):
+    with pytest.raises(ColumnNotFoundError):
+        db_session.query(User).only(Project.user_id)
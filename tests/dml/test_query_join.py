@@ -0,0 +1,110 @@
+import pytest
+
+from _core.dml.errors import ColumnNotFoundError, JoinError
+from src.orm import (Column, DbUrl, Engine, ForeignKey, IntegerColumnType,
+                     Model, PrimaryKeyColumnType, Relationship,
+                     StringColumnType, create_session)
+from tests.conftest import User
+
+
+class Dept(Model):
+    __tablename__ = 'dept'
+
+    id = Column(name='id', type=PrimaryKeyColumnType(
+        type=IntegerColumnType(), autoincrement=True), unique=True)
+    name = Column(name='name', type=StringColumnType())
+    employees = Relationship(lambda: Employee)
+
+
+class Employee(Model):
+    __tablename__ = 'employee'
+    __foreignkey__ = ForeignKey(
+        name='fk_dept',
+        key_column='dept_id',
+        parent_table='dept',
+        parent_key_columns='id',
+    )
+
+    id = Column(name='id', type=PrimaryKeyColumnType(
+        type=IntegerColumnType(), autoincrement=True), unique=True)
+    name = Column(name='name', type=StringColumnType())
+    dept_id = Column(name='dept_id', type=IntegerColumnType())
+
+
+@pytest.fixture
+def session(tmp_path):
+    def on_create(create_tables):
+        create_tables([Dept, Employee])
+
+    url = DbUrl(driver='sqlite3', database=str(tmp_path / 'join.sqlite3'))
+    engine = Engine(url, on_create=on_create)
+    with create_session(engine) as session:
+        dept_ids = session.insert_items(
+            [Dept(name='dev'), Dept(name='ops'), Dept(name='hr')]).commit()
+        session.insert_items(
+            [Employee(name='ann', dept_id=dept_ids[0]),
+             Employee(name='bob', dept_id=dept_ids[0]),
+             Employee(name='cid', dept_id=dept_ids[1]),
+             Employee(name='dan', dept_id=None)]).commit()
+        yield session
+    engine.disconnect()
+
+
+def test_join(session):
+    rows = session.query(Employee).join(Dept).where(Dept.name, 'dev').all()
+    assert [(employee.name, dept.name) for employee, dept in rows] == \
+        [('ann', 'dev'), ('bob', 'dev')]
+    assert rows[0][1] is rows[1][1]
+
+
+def test_outerjoin(session):
+    rows = session.query(Dept).outerjoin(
+        Employee, on=(Dept.id, Employee.dept_id)).all()
+    names = sorted((dept.name, employee.name if employee else None)
+                   for dept, employee in rows)
+    assert names == [('dev', 'ann'), ('dev', 'bob'), ('hr', None), ('ops', 'cid')]
+
+
+def test_join_first_iter_and_loads(session, mocker):
+    employee, dept = session.query(Employee).join(Dept).\
+        where(Employee.name, 'cid').first()
+    assert (employee.name, dept.name) == ('cid', 'ops')
+
+    spy = mocker.spy(session, 'read_all')
+    rows = list(session.query(Dept).join(Employee).
+                load(Dept.employees, 'joined').iter(batch_size=2))
+    assert len(rows) == 3
+    assert all(len(dept.employees) == (2 if dept.name == 'dev' else 1)
+               for dept, _ in rows)
+    assert spy.call_count == 2
+
+
+def test_join_dicts_and_scalars(session):
+    query = session.query(Employee).join(Dept).where(Dept.name, 'ops')
+    assert query.dicts() == [{'employee_id': 3, 'employee_name': 'cid',
+                              'employee_dept_id': 2, 'dept_id': 2,
+                              'dept_name': 'ops'}]
+    assert query.scalars(Dept.name) == ['ops']
+    assert query.scalars(Employee.name) == ['cid']
+
+
+def test_join_errors(session):
+    with pytest.raises(JoinError):
+        session.query(Employee).join(Employee)
+    with pytest.raises(JoinError):
+        session.query(Employee).join(Dept).join(Dept)
+    with pytest.raises(ColumnNotFoundError):
+        session.query(Employee).join(Dept, on=(Employee.dept_id, User.id))
+    with pytest.raises(JoinError):
+        session.query(Employee).join(Dept).compile()
+
+
+def test_join_conditions_on_same_named_columns(session):
+    dept = session.query(Dept).where(Dept.name, 'ops').first()
+    rows = session.query(Employee).join(Dept).where(Employee.id, dept.id).all()
+    assert [(employee.name, d.name) for employee, d in rows] == [('bob', 'dev')]
+    rows = session.query(Employee).join(Dept).where(Dept.id, dept.id).all()
+    assert [(employee.name, d.name) for employee, d in rows] == [('cid', 'ops')]
+    assert session.query(Employee).join(Dept).where(Dept.id, dept.id).count() == 1
+    assert session.query(Employee).join(Dept).where(Employee.id, dept.id).\
+        aggregate(max=Dept.name).max_dept_name == 'dev'
@@ -0,0 +1,88 @@
+import pytest
+
+from src.orm import (Column, DbUrl, Engine, IntegerColumnType, Model, Page,
+                     PrimaryKeyColumnType, StringColumnType, create_session)
+
+
+class Article(Model):
+    __tablename__ = 'article'
+
+    id = Column(name='id', type=PrimaryKeyColumnType(
+        type=IntegerColumnType(), autoincrement=True), unique=True)
+    topic = Column(name='topic', type=StringColumnType())
+    rank = Column(name='rank', type=IntegerColumnType())
+
+
+@pytest.fixture
+def session(tmp_path):
+    def on_create(create_tables):
+        create_tables([Article])
+
+    url = DbUrl(driver='sqlite3', database=str(tmp_path / 'paginate.sqlite3'))
+    engine = Engine(url, on_create=on_create)
+    with create_session(engine) as session:
+        session.insert_items(
+            [Article(topic=topic, rank=rank)
+             for topic in ('a', 'b', 'c') for rank in (1, 2, 2)]).commit()
+        yield session
+    engine.disconnect()
+
+
+def _pages(query, page_size):
+    page = query.paginate(page_size=page_size)
+    pages = [page]
+    while page.has_next:
+        page = query.paginate(after=page.after, page_size=page_size)
+        pages.append(page)
+    return pages
+
+
+def test_order_by(session):
+    articles = session.query(Article).order_by(Article.rank, desc=True).\
+        order_by(Article.topic).all()
+    assert [(a.rank, a.topic) for a in articles][:4] == \
+        [(2, 'a'), (2, 'a'), (2, 'b'), (2, 'b')]
+    assert session.query(Article).order_by(Article.id, desc=True).first().id == 9
+    assert session.query(Article).order_by(Article.topic, desc=True).\
+        scalars(Article.topic)[0] == 'c'
+
+
+def test_paginate(session, mocker):
+    spy = mocker.spy(session, 'read_all')
+    pages = _pages(session.query(Article).where(Article.topic, 'a', '!=').
+                   or_(Article.rank, 1), 4)
+    assert [len(page.items) for page in pages] == [4, 3]
+    assert isinstance(pages[0], Page)
+    assert [a.id for page in pages for a in page.items] == [1, 4, 5, 6, 7, 8, 9]
+    assert pages[0].after == (6,)
+    sql = spy.call_args_list[1].args[0]
+    assert 'OFFSET' not in sql and 'id > ?' in sql
+
+
+@pytest.mark.parametrize('desc', [False, True])
+def test_paginate_many_columns(session, desc):
+    query = session.query(Article).order_by(Article.rank, desc=desc).\
+        order_by(Article.topic)
+    expected = [(a.rank, a.topic, a.id) for a in query.all()]
+    pages = _pages(query, 2)
+    assert [(a.rank, a.topic, a.id) for page in pages for a in page.items] == expected
+    assert pages[-1].has_next is False
+
+
+def test_paginate_errors(session):
+    with pytest.raises(ValueError):
+        session.query(Article).paginate(page_size=0)
+    with pytest.raises(TypeError):
+        session.query(Article).order_by(Article.rank).paginate(after=1)
+    page = session.query(Article).where(Article.topic, 'x').paginate()
+    assert (page.items, page.after, page.has_next) == ([], None, False)
+
+
+def test_paginate_does_not_change_query(session):
+    query = session.query(Article).order_by(Article.rank)
+    first = query.paginate(page_size=2)
+    second = query.paginate(after=first.after, page_size=2)
+    assert query.paginate(page_size=2).items == first.items
+    assert [a.id for a in second.items] == [7, 2]
+    assert len(query.all()) == 9
+    assert query.all()[0].rank == 1
@@ -0,0 +1,49 @@
+from src.orm import Session
+from tests.conftest import User
+from tests.init_funcs import insert_all, delete_all
+
+
+def test_query_tuples(db_session: Session):
+    insert_all(db_session)
+    rows = db_session.query(User).\
+        where(User.email, 'alexm2@str.com').\
+        tuples()
+    assert len(rows) == 1
+    assert isinstance(rows[0], tuple)
+    assert rows[0][1] == 'alexm2@str.com'
+    assert rows[0][2] == 19
+    assert rows[0][3] is False
+    delete_all(db_session)
+
+
+def test_query_dicts(db_session: Session):
+    insert_all(db_session)
+    rows = db_session.query(User).\
+        where(User.is_admin, True).\
+        dicts()
+    assert len(rows) == 2
+    assert set(rows[0].keys()) == set(User.__schema__.field_names)
+    assert {row['email'] for row in rows} == {'alexm1@str.com', 'alexm3@str.com'}
+    assert all(row['is_admin'] is True for row in rows)
+    delete_all(db_session)
+
+
+def test_query_named(db_session: Session):
+    insert_all(db_session)
+    rows = db_session.query(User).named()
+    assert len(rows) == 3
+    assert {row.age for row in rows} == {18, 19, 20}
+    assert type(rows[0]) is type(db_session.query(User).limit(1).named()[0])
+    delete_all(db_session)
+
+
+def test_query_scalars(db_session: Session):
+    insert_all(db_session)
+    emails = db_session.query(User).scalars(User.email)
+    assert sorted(emails) == ['alexm1@str.com', 'alexm2@str.com', 'alexm3@str.com']
+
+    flags = db_session.query(User).\
+        where(User.age, 19).\
+        scalars(User.is_admin)
+    assert flags == [False]
+    delete_all(db_session)
@@ -0,0 +1,112 @@
+import pytest
+
+from _core.ddl.errors import RelationshipError, UnloadedRelationshipError
+from _core.dml.errors import CompileError
+from src.orm import (BooleanColumnType, Column, DbUrl, Engine, ForeignKey,
+                     IntegerColumnType, Model, PrimaryKeyColumnType,
+                     Relationship, StringColumnType, create_session)
+
+
+class Team(Model):
+    __tablename__ = 'team'
+
+    id = Column(name='id', type=PrimaryKeyColumnType(
+        type=IntegerColumnType(), autoincrement=True), unique=True)
+    name = Column(name='name', type=StringColumnType())
+    members = Relationship(lambda: Member)
+
+
+class Member(Model):
+    __tablename__ = 'member'
+    __foreignkey__ = ForeignKey(
+        name='fk_team',
+        key_column='team_id',
+        parent_table='team',
+        parent_key_columns='id',
+    )
+
+    id = Column(name='id', type=PrimaryKeyColumnType(
+        type=IntegerColumnType(), autoincrement=True), unique=True)
+    team_id = Column(name='team_id', type=IntegerColumnType())
+    is_lead = Column(name='is_lead', type=BooleanColumnType(default=False))
+    team = Relationship(Team)
+
+
+@pytest.fixture
+def session(tmp_path):
+    def on_create(create_tables):
+        create_tables([Team, Member])
+
+    url = DbUrl(driver='sqlite3', database=str(tmp_path / 'relationship.sqlite3'))
+    engine = Engine(url, on_create=on_create)
+    with create_session(engine) as session:
+        team_ids = session.insert_items(
+            [Team(name=f'team{i}') for i in range(3)]).commit()
+        session.insert_items(
+            [Member(team_id=team_ids[i % 2], is_lead=i < 2) for i in range(5)] +
+            [Member(team_id=None)]).commit()
+        yield session
+    engine.disconnect()
+
+
+def test_resolve():
+    assert (Member.team.local, Member.team.remote, Member.team.many) == \
+        (Member.team_id, Team.id, False)
+    assert (Team.members.local, Team.members.remote, Team.members.many) == \
+        (Team.id, Member.team_id, True)
+
+
+@pytest.mark.parametrize('strategy', ['selectin', 'joined'])
+def test_load_many_to_one(session, mocker, strategy):
+    spy = mocker.spy(session, 'read_all')
+    members = session.query(Member).load(Member.team, strategy).all()
+    assert spy.call_count == (2 if strategy == 'selectin' else 1)
+    assert len(members) == 6
+    assert [member.team.name if member.team else None for member in members] == \
+        ['team0', 'team1', 'team0', 'team1', 'team0', None]
+    assert members[0].team is members[2].team
+
+
+@pytest.mark.parametrize('strategy', ['selectin', 'joined'])
+def test_load_one_to_many(session, strategy):
+    teams = session.query(Team).load(Team.members, strategy).all()
+    assert [len(team.members) for team in teams] == [3, 2, 0]
+    assert all(member.team_id == teams[0].id for member in teams[0].members)
+
+
+def test_load_with_conditions_and_first(session):
+    team = session.query(Team).where(Team.name, 'team1').\
+        load(Team.members, 'joined').first()
+    assert len(team.members) == 2
+
+    leads = session.query(Member).where(Member.is_lead, True).\
+        load(Member.team, 'joined').all()
+    assert [lead.team.name for lead in leads] == ['team0', 'team1']
+
+
+def test_load_chunks(session, mocker):
+    mocker.patch.object(type(session.adapter), 'max_params',
+                        new_callable=mocker.PropertyMock, return_value=1)
+    spy = mocker.spy(session, 'read_all')
+    members = session.query(Member).load(Member.team).all()
+    assert spy.call_count == 3
+    assert members[1].team.name == 'team1'
+
+
+def test_iter_loads_by_batches(session):
+    members = list(session.query(Member).load(Member.team).iter(batch_size=4))
+    assert [member.team is not None for member in members] == [True] * 5 + [False]
+
+
+def test_errors(session):
+    team = session.query(Team).first()
+    with pytest.raises(UnloadedRelationshipError):
+        team.members
+    with pytest.raises(RelationshipError):
+        session.query(Team).load(Member.team)
+    with pytest.raises(ValueError):
+        session.query(Team).load(Team.members, 'lazy')
+    with pytest.raises(RelationshipError):
+        session.query(Member).only(Member.id).load(Member.team).all()
+    with pytest.raises(CompileError):
+        session.query(Member).load(Member.team).compile()
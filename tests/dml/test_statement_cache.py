@@ -0,0 +1,74 @@
+import pytest
+
+from _core.dml.errors import CompileError
+from src.orm import Session, StatementCache
+from tests.conftest import User
+from tests.init_funcs import insert_all, delete_all
+
+
+def test_cache_lru():
+    cache = StatementCache(maxsize=2)
+    cache.put('a', 'SELECT 1;')
+    cache.put('b', 'SELECT 2;')
+    assert cache.get('a') == 'SELECT 1;'
+    cache.put('c', 'SELECT 3;')
+    assert cache.get('b') is None
+    assert cache.get('c') == 'SELECT 3;'
+
+    stats = cache.stats()
+    assert stats.hits == 2
+    assert stats.misses == 1
+    assert stats.evictions == 1
+    assert stats.size == 2
+
+
+def test_query_shape_cached(db_session: Session):
+    insert_all(db_session)
+    cache = db_session.statement_cache
+    db_session.query(User).where(User.email, 'alexm1@str.com').all()
+    before = cache.stats()
+    users = db_session.query(User).where(User.email, 'alexm2@str.com').all()
+    after = cache.stats()
+    assert len(users) == 1
+    assert users[0].email == 'alexm2@str.com'
+    assert after.hits == before.hits + 1
+    assert after.misses == before.misses
+    delete_all(db_session)
+
+
+def test_update_delete_shape_cached(db_session: Session):
+    insert_all(db_session)
+    cache = db_session.statement_cache
+    db_session.update(User, {'age': 30}).where(User.email, 'alexm1@str.com').commit()
+    db_session.delete(User).where(User.email, 'alexm1@str.com').commit()
+    before = cache.stats()
+    db_session.update(User, {'age': 31}).where(User.email, 'alexm2@str.com').commit()
+    db_session.delete(User).where(User.email, 'alexm3@str.com').commit()
+    after = cache.stats()
+    assert after.hits == before.hits + 2
+    users = db_session.query(User).all()
+    assert [(user.email, user.age) for user in users] == [('alexm2@str.com', 31)]
+    delete_all(db_session)
+
+
+def test_compiled_query(db_session: Session):
+    insert_all(db_session)
+    compiled = db_session.query(User).\
+        where(User.email, 'alexm1@str.com').\
+        compile()
+    misses = db_session.statement_cache.stats().misses
+
+    assert compiled.first().email == 'alexm1@str.com'
+    assert compiled.first('alexm2@str.com').age == 19
+    assert [user.age for user in compiled.all('alexm3@str.com')] == [20]
+    assert list(compiled.iter('unknown@str.com')) == []
+    assert db_session.statement_cache.stats().misses == misses
+
+    with pytest.raises(TypeError):
+        compiled.all('alexm1@str.com', 18)
+    delete_all(db_session)
+
+
+def test_compile_cached_query(db_session: Session):
+    with pytest.raises(CompileError):
+        db_session.query(User).where(User.age, 18).cache().compile()
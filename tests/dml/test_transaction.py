@@ -0,0 +1,112 @@
+from datetime import datetime
+import sqlite3
+
+import pytest
+
+from _core.drivers.psycopg2.session import Psycopg2Sesion
+from _core.drivers.psycopg2.sql_adapter import Psycopg2SqlAdapter
+from src.orm import Session
+from tests.conftest import User
+from tests.init_funcs import delete_all
+
+
+def user(number: int) -> User:
+    return User(email=f'tx{number}@str.com', age=number, create_at=datetime.now())
+
+
+def test_transaction_commits_once(db_session: Session, mocker):
+    commit = mocker.spy(db_session, '_commit')
+    with db_session.transaction():
+        assert db_session.in_transaction
+        for i in range(3):
+            db_session.insert_item(user(i)).commit()
+        db_session.update(User, {'age': 5}).where(User.email, 'tx0@str.com').commit()
+        assert commit.call_count == 0
+
+    assert commit.call_count == 1
+    assert not db_session.in_transaction
+    assert len(db_session.query(User).all()) == 3
+    delete_all(db_session)
+
+
+def test_transaction_rollback(db_session: Session):
+    with pytest.raises(RuntimeError):
+        with db_session.transaction():
+            db_session.insert_item(user(1)).commit()
+            with db_session.transaction():
+                db_session.insert_item(user(2)).commit()
+            raise RuntimeError()
+
+    assert not db_session.in_transaction
+    assert db_session.query(User).all() == []
+
+
+def test_savepoint(db_session: Session):
+    with db_session.transaction():
+        db_session.insert_item(user(1)).commit()
+        with pytest.raises(sqlite3.IntegrityError):
+            with db_session.savepoint():
+                db_session.insert_item(user(2)).commit()
+                db_session.insert_item(user(1)).commit()
+        with db_session.savepoint():
+            db_session.insert_item(user(3)).commit()
+
+    emails = sorted(db_session.query(User).scalars(User.email))
+    assert emails == ['tx1@str.com', 'tx3@str.com']
+    delete_all(db_session)
+
+
+def test_autocommit(db_session: Session):
+    assert db_session.autocommit is False
+    db_session.autocommit = True
+    try:
+        db_session.execute(
+            'INSERT INTO user(email, age) VALUES (?, ?);', ['tx1@str.com', 1])
+        assert not db_session._connection.in_transaction
+
+        with db_session.transaction():
+            db_session.insert_item(user(2)).commit()
+            assert db_session._connection.in_transaction
+        assert not db_session._connection.in_transaction
+    finally:
+        db_session.autocommit = False
+    assert len(db_session.query(User).all()) == 2
+    delete_all(db_session)
+
+
+class RecordingCursor:
+
+    def __init__(self):
+        self.executed = []
+        self.rowcount = 0
+
+    def execute(self, sql, params=None):
+        self.executed.append(sql)
+
+    def close(self):
+        pass
+
+
+class AutocommitConnection:
+
+    def __init__(self):
+        self.autocommit = True
+        self.cursor_ = RecordingCursor()
+
+    def cursor(self, name=None):
+        return self.cursor_
+
+    def commit(self):
+        raise AssertionError('commit is not called in autocommit mode')
+
+
+def test_psycopg2_autocommit_transaction():
+    session = Psycopg2Sesion(AutocommitConnection(), Psycopg2SqlAdapter())
+    session.connect()
+    with session.transaction():
+        session.execute('SELECT 1;')
+        with session.savepoint():
+            session.execute('SELECT 2;')
+    assert session._cursor.executed == [
+        'BEGIN', 'SELECT 1;', 'SAVEPOINT orm_savepoint_0;', 'SELECT 2;',
+        'RELEASE SAVEPOINT orm_savepoint_0;', 'COMMIT']
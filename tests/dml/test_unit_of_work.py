@@ -0,0 +1,140 @@
+from datetime import datetime
+
+import pytest
+
+from _core.dml.unit_of_work import dependency_order
+from src.orm import Session
+from tests.conftest import User, Project
+from tests.init_funcs import insert_all, delete_all
+
+
+def test_dependency_order():
+    assert dependency_order([Project, User]) == [User, Project]
+    assert dependency_order([User, Project]) == [User, Project]
+
+
+def test_flush_inserts_parents_first(db_session: Session, mocker):
+    now = datetime.now()
+    fetch_all = mocker.spy(db_session, 'fetch_all')
+    project = Project(id=1, user_id=100)
+    user = User(id=100, email='uow@str.com', create_at=now)
+    users = [User(email=f'uow{i}@str.com', create_at=now) for i in range(3)]
+    db_session.add(project)
+    db_session.add(user)
+    db_session.add_all(users)
+    db_session.flush()
+
+    assert fetch_all.call_count == 2
+    assert 'INSERT INTO user' in fetch_all.call_args_list[0].args[0]
+    assert 'INSERT INTO project' in fetch_all.call_args_list[1].args[0]
+    assert project._persistent and user._persistent
+    assert all(item.id is not None for item in users)
+
+    db_session.flush()
+    assert fetch_all.call_count == 2
+    assert len(db_session.query(User).all()) == 4
+    db_session.delete(Project).commit()
+    delete_all(db_session)
+
+
+def test_flush_updates_changed_columns(db_session: Session, mocker):
+    insert_all(db_session)
+    users = db_session.query(User).all()
+    users[0].age = 50
+    users[1].age = 51
+    users[2].is_admin = False
+    db_session.add_all(users)
+    execute = mocker.spy(db_session, 'execute')
+    db_session.flush()
+
+    # One UPDATE per shape: (age) and (is_admin).
+    updates = [call for call in execute.call_args_list
+               if call.args[0].startswith('UPDATE')]
+    assert len(updates) == 2
+    assert all(user._dirty is None for user in users)
+    by_id = {user.id: user for user in db_session.query(User).all()}
+    assert by_id[users[0].id].age == 50
+    assert by_id[users[1].id].age == 51
+    assert by_id[users[2].id].is_admin is False
+    assert by_id[users[0].id].email == users[0].email
+    delete_all(db_session)
+
+
+def test_flush_deletes_children_first(db_session: Session, mocker):
+    insert_all(db_session)
+    user = db_session.query(User).first()
+    db_session.insert_item(Project(id=1, user_id=user.id)).commit()
+    project = db_session.query(Project).first()
+
+    db_session.remove(user)
+    db_session.remove(project)
+    db_session.remove(User(email='new@str.com'))
+    execute = mocker.spy(db_session, 'execute')
+    db_session.flush()
+
+    deletes = [call.args[0] for call in execute.call_args_list]
+    assert deletes[0].startswith('DELETE FROM project')
+    assert deletes[1].startswith('DELETE FROM user')
+    assert not user._persistent
+    assert db_session.query(Project).all() == []
+    assert len(db_session.query(User).all()) == 2
+    delete_all(db_session)
+
+
+def test_flush_keeps_rows_in_identity_map(db_session: Session):
+    insert_all(db_session)
+    user = db_session.query(User).first()
+    user.age = 7
+    db_session.add(user)
+    db_session.flush()
+    assert db_session.get(User, user.id) is user
+
+    user.age = 9
+    db_session.flush()
+    ages = db_session.query(User).where(User.id, user.id).scalars(User.age)
+    assert ages == [9]
+    delete_all(db_session)
+
+
+def test_flush_changed_primary_key(db_session: Session):
+    insert_all(db_session)
+    user = db_session.query(User).first()
+    key = user.id
+    user.id = key + 100
+    user.age = 70
+    db_session.add(user)
+    with pytest.raises(ValueError):
+        db_session.flush()
+
+    assert db_session.query(User).where(User.id, key + 100).first() is None
+    assert db_session.query(User).where(User.id, key).first().age == 18
+    user.id = key
+    db_session.remove(user)
+    db_session.flush()
+    assert db_session.query(User).count() == 2
+    delete_all(db_session)
+
+
+def test_flush_rollback(db_session: Session):
+    insert_all(db_session)
+    updated = db_session.query(User).first()
+    updated.age = 70
+    db_session.add(updated)
+    valid = User(email='uow@str.com')
+    project = Project(id=1, user_id=updated.id)
+    duplicate = Project(id=2, user_id=updated.id)
+    db_session.add_all([valid, project, duplicate])
+    with pytest.raises(Exception):
+        db_session.flush()
+    assert len(db_session.query(User).all()) == 3
+    assert not valid._persistent and valid.id is None
+    assert db_session.get(User, valid.id) is None
+    assert updated._dirty
+
+    duplicate.user_id = valid.id = 1000
+    db_session.flush()
+    assert valid._persistent and db_session.get(User, 1000) is valid
+    assert len(db_session.query(Project).all()) == 2
+    assert db_session.query(User).where(User.id, updated.id).scalars(User.age) == [70]
+    db_session.delete(Project).commit()
+    delete_all(db_session)
@@ -0,0 +1,103 @@
+import sqlite3
+
+import pytest
+
+from _core.ddl.errors import ValueError as ColumnValueError
+from _core.dml.errors import ColumnNotFoundError
+from _core.drivers.psycopg2.sql_adapter import Psycopg2SqlAdapter
+from src.orm import Session
+from tests.conftest import User
+from tests.init_funcs import insert_all, delete_all
+
+
+def test_bulk_update_models(db_session: Session, mocker):
+    insert_all(db_session)
+    users = db_session.query(User).all()
+    for user in users:
+        user.age = user.age + 10
+        user.is_admin = not user.is_admin
+    execute = mocker.spy(db_session, 'execute')
+    rowcount = db_session.bulk_update(User, users)
+
+    assert rowcount == 3
+    assert execute.call_count == 1
+    updated = {user.email: user for user in db_session.query(User).all()}
+    assert updated['alexm1@str.com'].age == 28
+    assert updated['alexm1@str.com'].is_admin is False
+    assert updated['alexm2@str.com'].age == 29
+    assert updated['alexm2@str.com'].is_admin is True
+    delete_all(db_session)
+
+
+def test_bulk_update_dicts_expire_updated_rows(db_session: Session):
+    insert_all(db_session)
+    first, second = db_session.query(User).all()[:2]
+    db_session.bulk_update(User, [{'id': first.id, 'age': 60}])
+
+    assert db_session.get(User, first.id) is not first
+    assert db_session.get(User, first.id).age == 60
+    assert db_session.get(User, second.id) is second
+    delete_all(db_session)
+
+
+def test_bulk_update_dicts_by_key(db_session: Session, mocker):
+    insert_all(db_session)
+    execute = mocker.spy(db_session, 'execute')
+    items = ({'email': f'alexm{i}@str.com', 'age': 40 + i} for i in range(1, 5))
+    rowcount = db_session.bulk_update(User, items, key=User.email, chunk_size=2)
+
+    assert rowcount == 3
+    assert execute.call_count == 2
+    ages = sorted(age for age in db_session.query(User).scalars(User.age))
+    assert ages == [41, 42, 43]
+    delete_all(db_session)
+
+
+def test_bulk_update_partial_models(db_session: Session):
+    insert_all(db_session)
+    users = db_session.query(User).only(User.id, User.age).all()
+    for user in users:
+        user.age = 1
+    assert db_session.bulk_update(User, users) == 3
+    emails = sorted(db_session.query(User).scalars(User.email))
+    assert emails == ['alexm1@str.com', 'alexm2@str.com', 'alexm3@str.com']
+    delete_all(db_session)
+
+
+def test_bulk_update_failed_chunk_rolls_back(db_session: Session):
+    insert_all(db_session)
+    first, second, third = db_session.query(User).all()
+    items = [{'id': first.id, 'age': 50}, {'id': second.id, 'email': third.email}]
+    with pytest.raises(sqlite3.IntegrityError):
+        db_session.bulk_update(User, items, chunk_size=1)
+    db_session.commit()
+
+    assert not db_session.in_transaction
+    assert sorted(db_session.query(User).scalars(User.age)) == [18, 19, 20]
+    delete_all(db_session)
+
+
+def test_bulk_update_wrong_items(db_session: Session):
+    with pytest.raises(ColumnNotFoundError):
+        db_session.bulk_update(User, [{'id': 1, 'name': 'x'}])
+    with pytest.raises(ValueError):
+        db_session.bulk_update(User, [{'age': 1}])
+    with pytest.raises(ColumnValueError):
+        db_session.bulk_update(User, [{'id': 1, 'email': None}])
+
+
+def test_bulk_update_postgresql_sql():
+    adapter = Psycopg2SqlAdapter()
+    params = []
+    sql = adapter.bulk_update('"user"', 'id', ['age', 'email'],
+                              ['INT', 'INT', 'VARCHAR(255)'],
+                              [[1, 20, 'a'], [2, None, 'b']], params)
+    assert sql == '''UPDATE "user" SET
+    age = _v.age,
+    email = _v.email
+FROM (VALUES
+    (%s::INT, %s::INT, %s::VARCHAR(255)),
+    (%s::INT, %s::INT, %s::VARCHAR(255))
+) AS _v(id, age, email)
+WHERE "user".id = _v.id;'''
+    assert params == [1, 20, 'a', 2, None, 'b']
@@ -0,0 +1,134 @@
+import asyncio
+import socket
+from typing import Any, List
+
+import psycopg2.extensions
+import pytest
+
+from _core.drivers.psycopg2.async_session import Psycopg2AsyncSession
+from _core.drivers.psycopg2.sql_adapter import Psycopg2SqlAdapter
+from _core.pool import ConnectionPool
+from _core.statement_cache import StatementCache
+
+
+class FakeCursor:
+
+    def __init__(self, connection: 'FakeAsyncConnection'):
+        self._connection = connection
+        self.rowcount = -1
+        self._rows: List[Any] = []
+
+    def execute(self, sql: str, params=None):
+        self._connection.executed.append(sql)
+        if sql == self._connection.hang_on:
+            # The socket of the long stmp is never readable.
+            self._connection.reader.recv(1)
+        self._connection.polls = [psycopg2.extensions.POLL_READ,
+                                  psycopg2.extensions.POLL_OK]
+        self._rows = self._connection.results.pop(0) \
+            if sql.startswith(('SELECT', 'FETCH')) else []
+        self.rowcount = len(self._rows)
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return self._rows
+
+    def close(self):
+        pass
+
+
+class FakeAsyncConnection:
+    """Polls like the psycopg2 async connection: 
+    waits for the readable socket once per stmp."""
+
+    def __init__(self, results: List[List[Any]], hang_on: str | None = None):
+        self.results = results
+        self.executed: List[str] = []
+        self.polls: List[int] = []
+        self.hang_on = hang_on
+        self.cancelled = False
+        self.closed = False
+        self.reader, self.writer = socket.socketpair()
+        self.writer.send(b'x')
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def poll(self) -> int:
+        return self.polls.pop(0)
+
+    def fileno(self) -> int:
+        return self.reader.fileno()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def close(self):
+        self.closed = True
+        self.reader.close()
+        self.writer.close()
+
+
+def create_session(connection: FakeAsyncConnection) -> Psycopg2AsyncSession:
+    pool = ConnectionPool(lambda: connection, reset=lambda _: None)
+    return Psycopg2AsyncSession(Psycopg2SqlAdapter(), pool,
+                                StatementCache(8), asyncio.Semaphore(1))
+
+
+def test_async_transaction_sql():
+    connection = FakeAsyncConnection([[(1,)]])
+
+    async def main():
+        async with create_session(connection) as session:
+            async with session.transaction():
+                assert await session.fetch_all('SELECT 1') == [(1,)]
+
+    asyncio.run(main())
+    assert connection.executed == ['BEGIN', 'SELECT 1', 'COMMIT']
+    connection.close()
+
+
+def test_async_fetch_many_declares_cursor():
+    connection = FakeAsyncConnection([[(1,), (2,)], [(3,)], []])
+
+    async def main():
+        async with create_session(connection) as session:
+            return [row async for row in session.fetch_many('SELECT id FROM t', 2)]
+
+    assert asyncio.run(main()) == [(1,), (2,), (3,)]
+    name = connection.executed[0].split()[1]
+    assert connection.executed == [
+        f'DECLARE {name} CURSOR WITH HOLD FOR SELECT id FROM t',
+        f'FETCH FORWARD 2 FROM {name}',
+        f'FETCH FORWARD 2 FROM {name}',
+        f'FETCH FORWARD 2 FROM {name}',
+        f'CLOSE {name}',
+    ]
+    connection.close()
+
+
+def test_async_cancel_discards_connection():
+    connection = FakeAsyncConnection([], hang_on='UPDATE t SET a = 1')
+    session = create_session(connection)
+
+    async def main():
+        await session.connect()
+
+        async def update():
+            async with session.transaction():
+                await session.execute('UPDATE t SET a = 1')
+
+        task = asyncio.create_task(update())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await session.disconnect()
+
+    asyncio.run(main())
+    assert connection.executed == ['BEGIN', 'UPDATE t SET a = 1']
+    assert connection.cancelled
+    assert connection.closed
+    assert session._pool.stats().size == 0
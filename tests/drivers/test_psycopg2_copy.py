@@ -0,0 +1,128 @@
+import io
+from datetime import datetime
+
+import pytest
+
+from _core.ddl.errors import ValueError
+from _core.drivers.psycopg2.copy import CopyReader
+from _core.drivers.psycopg2.session import Psycopg2Sesion
+from _core.drivers.psycopg2.sql_adapter import Psycopg2SqlAdapter
+from src.orm import datetime_now
+from tests.conftest import User, Project
+
+
+class CopyCursor:
+    """The cursor which reads `COPY` data instead of a database."""
+
+    def __init__(self):
+        self.sql = None
+        self.blocks = []
+        self.rowcount = -1
+
+    def copy_expert(self, sql, file, size=8192):
+        self.sql = sql
+        if sql.endswith('FROM STDIN;'):
+            while True:
+                block = file.read(size)
+                if not block:
+                    break
+                self.blocks.append(block)
+            self.rowcount = ''.join(self.blocks).count('\n')
+        else:
+            file.write('1\t2\tt\n')
+            self.rowcount = 1
+
+    def close(self):
+        pass
+
+
+class CopyConnection:
+
+    def __init__(self):
+        self.cursor_ = CopyCursor()
+        self.commits = 0
+
+    def cursor(self, name=None):
+        return self.cursor_
+
+    def commit(self):
+        self.commits += 1
+
+
+def create_session() -> Psycopg2Sesion:
+    connection = CopyConnection()
+    session = Psycopg2Sesion(connection, Psycopg2SqlAdapter())
+    session.connect()
+    return session
+
+
+def test_copy_in_models_and_tuples():
+    session = create_session()
+    now = datetime(2024, 1, 2, 3, 4, 5)
+    rows = [
+        User(email='a\tb\\c\nd', age=18, is_admin=True, create_at=now),
+        ('e@str.com', None, False, datetime_now),
+    ]
+    count = session.copy_in(User, rows)
+
+    cursor = session._cursor
+    assert cursor.sql == 'COPY user (email, age, is_admin, create_at) FROM STDIN;'
+    assert ''.join(cursor.blocks) == (
+        'a\\tb\\\\c\\nd\t18\tt\t2024-01-02 03:04:05\n'
+        'e@str.com\t\\N\tf\tnow\n')
+    assert count == 2
+    assert session._connection.commits == 1
+
+
+def test_copy_in_tuples_streamed():
+    session = create_session()
+    consumed = []
+
+    def rows():
+        for i in range(1000):
+            consumed.append(i)
+            yield (i, i, i % 2 == 0)
+
+    reader_sizes = []
+    cursor = session._cursor
+    original = cursor.copy_expert
+
+    def copy_expert(sql, file, size=8192):
+        # Only the first block is read from the generator.
+        first = file.read(size)
+        reader_sizes.append(len(consumed))
+        cursor.blocks.append(first)
+        original(sql, file, size)
+
+    cursor.copy_expert = copy_expert
+    count = session.copy_in(Project, rows(), size=64)
+
+    assert reader_sizes[0] < 20
+    assert count == 1000
+    assert cursor.sql == 'COPY project (id, user_id, is_active) FROM STDIN;'
+
+
+def test_copy_in_invalid_rows():
+    session = create_session()
+    with pytest.raises(TypeError):
+        session.copy_in(Project, [(1, 2)])
+    with pytest.raises(ValueError):
+        session.copy_in(Project, [(1, 'x', True)])
+
+
+def test_copy_out():
+    session = create_session()
+    file = io.StringIO()
+    count = session.copy_out(Project, file)
+    assert session._cursor.sql == 'COPY project (id, user_id, is_active) TO STDOUT;'
+    assert file.getvalue() == '1\t2\tt\n'
+    assert count == 1
+
+
+def test_copy_reader():
+    reader = CopyReader(['ab\n', 'cde\n', 'f\n'])
+    assert reader.read(2) == 'ab'
+    assert reader.readline() == '\n'
+    assert reader.read(5) == 'cde\nf'
+    assert reader.read() == '\n'
+    assert reader.read(10) == ''
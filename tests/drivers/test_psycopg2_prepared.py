@@ -0,0 +1,110 @@
+from _core.drivers.psycopg2.prepared import PreparedStatements, to_server_params
+from _core.drivers.psycopg2.session import Psycopg2Sesion
+from _core.drivers.psycopg2.sql_adapter import Psycopg2SqlAdapter
+from _core.schema_generation import SchemaGeneration
+
+
+class RecordingCursor:
+    """The cursor which records executed SQL instead of a database."""
+
+    def __init__(self):
+        self.executed = []
+        self.rowcount = -1
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+
+def test_to_server_params():
+    sql = "SELECT id FROM t WHERE a = %s AND b LIKE '%%x' OR c = %s;"
+    assert to_server_params(sql) == \
+        "SELECT id FROM t WHERE a = $1 AND b LIKE '%x' OR c = $2;"
+
+
+def test_prepare_after_threshold():
+    cursor = RecordingCursor()
+    prepared = PreparedStatements(threshold=2, maxsize=10)
+    sql = 'SELECT id FROM t WHERE a = %s;'
+
+    prepared.execute(cursor, sql, [1])
+    assert cursor.executed == [(sql, [1])]
+
+    prepared.execute(cursor, sql, [2])
+    assert cursor.executed[1] == ('PREPARE orm_stmt_0 AS SELECT id FROM t WHERE a = $1', None)
+    assert cursor.executed[2] == ('EXECUTE orm_stmt_0 (%s)', [2])
+
+    prepared.execute(cursor, sql, [3])
+    assert cursor.executed[3] == ('EXECUTE orm_stmt_0 (%s)', [3])
+    assert len(prepared) == 1
+
+
+def test_ddl_not_prepared():
+    cursor = RecordingCursor()
+    prepared = PreparedStatements(threshold=1, maxsize=10)
+    sql = 'DROP TABLE IF EXISTS t;'
+    prepared.execute(cursor, sql, None)
+    assert cursor.executed == [(sql, None)]
+    assert len(prepared) == 0
+
+
+def test_deallocate_least_recently_used():
+    cursor = RecordingCursor()
+    prepared = PreparedStatements(threshold=1, maxsize=2)
+    prepared.execute(cursor, 'SELECT 1 FROM t WHERE a = %s;', [1])
+    prepared.execute(cursor, 'SELECT 2 FROM t WHERE a = %s;', [1])
+    prepared.execute(cursor, 'SELECT 1 FROM t WHERE a = %s;', [1])
+    prepared.execute(cursor, 'SELECT 3 FROM t WHERE a = %s;', [1])
+    assert ('DEALLOCATE orm_stmt_1', None) in cursor.executed
+    assert len(prepared) == 2
+
+
+def test_invalidate():
+    cursor = RecordingCursor()
+    prepared = PreparedStatements(threshold=1, maxsize=2)
+    prepared.execute(cursor, 'SELECT 1 FROM t WHERE a = %s;', [1])
+    prepared.invalidate(cursor)
+    assert cursor.executed[-1] == ('DEALLOCATE ALL', None)
+    assert len(prepared) == 0
+
+    prepared.execute(cursor, 'SELECT 1 FROM t WHERE a = %s;', [1])
+    assert cursor.executed[-2][0].startswith('PREPARE orm_stmt_1 AS')
+
+
+class RecordingConnection:
+    """The connection which creates recording cursors."""
+
+    def __init__(self):
+        self.autocommit = False
+        self.cursor_ = RecordingCursor()
+
+    def cursor(self):
+        return self.cursor_
+
+
+def test_schema_generation_invalidates_other_connections():
+    generation = SchemaGeneration()
+    adapter = Psycopg2SqlAdapter()
+    connections = [RecordingConnection(), RecordingConnection()]
+    sessions = [Psycopg2Sesion(connection, adapter, prepare_threshold=1,
+                               schema_generation=generation)
+                for connection in connections]
+    sql = 'SELECT 1 FROM t WHERE a = %s;'
+    for session in sessions:
+        session.connect()
+        session.execute(sql, [1])
+
+    sessions[0].schema_changed()
+    assert connections[0].cursor_.executed[-1] == ('DEALLOCATE ALL', None)
+    sessions[1].execute(sql, [2])
+    executed = [one[0] for one in connections[1].cursor_.executed]
+    assert executed[-3:] == ['DEALLOCATE ALL', 'PREPARE orm_stmt_1 AS SELECT 1 FROM t WHERE a = $1',
+                             'EXECUTE orm_stmt_1 (%s)']
+
+
+def test_replica_session_prepares():
+    generation = SchemaGeneration()
+    session = Psycopg2Sesion(None, Psycopg2SqlAdapter(), prepare_threshold=3,
+                             prepared_cache_size=7, schema_generation=generation)
+    replica = session._create_replica_session(None)
+    assert (replica._prepare_threshold, replica._prepared_cache_size) == (3, 7)
+    assert replica._schema_generation is generation
@@ -0,0 +1,217 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from _core.errors import PoolTimeoutError
+from _core.pool import ConnectionPool
+from src.orm import DbUrl, Engine, create_session
+
+
+class FakeConnection:
+
+    def __init__(self, number: int):
+        self.number = number
+        self.closed = False
+        self.broken = False
+
+    def rollback(self):
+        if self.broken:
+            raise RuntimeError('broken')
+
+    def close(self):
+        self.closed = True
+
+
+def create_pool(**kwargs) -> ConnectionPool:
+    numbers = iter(range(100))
+    return ConnectionPool(lambda: FakeConnection(next(numbers)), **kwargs)
+
+
+def test_checkout_checkin():
+    pool = create_pool(min_size=1, max_size=2, max_overflow=0)
+    assert pool.stats().idle == 1
+    first = pool.checkout()
+    second = pool.checkout()
+    assert first is not second
+    stats = pool.stats()
+    assert (stats.size, stats.in_use, stats.idle) == (2, 2, 0)
+
+    pool.checkin(first)
+    assert pool.checkout() is first
+    assert pool.stats().checkouts == 3
+
+
+def test_overflow_closed_on_checkin():
+    pool = create_pool(min_size=0, max_size=1, max_overflow=1)
+    first = pool.checkout()
+    second = pool.checkout()
+    assert pool.stats().overflow == 1
+    pool.checkin(second)
+    assert second.closed
+    pool.checkin(first)
+    assert not first.closed
+    assert pool.stats().size == 1
+
+
+def test_timeout():
+    pool = create_pool(min_size=0, max_size=1, max_overflow=0, timeout=0.05)
+    pool.checkout()
+    with pytest.raises(PoolTimeoutError):
+        pool.checkout()
+    assert pool.stats().timeouts == 1
+
+
+def test_waiter_gets_checked_in_connection():
+    pool = create_pool(min_size=0, max_size=1, max_overflow=0, timeout=5)
+    connection = pool.checkout()
+    result = []
+    waiter = threading.Thread(target=lambda: result.append(pool.checkout()))
+    waiter.start()
+    while pool.stats().waiting == 0:
+        time.sleep(0.001)
+    pool.checkin(connection)
+    waiter.join()
+    assert result == [connection]
+    assert pool.stats().max_wait_time > 0
+
+
+def test_bounded_waiters():
+    pool = create_pool(min_size=0, max_size=1, max_overflow=0, timeout=5,
+                       max_waiters=0)
+    pool.checkout()
+    started = time.monotonic()
+    with pytest.raises(PoolTimeoutError):
+        pool.checkout()
+    assert time.monotonic() - started < 1
+
+
+def test_recycle_and_pre_ping():
+    pool = create_pool(min_size=1, max_size=1, recycle=0)
+    old = pool.checkout()
+    pool.checkin(old)
+    time.sleep(0.001)
+    new = pool.checkout()
+    assert old.closed and new is not old
+    pool.checkin(new)
+
+    def ping(connection):
+        if connection.number == 0:
+            raise RuntimeError('lost')
+
+    pool = create_pool(min_size=1, max_size=1, pre_ping=True, ping=ping)
+    assert pool.checkout().number == 1
+    assert pool.stats().recycled == 1
+
+
+def test_broken_connection_discarded():
+    pool = create_pool(min_size=0, max_size=1, max_overflow=0)
+    connection = pool.checkout()
+    connection.broken = True
+    pool.checkin(connection)
+    assert connection.closed
+    assert pool.stats().size == 0
+    assert pool.checkout() is not connection
+
+
+def test_wrong_sizes():
+    with pytest.raises(ValueError):
+        create_pool(min_size=2, max_size=1)
+
+
+def test_engine_sessions_use_pool(tmp_path):
+    url = DbUrl(driver='sqlite3', database=str(tmp_path / 'pool.sqlite3'))
+    engine = Engine(db_url=url, pool_size=2, pool_max_overflow=0)
+    first = create_session(engine)
+    second = create_session(engine)
+    first.connect()
+    second.connect()
+    assert first._connection is not second._connection
+    assert engine.pool.stats().in_use == 2
+
+    first.disconnect()
+    second.disconnect()
+    assert engine.pool.stats().in_use == 0
+    engine.disconnect()
+    assert engine.pool.stats().size == 0
+
+
+def test_memory_database_shared_by_pool():
+    url = DbUrl(driver='sqlite3', database=':memory:')
+    engine = Engine(db_url=url, pool_size=2, pool_recycle=0)
+    first = create_session(engine)
+    second = create_session(engine)
+    first.connect()
+    second.connect()
+    first.execute('CREATE TABLE memory_items (id INTEGER)')
+    first.execute('INSERT INTO memory_items VALUES (1)')
+    first.commit()
+    assert second.fetch_all('SELECT id FROM memory_items') == [(1,)]
+
+    first.disconnect()
+    second.disconnect()
+    other = Engine(db_url=DbUrl(driver='sqlite3', database=':memory:'))
+    with create_session(other) as session:
+        assert session.fetch_all(
+            "SELECT name FROM sqlite_master WHERE name = 'memory_items'") == []
+    other.disconnect()
+
+    # The database is closed by disconnect.
+    engine.disconnect()
+    with create_session(engine) as session:
+        assert session.fetch_all(
+            "SELECT name FROM sqlite_master WHERE name = 'memory_items'") == []
+    engine.disconnect()
+
+
+def test_memory_database_concurrent_sessions():
+    engine = Engine(db_url=DbUrl(driver='sqlite3', database=':memory:'))
+    with create_session(engine) as session:
+        session.execute('CREATE TABLE memory_items (id INTEGER)')
+        session.commit()
+    writing = threading.Event()
+    checked = threading.Event()
+    results = {}
+
+    def write():
+        with create_session(engine) as session:
+            session.execute('INSERT INTO memory_items VALUES (1)')
+            writing.set()
+            checked.wait(5)
+            session.commit()
+
+    def read():
+        writing.wait(5)
+        with create_session(engine) as session:
+            results['rows'] = session.fetch_all('SELECT id FROM memory_items')
+            try:
+                session.execute('INSERT INTO memory_items VALUES (2)')
+            except sqlite3.OperationalError as error:
+                results['error'] = error
+        checked.set()
+
+    threads = [threading.Thread(target=write), threading.Thread(target=read)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Readers are not locked by the writer, other writers are.
+    assert results['rows'] == [(1,)]
+    assert 'locked' in str(results['error'])
+    with create_session(engine) as session:
+        assert session.fetch_all('SELECT id FROM memory_items') == [(1,)]
+    engine.disconnect()
+
+
+def test_engine_connection_deprecated(tmp_path):
+    url = DbUrl(driver='sqlite3', database=str(tmp_path / 'pool.sqlite3'))
+    engine = Engine(db_url=url)
+    with pytest.deprecated_call():
+        connection = engine.connection
+    with pytest.deprecated_call():
+        assert engine.connection is connection
+    assert engine.pool.stats().in_use == 1
+    engine.disconnect()
+    assert engine.pool.stats().in_use == 0
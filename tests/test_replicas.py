@@ -0,0 +1,125 @@
+import shutil
+import sqlite3
+
+import pytest
+
+from _core.replicas import Replica, ReplicaSet
+from _core.pool import ConnectionPool
+from src.orm import DbUrl, Engine, create_session
+from tests.conftest import Project, User
+
+
+def on_create(create_tables):
+    create_tables([User, Project])
+
+
+@pytest.fixture
+def urls(tmp_path):
+    """The primary with one user and two replica copies of it."""
+    primary = DbUrl(driver='sqlite3', database=str(tmp_path / 'primary.sqlite3'))
+    engine = Engine(primary, on_create=on_create)
+    with create_session(engine) as session:
+        session.insert_item(User(email='replicated@test.com')).commit()
+    engine.disconnect()
+
+    replicas = []
+    for number in range(2):
+        path = tmp_path / f'replica{number}.sqlite3'
+        shutil.copy(primary.database, path)
+        replicas.append(DbUrl(driver='sqlite3', database=str(path)))
+    return primary, replicas
+
+
+def test_queries_read_from_replicas(urls):
+    primary, replicas = urls
+    engine = Engine(primary, on_create=on_create, replicas=replicas)
+    with create_session(engine) as session:
+        session.insert_item(User(email='new@test.com')).commit()
+
+        emails = session.query(User).scalars(User.email)
+        assert emails == ['replicated@test.com']
+        with session.use_primary():
+            emails = session.query(User).scalars(User.email)
+        assert sorted(emails) == ['new@test.com', 'replicated@test.com']
+        with session.transaction():
+            assert len(session.query(User).all()) == 2
+        assert len(list(session.query(User))) == 1
+
+    assert sum(stats.reads for stats in engine.replicas.stats()) == 2
+    engine.disconnect()
+
+
+def test_uncommitted_writes_read_from_primary(urls):
+    primary, replicas = urls
+    engine = Engine(primary, on_create=on_create, replicas=replicas)
+    with create_session(engine) as session:
+        session.execute("INSERT INTO user (email) VALUES ('new@test.com')")
+        emails = session.query(User).scalars(User.email)
+        assert sorted(emails) == ['new@test.com', 'replicated@test.com']
+
+        session.commit()
+        assert session.query(User).scalars(User.email) == ['replicated@test.com']
+    engine.disconnect()
+
+
+def test_round_robin_by_session(urls):
+    primary, replicas = urls
+    engine = Engine(primary, on_create=on_create, replicas=replicas)
+    for _ in range(4):
+        with create_session(engine) as session:
+            session.query(User).first()
+    assert [stats.reads for stats in engine.replicas.stats()] == [2, 2]
+    engine.disconnect()
+
+
+def test_failed_replica_falls_back_to_primary(urls, tmp_path):
+    primary, _ = urls
+    empty = DbUrl(driver='sqlite3', database=str(tmp_path / 'empty.sqlite3'))
+    engine = Engine(primary, on_create=on_create, replicas=[empty])
+    with create_session(engine) as session:
+        assert session.query(User).first().email == 'replicated@test.com'
+        assert [user.email for user in session.query(User)] == ['replicated@test.com']
+
+    stats = engine.replicas.stats()[0]
+    assert not stats.healthy
+    assert (stats.reads, stats.failures) == (0, 1)
+    assert 'no such table' in stats.last_error
+    engine.disconnect()
+
+
+def test_wrong_query_does_not_fail_replica(urls):
+    primary, replicas = urls
+    engine = Engine(primary, on_create=on_create, replicas=replicas[:1])
+    with create_session(engine) as session:
+        with pytest.raises(Exception):
+            session.read_all('SELECT missing FROM "user"')
+    assert engine.replicas.stats()[0].healthy
+    engine.disconnect()
+
+
+def test_cache_checks_replica_version(urls):
+    primary, replicas = urls
+    engine = Engine(primary, on_create=on_create, replicas=replicas[:1])
+    with create_session(engine) as session:
+        query = lambda: session.query(User).cache().scalars(User.email)
+        assert query() == ['replicated@test.com']
+
+        connection = sqlite3.connect(replicas[0].database)
+        connection.execute("INSERT INTO user (email) VALUES ('copied@test.com')")
+        connection.commit()
+        connection.close()
+
+        assert sorted(query()) == ['copied@test.com', 'replicated@test.com']
+    engine.disconnect()
+
+
+def test_least_busy():
+    busy = ConnectionPool(object, min_size=0)
+    idle = ConnectionPool(object, min_size=0)
+    busy.checkout()
+    url = DbUrl(driver='sqlite3', database='')
+    replicas = ReplicaSet([Replica(url, busy), Replica(url, idle)], 'least_busy')
+    assert replicas.choose().pool is idle
+
+    with pytest.raises(ValueError):
+        ReplicaSet([], 'random')